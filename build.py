@@ -1,7 +1,5 @@
-import subprocess, os, sys, shutil, json, re
+import subprocess, os, sys, shutil, json, re, time
 from pathlib import Path
-from cryptography.hazmat.primitives.asymmetric import rsa
-from cryptography.hazmat.primitives import serialization
 
 # =============================================
 # 🧩 EverMod CLI — Build Automation Script
@@ -12,11 +10,12 @@ from cryptography.hazmat.primitives import serialization
 # - Cleans old builds
 # - Builds PyInstaller (onefile)
 # - Builds Inno Setup installer
+# - Runs performance benchmarks (--bench <name>)
 # =============================================
 
 # Paths
 ROOT = Path(__file__).resolve().parent
-APPDATA = os.environ["LOCALAPPDATA"]
+APPDATA = os.environ.get("LOCALAPPDATA", "")
 DIST = ROOT / "dist"
 SPEC = ROOT / "evermod.spec"
 SETUP_ISS = ROOT / "setup.iss"
@@ -27,36 +26,38 @@ INNO_SETUP_EXE = Path(APPDATA) / "Programs/Inno Setup 6/ISCC.exe"
 # -----------------------------------------
 # 🔐 Optional key generation before build
 # -----------------------------------------
-def generate_keys():
-    """Run generate_keys.py before building."""
-    print("\n🔐 Generating EverMod RSA keys...\n")
+def generate_keys(algorithm: str = "ed25519"):
+    """Generate the signing key pair (Ed25519 by default, 'rsa-sha256' for legacy RSA)."""
+    sys.path.insert(0, str(ROOT / "src"))
+    from evermod.auth.signing import BACKENDS
+
+    backend = BACKENDS[algorithm]
+    print(f"\n🔐 Generating EverMod {backend.name} keys...\n")
 
     private_path = Path.home() / ".evermod" / "keys" / "private.pem"
-    public_path = Path("src/evermod/auth/keys/evermod_public.pem")
+    public_path = ROOT / "src" / "evermod" / "auth" / "keys" / backend.public_key_file
     public_path.parent.mkdir(parents=True, exist_ok=True)
     private_path.parent.mkdir(parents=True, exist_ok=True)
 
-    private_key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    private_key = backend.generate()
     with open(private_path, "wb") as f:
-        f.write(
-            private_key.private_bytes(
-                encoding=serialization.Encoding.PEM,
-                format=serialization.PrivateFormat.TraditionalOpenSSL,
-                encryption_algorithm=serialization.NoEncryption()
-            )
-        )
-
-    public_key = private_key.public_key()
+        f.write(backend.private_bytes(private_key))
+
     with open(public_path, "wb") as f:
-        f.write(
-            public_key.public_bytes(
-                encoding=serialization.Encoding.PEM,
-                format=serialization.PublicFormat.SubjectPublicKeyInfo
-            )
-        )
+        f.write(backend.public_bytes(private_key.public_key()))
 
     print(f"✅ Claves generadas correctamente:\n - {private_path}\n - {public_path}")
 
+def signing_algorithm() -> str:
+    """Algorithm releases are signed with: the local private key's, or the default one."""
+    sys.path.insert(0, str(ROOT / "src"))
+    from evermod.auth.signing import DEFAULT_ALGORITHM, backend_for_key
+    from evermod.auth.security import PRIVATE_KEY_PATH, load_private_key
+
+    if not PRIVATE_KEY_PATH.exists():
+        return DEFAULT_ALGORITHM
+    return backend_for_key(load_private_key()).name
+
 # -----------------------------------------
 # 🧠 Utilities
 # -----------------------------------------
@@ -160,6 +161,16 @@ def build_pyinstaller():
         print("❌ evermod.spec not found. Please create it first.")
         sys.exit(1)
 
+    sys.path.insert(0, str(ROOT / "src"))
+    from evermod.auth.signing import BACKENDS
+
+    # Only the key releases are signed with is required; other backends stay optional
+    algorithm = signing_algorithm()
+    public_path = ROOT / "src" / "evermod" / "auth" / "keys" / BACKENDS[algorithm].public_key_file
+    if not public_path.exists():
+        print(f"❌ Missing {algorithm} public key: {public_path}. Run 'python build.py --keys' first.")
+        sys.exit(1)
+
     cmd = ["pyinstaller", str(SPEC), "--noconfirm", "--clean"]
     run_command(cmd)
 
@@ -204,11 +215,199 @@ def build_inno_setup():
     else:
         print("⚠️ Output folder not found. Check setup.iss configuration.")
 
+# -----------------------------------------
+# ⏱️ Benchmarks
+# -----------------------------------------
+def _timeit(fn, repeat: int) -> float:
+    """Average seconds per call of fn()."""
+    start = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    return (time.perf_counter() - start) / repeat
+
+def bench_templates(mods: int = 50):
+    """Per-mod render cost: fresh Template() per call vs shared Environment + bytecode cache."""
+    sys.path.insert(0, str(ROOT / "src"))
+    from jinja2 import Template
+    from evermod.utils.paths import get_templates_dir, get_versions_file
+    from evermod.commands.create_helper import template_utils
+
+    templates_dir = get_templates_dir()
+    names = ["template.build.gradle.j2", "template.gradle.properties.j2",
+             "template.MainMod.java.j2", "template.pack.mcmeta.j2"]
+    if not all((templates_dir / n).exists() for n in names):
+        print("❌ Templates not installed. Run 'evermod update' first.")
+        sys.exit(1)
+
+    versions = json.loads(get_versions_file().read_text(encoding="utf-8"))
+    mc_version, version_info = next(iter(versions.items()))
+    context = dict(version_info, minecraft_version=mc_version, mod_id="benchmod", mod_group="bench",
+                   mod_name="BenchMod", mod_authors="Bench", package_name="net.bench.benchmod")
+
+    def legacy():
+        for n in names:
+            Template((templates_dir / n).read_text(encoding="utf-8")).render(context)
+
+    def single():
+        # A fresh process: empty in-memory cache, compiled code loaded from disk
+        template_utils.get_environment.cache_clear()
+        env = template_utils.get_environment()
+        for n in names:
+            env.get_template(n).render(context)
+
+    def bulk():
+        env = template_utils.get_environment()
+        for n in names:
+            env.get_template(n).render(context)
+
+    template_utils.clear_template_cache()
+    single()  # populate the bytecode cache
+
+    print(f"\n⏱️  Template rendering, 4 templates per mod ({mods} mods)\n")
+    results = [
+        ("Template() per call", _timeit(legacy, mods)),
+        ("Environment, single create", _timeit(single, mods)),
+        ("Environment, bulk create", _timeit(bulk, mods)),
+    ]
+    for label, seconds in results:
+        print(f"  {label:<28} {seconds * 1000:8.3f} ms/mod")
+
+def bench_signing(runs: int = 200):
+    """Key load, sign and verify cost of every signature backend over a versions.json-sized payload."""
+    sys.path.insert(0, str(ROOT / "src"))
+    from cryptography.hazmat.primitives import serialization
+    from evermod.auth.signing import BACKENDS, encode_signature
+
+    data = os.urandom(2048)
+    print(f"\n⏱️  Signing backends ({runs} runs, {len(data)} byte payload)\n")
+    print(f"  {'Backend':<12} {'key load':>10} {'sign':>10} {'verify':>10} {'.sig size':>10}")
+    for name, backend in BACKENDS.items():
+        private_key = backend.generate()
+        private_pem = backend.private_bytes(private_key)
+        public_key = private_key.public_key()
+        signature = backend.sign(private_key, data)
+        assert backend.verify(public_key, signature, data)
+
+        load = _timeit(lambda: serialization.load_pem_private_key(private_pem, password=None), runs)
+        sign = _timeit(lambda: backend.sign(private_key, data), runs)
+        verify = _timeit(lambda: backend.verify(public_key, signature, data), runs)
+        sig_size = len(encode_signature(name, signature))
+        print(f"  {name:<12} {load * 1000:8.3f} ms {sign * 1000:7.3f} ms {verify * 1000:7.3f} ms {sig_size:>8} B")
+
+STARTUP_BUDGET_MS = 50
+HEAVY_IMPORTS = ("jinja2", "cryptography", "pathspec", "packaging", "urllib.request")
+
+def _parse_importtime(stderr: str) -> list[tuple[int, int, str]]:
+    """(self µs, cumulative µs, module) for every line printed by -X importtime."""
+    entries = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        self_us, cumulative_us, name = [p.strip() for p in line[len("import time:"):].split("|")]
+        if self_us.isdigit():
+            entries.append((int(self_us), int(cumulative_us), name))
+    return entries
+
+def bench_startup(runs: int = 5):
+    """Import cost of evermod.main measured with -X importtime, checked against a budget."""
+    env = dict(os.environ, PYTHONPATH=str(ROOT / "src"))
+    best, best_entries = None, []
+    for _ in range(runs):
+        result = subprocess.run([sys.executable, "-X", "importtime", "-c", "import evermod.main"],
+                                env=env, capture_output=True, text=True)
+        entries = _parse_importtime(result.stderr)
+        total = next((cumulative for _, cumulative, name in entries if name == "evermod.main"), None)
+        if total is not None and (best is None or total < best):
+            best, best_entries = total, entries
+
+    if best is None:
+        print("❌ Could not measure import time of evermod.main.")
+        sys.exit(1)
+
+    print(f"\n⏱️  CLI startup (import evermod.main, best of {runs})\n")
+    for self_us, _, name in sorted(best_entries, reverse=True)[:10]:
+        print(f"  {self_us / 1000:7.2f} ms  {name.strip()}")
+    print(f"\n  Total: {best / 1000:.2f} ms (budget {STARTUP_BUDGET_MS} ms)")
+
+    imported = {name.strip() for _, _, name in best_entries}
+    loaded = [m for m in HEAVY_IMPORTS if m in imported]
+    if loaded:
+        print(f"❌ Heavy modules imported at startup: {', '.join(loaded)}")
+        sys.exit(1)
+    if best / 1000 > STARTUP_BUDGET_MS:
+        print("❌ Startup budget exceeded.")
+        sys.exit(1)
+    print("✅ Startup within budget.")
+
+SECRET_SCAN_BUDGET = 35  # % the secret scan may add to evermix pack time
+
+def bench_secrets(runs: int = 7, copies: int = 10):
+    """evermix pack throughput with and without the secret scanner, checked against a budget."""
+    import io
+    sys.path.insert(0, str(ROOT / "src"))
+    from evermod.commands import evermix
+    from evermod.utils.secret_scan import SecretScanner
+
+    # The CLI's own sources and docs, held in memory so the runs measure CPU, not disk
+    sources = [(r.path, r.text()) for folder in ("src", "docs")
+               for r in evermix.iter_pack(ROOT / folder) if r.kind == evermix.TEXT]
+    corpus = [(Path(f"copy{i}") / path, text) for i in range(copies) for path, text in sources]
+    size = sum(len(text.encode("utf-8")) for _, text in corpus)
+
+    def pack(scanner=None) -> float:
+        records = [evermix.PackRecord(path, evermix.TEXT, len(text), text=text) for path, text in corpus]
+        start = time.perf_counter()
+        evermix.write_pack(records, io.StringIO(), "bench", scanner)
+        return time.perf_counter() - start
+
+    def scan_only() -> float:
+        scanner = SecretScanner("redact")
+        start = time.perf_counter()
+        for path, text in corpus:
+            scanner.scan(path, text)
+        return time.perf_counter() - start
+
+    # Interleaved, best of `runs`: the scan is small next to packing, so noise matters
+    plain, scanned, scan = [], [], []
+    for _ in range(runs):
+        plain.append(pack())
+        scanned.append(pack(SecretScanner("redact")))
+        scan.append(scan_only())
+    plain, scanned, scan = min(plain), min(scanned), min(scan)
+    overhead = scan / plain * 100
+
+    print(f"\n⏱️  evermix secret scan ({len(corpus)} files, {size / 1e6:.1f} MB, best of {runs})\n")
+    print(f"  {'pack':<16} {plain * 1000:8.1f} ms  {size / 1e6 / plain:6.1f} MB/s")
+    print(f"  {'pack + scan':<16} {scanned * 1000:8.1f} ms  {size / 1e6 / scanned:6.1f} MB/s")
+    print(f"  {'scan alone':<16} {scan * 1000:8.1f} ms  {size / 1e6 / scan:6.1f} MB/s")
+    print(f"\n  Overhead: {overhead:.1f}% of pack time (budget {SECRET_SCAN_BUDGET}%)")
+    if overhead > SECRET_SCAN_BUDGET:
+        print("❌ Secret scan overhead exceeded.")
+        sys.exit(1)
+    print("✅ Secret scan within budget.")
+
+BENCHMARKS = {
+    "templates": bench_templates,
+    "startup": bench_startup,
+    "signing": bench_signing,
+    "secrets": bench_secrets,
+}
+
+def run_benchmarks(names: list[str]):
+    for name in names or list(BENCHMARKS):
+        if name not in BENCHMARKS:
+            print(f"❌ Unknown benchmark: {name} (available: {', '.join(BENCHMARKS)})")
+            sys.exit(1)
+        BENCHMARKS[name]()
+
 def main():
     print("🧩 EverMod CLI — Build Automation\n")
     args = [a.lower() for a in sys.argv[1:]]
+    if "--bench" in args:
+        run_benchmarks(args[args.index("--bench") + 1:])
+        return
     if "--keys" in args or "keys" in args or "-k" in args:
-        generate_keys()
+        generate_keys("rsa-sha256" if "--rsa" in args else "ed25519")
     clean_previous_builds()
     build_pyinstaller()
     build_inno_setup()
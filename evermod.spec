@@ -5,8 +5,24 @@ a = Analysis(
     ['src\\evermod\\main.py'],
     pathex=[],
     binaries=[],
-    datas=[('manifest.json', '.')],
-    hiddenimports=[],
+    datas=[
+        ('manifest.json', '.'),
+        # Embedded public keys, read by evermod.auth.security at runtime
+        ('src/evermod/auth/keys/*.pem', 'evermod/auth/keys'),
+    ],
+    hiddenimports=[
+        # Imported lazily by main.load_command()
+        'evermod.commands.create',
+        'evermod.commands.evermix',
+        'evermod.commands.add',
+        'evermod.commands.update',
+        'evermod.commands.cache',
+        'evermod.commands.status',
+        'evermod.commands.verify',
+        'evermod.commands.release',
+        'evermod.commands.version',
+        'evermod.utils.gradle_tools',
+    ],
     hookspath=[],
     hooksconfig={},
     runtime_hooks=[],
@@ -1,11 +1,11 @@
-from cryptography.hazmat.primitives import hashes, serialization
-from cryptography.hazmat.primitives.asymmetric import padding
+from cryptography.hazmat.primitives import serialization
 from pathlib import Path
-from base64 import b64encode, b64decode
+from functools import lru_cache
 import sys
+from evermod.auth.signing import BACKENDS, LEGACY_ALGORITHM, backend_for_key, encode_signature, decode_signature
 
-# Ruta fija a la clave pública (embebida en el CLI)
-PUBLIC_KEY_PATH = Path(__file__).parent / "keys" / "evermod_public.pem"
+# Carpeta de claves públicas embebidas en el CLI (una por algoritmo)
+KEYS_DIR = Path(__file__).parent / "keys"
 
 # Ruta donde solo tú tendrás la privada (no se distribuye)
 PRIVATE_KEY_PATH = Path.home() / ".evermod" / "keys" / "private.pem"
@@ -13,39 +13,48 @@ PRIVATE_KEY_PATH = Path.home() / ".evermod" / "keys" / "private.pem"
 
 # === UTILIDADES DE CLAVE ===
 
-def load_public_key():
-    with open(PUBLIC_KEY_PATH, "rb") as f:
+def public_key_path(algorithm: str = LEGACY_ALGORITHM) -> Path:
+    return KEYS_DIR / BACKENDS[algorithm].public_key_file
+
+@lru_cache(maxsize=None)
+def load_public_key(algorithm: str = LEGACY_ALGORITHM):
+    """Clave pública embebida del algoritmo; se lee y parsea una sola vez por proceso."""
+    with open(public_key_path(algorithm), "rb") as f:
         return serialization.load_pem_public_key(f.read())
 
+@lru_cache(maxsize=1)
 def load_private_key():
+    """Clave privada local (RSA o Ed25519); se carga una sola vez por proceso."""
     with open(PRIVATE_KEY_PATH, "rb") as f:
         return serialization.load_pem_private_key(f.read(), password=None)
 
 
 # === FIRMA / VERIFICACIÓN ===
 
-def sign_message(message: str) -> bytes:
-    """Usa la clave privada local para firmar un mensaje."""
+def sign_data(data: bytes) -> tuple[str, bytes]:
+    """Firma `data` con la clave privada local. Devuelve (algoritmo, firma)."""
     private_key = load_private_key()
-    return private_key.sign(
-        message.encode(),
-        padding.PKCS1v15(),
-        hashes.SHA256()
-    )
+    backend = backend_for_key(private_key)
+    return backend.name, backend.sign(private_key, data)
 
-def verify_signature(message: str, signature: bytes) -> bool:
-    """Verifica una firma con la clave pública embebida en el CLI."""
-    public_key = load_public_key()
+def verify_data(algorithm: str, signature: bytes, data: bytes) -> bool:
+    """Verifica una firma cruda con la clave pública embebida de `algorithm`."""
+    backend = BACKENDS.get(algorithm)
+    if backend is None:
+        return False
     try:
-        public_key.verify(
-            signature,
-            message.encode(),
-            padding.PKCS1v15(),
-            hashes.SHA256()
-        )
-        return True
-    except Exception:
+        public_key = load_public_key(algorithm)
+    except FileNotFoundError:
         return False
+    return backend.verify(public_key, signature, data)
+
+def sign_message(message: str) -> tuple[str, bytes]:
+    """Usa la clave privada local para firmar un mensaje."""
+    return sign_data(message.encode())
+
+def verify_signature(message: str, signature: bytes, algorithm: str = LEGACY_ALGORITHM) -> bool:
+    """Verifica una firma con la clave pública embebida en el CLI."""
+    return verify_data(algorithm, signature, message.encode())
 
 
 # === VALIDACIÓN DE COMANDOS INTERNOS ===
@@ -57,8 +66,8 @@ def require_internal_auth(command_name: str):
     message = f"evermod:{command_name}"
 
     try:
-        signature = sign_message(message)
-        if verify_signature(message, signature):
+        algorithm, signature = sign_message(message)
+        if verify_signature(message, signature, algorithm):
             print("🔏 EverMod internal signature verified.")
             return True
         else:
@@ -76,52 +85,40 @@ def require_internal_auth(command_name: str):
 def sign_file(file_path: Path) -> Path:
     """
     Signs the given file using the EverMod private key and returns the .sig path.
-    The signature uses RSA + SHA256 and is base64 encoded.
+    The .sig holds '<algorithm>:<base64 signature>' (Ed25519 or RSA + SHA256).
     """
-    private_key_path = Path.home() / ".evermod" / "keys" / "private.pem"
-    if not private_key_path.exists():
+    if not PRIVATE_KEY_PATH.exists():
         print("❌ Private key not found. Cannot sign files.")
         return None
 
-    data = file_path.read_bytes()
-    private_key = serialization.load_pem_private_key(private_key_path.read_bytes(), password=None)
-
-    signature = private_key.sign(
-        data,
-        padding.PKCS1v15(),
-        hashes.SHA256()
-    )
+    algorithm, signature = sign_data(file_path.read_bytes())
 
     sig_path = file_path.with_suffix(file_path.suffix + ".sig")
-    sig_path.write_bytes(b64encode(signature))
+    sig_path.write_bytes(encode_signature(algorithm, signature))
 
-    print(f"🔏 File signed → {sig_path.name}")
+    print(f"🔏 File signed ({algorithm}) → {sig_path.name}")
     return sig_path
 
 
-def verify_file_signature(file_path: Path, sig_path: Path) -> bool:
+def verify_data_signature(data: bytes, sig_contents: bytes) -> bool:
     """
-    Verifies a signed file using the embedded public key.
-    Returns True if valid, False otherwise.
+    Verifies the contents of a .sig file (as written by sign_file, or a legacy
+    bare base64 RSA signature) over `data`. Silent; returns True if valid.
     """
-    public_key_path = Path(__file__).parent / "keys" / "evermod_public.pem"
-    if not public_key_path.exists():
-        print("❌ Public key not found.")
+    try:
+        algorithm, signature = decode_signature(sig_contents)
+    except ValueError:
         return False
+    return verify_data(algorithm, signature, data)
 
-    data = file_path.read_bytes()
-    signature = b64decode(sig_path.read_bytes())
-    public_key = serialization.load_pem_public_key(public_key_path.read_bytes())
 
-    try:
-        public_key.verify(
-            signature,
-            data,
-            padding.PKCS1v15(),
-            hashes.SHA256()
-        )
+def verify_file_signature(file_path: Path, sig_path: Path) -> bool:
+    """
+    Verifies a signed file using the embedded public key.
+    Returns True if valid, False otherwise.
+    """
+    if verify_data_signature(file_path.read_bytes(), sig_path.read_bytes()):
         print(f"✅ Signature verified for {file_path.name}")
         return True
-    except Exception:
-        print(f"⛔ Invalid signature for {file_path.name}")
-        return False
+    print(f"⛔ Invalid signature for {file_path.name}")
+    return False
@@ -0,0 +1,121 @@
+from abc import ABC, abstractmethod
+from base64 import b64encode, b64decode
+from cryptography.exceptions import InvalidSignature
+from cryptography.hazmat.primitives import hashes, serialization
+from cryptography.hazmat.primitives.asymmetric import ed25519, padding, rsa
+import binascii
+
+# ====================================================
+# 🔏 EverMod Signature Backends
+# Each backend knows how to generate, serialize, sign
+# and verify with one algorithm. Signature files carry
+# the algorithm as a prefix ("ed25519:<base64>");
+# bare base64 is a legacy RSA signature.
+# ====================================================
+
+LEGACY_ALGORITHM = "rsa-sha256"
+
+class SignatureBackend(ABC):
+    """Base class: one signature algorithm."""
+
+    name = ""
+    key_type = None
+    public_key_file = ""  # under evermod/auth/keys/
+
+    @abstractmethod
+    def generate(self):
+        """New private key."""
+
+    @abstractmethod
+    def sign(self, private_key, data: bytes) -> bytes:
+        """Raw signature of `data`."""
+
+    @abstractmethod
+    def verify(self, public_key, signature: bytes, data: bytes) -> bool:
+        """True if `signature` matches `data`."""
+
+    def private_bytes(self, private_key) -> bytes:
+        return private_key.private_bytes(
+            encoding=serialization.Encoding.PEM,
+            format=serialization.PrivateFormat.PKCS8,
+            encryption_algorithm=serialization.NoEncryption()
+        )
+
+    def public_bytes(self, public_key) -> bytes:
+        return public_key.public_bytes(
+            encoding=serialization.Encoding.PEM,
+            format=serialization.PublicFormat.SubjectPublicKeyInfo
+        )
+
+class RSABackend(SignatureBackend):
+    """RSA-2048, PKCS#1 v1.5 + SHA-256 (original EverMod keys)."""
+
+    name = LEGACY_ALGORITHM
+    key_type = rsa.RSAPrivateKey
+    public_key_file = "evermod_public.pem"
+
+    def generate(self):
+        return rsa.generate_private_key(public_exponent=65537, key_size=2048)
+
+    def sign(self, private_key, data: bytes) -> bytes:
+        return private_key.sign(data, padding.PKCS1v15(), hashes.SHA256())
+
+    def verify(self, public_key, signature: bytes, data: bytes) -> bool:
+        try:
+            public_key.verify(signature, data, padding.PKCS1v15(), hashes.SHA256())
+            return True
+        except InvalidSignature:
+            return False
+
+    def private_bytes(self, private_key) -> bytes:
+        return private_key.private_bytes(
+            encoding=serialization.Encoding.PEM,
+            format=serialization.PrivateFormat.TraditionalOpenSSL,
+            encryption_algorithm=serialization.NoEncryption()
+        )
+
+class Ed25519Backend(SignatureBackend):
+    """Ed25519: 64-byte signatures, fast verification."""
+
+    name = "ed25519"
+    key_type = ed25519.Ed25519PrivateKey
+    public_key_file = "evermod_ed25519_public.pem"
+
+    def generate(self):
+        return ed25519.Ed25519PrivateKey.generate()
+
+    def sign(self, private_key, data: bytes) -> bytes:
+        return private_key.sign(data)
+
+    def verify(self, public_key, signature: bytes, data: bytes) -> bool:
+        try:
+            public_key.verify(signature, data)
+            return True
+        except InvalidSignature:
+            return False
+
+BACKENDS: dict[str, SignatureBackend] = {b.name: b for b in (Ed25519Backend(), RSABackend())}
+DEFAULT_ALGORITHM = "ed25519"
+
+def backend_for_key(private_key) -> SignatureBackend:
+    """Backend matching the type of a loaded private key."""
+    for backend in BACKENDS.values():
+        if isinstance(private_key, backend.key_type):
+            return backend
+    raise ValueError(f"unsupported key type: {type(private_key).__name__}")
+
+def encode_signature(algorithm: str, signature: bytes) -> bytes:
+    """Contents of a .sig file: '<algorithm>:<base64>'."""
+    return algorithm.encode("ascii") + b":" + b64encode(signature)
+
+def decode_signature(contents: bytes) -> tuple[str, bytes]:
+    """(algorithm, raw signature) from a .sig file; bare base64 means legacy RSA."""
+    contents = contents.strip()
+    algorithm = LEGACY_ALGORITHM
+    if b":" in contents:
+        prefix, contents = contents.split(b":", 1)
+        algorithm = prefix.decode("ascii", errors="replace")
+    try:
+        return algorithm, b64decode(contents, validate=True)
+    except binascii.Error:
+        raise ValueError("signature is not valid base64")
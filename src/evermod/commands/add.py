@@ -1,41 +1,159 @@
-import subprocess
+import os, shutil, stat, subprocess, time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from evermod.utils.gradle_tools import refresh_environment
+from evermod.utils.state import get_state
+from evermod.utils.workspace_settings import WorkspaceSettings, project_path_for
 
-def run(user: str, name: str, target_path: str = "."):
+GITHUB_URL = "https://github.com"
+DEFAULT_JOBS = 4
+
+def parse_repos(repos: list[str], list_file: str | None = None) -> tuple[list[tuple[str, str]], str | None]:
+    """
+    Turn CLI arguments into (user, name) pairs.
+    Accepts 'user/name' entries and a list file (one per line, '#' comments).
+    The legacy form '<user> <name> [target]' is still understood; its target is returned.
+    """
+    legacy_target = None
+    if repos and len(repos) in (2, 3) and not any("/" in r for r in repos[:2]):
+        pairs = [(repos[0], repos[1])]
+        legacy_target = repos[2] if len(repos) == 3 else None
+    else:
+        pairs = []
+        for entry in repos:
+            if "/" not in entry:
+                raise ValueError(f"expected 'user/name', got '{entry}'")
+            user, name = entry.strip("/").split("/", 1)
+            pairs.append((user, name))
+
+    if list_file:
+        for line in Path(list_file).read_text(encoding="utf-8").splitlines():
+            line = line.split("#", 1)[0].strip()
+            if not line:
+                continue
+            if "/" not in line:
+                raise ValueError(f"expected 'user/name' in {list_file}, got '{line}'")
+            user, name = line.strip("/").split("/", 1)
+            pairs.append((user, name))
+
+    # Drop duplicates, keep order
+    return list(dict.fromkeys(pairs)), legacy_target
+
+def clone_repo(repo_url: str, dest: Path, depth: int | None = None, filter_spec: str | None = None) -> tuple[bool, str, float]:
+    """Clone one repository (optionally shallow/partial). Returns (ok, error, seconds)."""
+    cmd = ["git", "clone", "--quiet"]
+    if depth:
+        cmd += ["--depth", str(depth)]
+    if filter_spec:
+        cmd += [f"--filter={filter_spec}"]
+    cmd += [repo_url, str(dest)]
+
+    start = time.perf_counter()
+    result = subprocess.run(cmd, text=True, capture_output=True)
+    return result.returncode == 0, (result.stderr or "").strip(), time.perf_counter() - start
+
+def _git_quiet(*args: str) -> bool:
+    return subprocess.run(["git", *args], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL).returncode == 0
+
+def _force_remove(func, path, _):
+    os.chmod(path, stat.S_IWRITE)  # git objects are read-only on Windows
+    func(path)
+
+def rollback_submodule(dest: Path, relative_dest: str, had_entry: bool):
+    """Undo a failed 'git submodule add': the clone, and the .gitmodules/index entries it may have written."""
+    shutil.rmtree(dest, onerror=_force_remove)
+    if not had_entry and _git_quiet("config", "-f", ".gitmodules", "--get", f"submodule.{relative_dest}.url"):
+        _git_quiet("config", "-f", ".gitmodules", "--remove-section", f"submodule.{relative_dest}")
+        _git_quiet("config", "--remove-section", f"submodule.{relative_dest}")
+        gitmodules = Path(".gitmodules")
+        if gitmodules.exists() and not gitmodules.read_text(encoding="utf-8").strip():
+            gitmodules.unlink()
+            _git_quiet("rm", "--cached", "--quiet", "--ignore-unmatch", ".gitmodules")
+        elif gitmodules.exists():
+            _git_quiet("add", ".gitmodules")
+        _git_quiet("rm", "--cached", "--quiet", "--ignore-unmatch", relative_dest)
+
+def run(repos: list[str], target_path: str = ".", list_file: str | None = None,
+        depth: int | None = None, filter_spec: str | None = None,
+        jobs: int = DEFAULT_JOBS, base_url: str = GITHUB_URL):
     cwd = Path(".").resolve()  # workspace root
-    target_base = Path(target_path).resolve()  # where to add the submodule
-    repo_url = f"https://github.com/{user}/{name}.git"
-    dest = target_base / name
 
-    print(f"📦 Adding submodule '{name}' from {repo_url}...")
+    try:
+        pairs, legacy_target = parse_repos(repos, list_file)
+    except (ValueError, OSError) as e:
+        print(f"❌ {e}")
+        return
+    if not pairs:
+        print("⚠️  No repositories given. Use 'user/name' or --list <file>.")
+        return
+
+    target_base = Path(legacy_target or target_path).resolve()  # where to add the submodules
+    base_url = base_url.rstrip("/")
 
-    if dest.exists():
-        print(f"⚠️  A folder named '{name}' already exists in {target_base}")
+    pending = []
+    for user, name in pairs:
+        dest = target_base / name
+        if dest.exists():
+            print(f"⚠️  A folder named '{name}' already exists in {target_base}")
+            continue
+        pending.append((name, f"{base_url}/{user}/{name}.git", dest))
+    if not pending:
         return
 
-    try:
-        relative_dest = str(dest.relative_to(cwd))
-        subprocess.run(["git", "submodule", "add", repo_url, relative_dest], check=True)
-        print(f"✅ Submodule '{name}' added successfully.")
-    except subprocess.CalledProcessError:
-        print(f"❌ Failed to add submodule '{name}'.")
+    # --- 1. Clone concurrently (clones do not touch the superproject index) ---
+    print(f"📦 Cloning {len(pending)} submodule(s) with {min(jobs, len(pending))} parallel job(s)...")
+    with ThreadPoolExecutor(max_workers=max(1, jobs)) as pool:
+        results = list(pool.map(lambda p: clone_repo(p[1], p[2], depth, filter_spec), pending))
+
+    cloned = []
+    for (name, repo_url, dest), (ok, error, seconds) in zip(pending, results):
+        if ok:
+            print(f" ✅ {name:<24} {seconds:.2f}s")
+            cloned.append((name, repo_url, dest))
+        else:
+            print(f" ❌ {name:<24} failed to clone {repo_url}")
+            if error:
+                print(f"    {error}")
+
+    # --- 2. Register as submodules (git index is single-writer, so sequential) ---
+    added = []
+    for name, repo_url, dest in cloned:
+        relative_dest = dest.relative_to(cwd).as_posix()
+        had_entry = _git_quiet("config", "-f", ".gitmodules", "--get", f"submodule.{relative_dest}.url")
+        try:
+            subprocess.run(["git", "submodule", "add", repo_url, relative_dest],
+                           check=True, stdout=subprocess.DEVNULL)
+            if depth:
+                subprocess.run(["git", "config", "-f", ".gitmodules", f"submodule.{relative_dest}.shallow", "true"], check=True)
+            added.append(dest)
+            print(f"✅ Submodule '{name}' added successfully.")
+        except subprocess.CalledProcessError:
+            # Leave nothing behind, so the next run does not stop at "folder already exists"
+            rollback_submodule(dest, relative_dest, had_entry)
+            print(f"❌ Failed to add submodule '{name}'; removed its clone.")
+
+    if not added:
         return
 
+    # Move the clones' .git folders under .git/modules like a regular submodule add
+    subprocess.run(["git", "submodule", "absorbgitdirs", "--", *[d.relative_to(cwd).as_posix() for d in added]],
+                   stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    if depth:
+        subprocess.run(["git", "add", ".gitmodules"], stdout=subprocess.DEVNULL)
+
     # Detect workspace in the directory where the command was executed
     settings_path = cwd / "settings.gradle"
     if settings_path.exists():
-        relative_path = dest.relative_to(cwd)
-        include_path = str(relative_path).replace("\\", ":").replace("/", ":")
-        include_line = f'include("{include_path}")'
-        
-        content = settings_path.read_text(encoding="utf-8")
-        if include_line not in content:
-            with open(settings_path, "a", encoding="utf-8") as f:
-                f.write(f"\n{include_line}\n")
-            print(f"🧩 Submodule '{name}' registered in workspace settings.gradle")
-        else:
-            print(f"ℹ️  Submodule '{name}' already registered in workspace.")
+        settings = WorkspaceSettings(settings_path)
+        registered = set(settings.add([project_path_for(dest, cwd) for dest in added]))
+        settings.save()
+        # Versions are unknown until the submodule is inspected ('evermod status')
+        get_state().add_workspace_modules(cwd, {project_path_for(dest, cwd): (None, None) for dest in added})
+        for dest in added:
+            if project_path_for(dest, cwd) in registered:
+                print(f"🧩 Submodule '{dest.name}' registered in workspace settings.gradle")
+            else:
+                print(f"ℹ️  Submodule '{dest.name}' already registered in workspace.")
 
     print(f"🏗️ Workspace mode: {'ON' if settings_path.exists() else 'OFF'}")
     refresh_environment()
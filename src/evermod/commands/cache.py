@@ -0,0 +1,94 @@
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from evermod.utils.module_cache import ModuleCache
+from evermod.utils.state import get_template_versions
+from evermod.utils.file_manifest import merkle_root
+from evermod.commands.create_helper.evermod_downloader import fetch_release_manifest, fetch_module_zip, fetch_file_manifest
+
+DEFAULT_JOBS = 4
+
+def _warm_one(mc_version: str, module_info: dict, cache: ModuleCache) -> dict:
+    start = time.perf_counter()
+    try:
+        path, downloaded = fetch_module_zip(module_info, cache, quiet=True, rehash=True)
+        status = "downloaded" if downloaded else "cached"
+        size = path.stat().st_size
+    except Exception as e:
+        status, size = f"failed: {e}", 0
+    return {"version": mc_version, "status": status, "size": size, "seconds": time.perf_counter() - start}
+
+def _warm_file_manifest(modules: dict) -> str | None:
+    """
+    Fetch and verify files.json and its .sig, which 'create' checks extracted files
+    against. Returns an error message, or None when cached (or not published).
+    """
+    roots = {v: info["files_root"] for v, info in modules.items() if info.get("files_root")}
+    if not roots:
+        return None
+    try:
+        entries = fetch_file_manifest(force=True).get("modules", {})
+    except Exception as e:
+        return f"failed: {e}"
+    stale = [v for v, root in roots.items()
+             if v not in entries or entries[v].get("root") != root or merkle_root(entries[v]["files"]) != root]
+    return f"failed: does not match the release for {', '.join(stale)}" if stale else None
+
+def warm(jobs: int = DEFAULT_JOBS):
+    """Prefetch and verify the EverMod module of every known Minecraft version."""
+    print("🔥 Warming EverMod module cache...")
+
+    try:
+        release_data = fetch_release_manifest(force=True)
+    except Exception as e:
+        print(f"❌ Unable to read release manifest: {e}")
+        return
+    modules = release_data.get("modules", {})
+    if not modules:
+        print("⚠️  No module data found in release manifest.")
+        return
+
+    # Minecraft versions the local templates can create, which should all be covered
+    template_versions = list(get_template_versions() or {})
+
+    cache = ModuleCache()
+    start = time.perf_counter()
+    results = []
+    with ThreadPoolExecutor(max_workers=max(1, jobs)) as pool:
+        futures = [pool.submit(_warm_one, v, info, cache) for v, info in modules.items()]
+        for future in as_completed(futures):
+            result = future.result()
+            results.append(result)
+            icon = "❌" if result["status"].startswith("failed") else "✅"
+            print(f" {icon} {result['version']:<10} {result['status']}")
+
+    manifest_error = _warm_file_manifest(modules)
+    print(f" {'❌' if manifest_error else '✅'} {'files.json':<10} {manifest_error or 'cached'}")
+
+    elapsed = time.perf_counter() - start
+    failed = [r for r in results if r["status"].startswith("failed")]
+    downloaded = [r for r in results if r["status"] == "downloaded"]
+
+    print("\n📊 Cache Summary:")
+    print("─────────────────")
+    print(f"   Release: {release_data.get('version', 'unknown')}")
+    print(f"   Modules: {len(results) - len(failed)}/{len(results)} verified")
+    print(f"Downloaded: {len(downloaded)} ({sum(r['size'] for r in downloaded) / 1024 / 1024:.1f} MB)")
+    print(f"Cache size: {cache.total_size() / 1024 / 1024:.1f} MB (limit {cache.max_bytes // 1024 // 1024} MB)")
+    print(f"      Time: {elapsed:.2f}s")
+
+    missing = [v for v in template_versions if v not in modules]
+    if missing:
+        print(f"⚠️  No EverMod module published for: {', '.join(missing)}")
+    if sum(r["size"] for r in results) > cache.max_bytes:
+        print("⚠️  Cache limit is smaller than the full module set; raise EVERMOD_CACHE_MAX_MB to keep them all.")
+    if failed:
+        print(f"❌ {len(failed)} module(s) could not be cached.")
+    elif manifest_error:
+        print("⚠️  Modules cached, but files.json is not: 'evermod create' will need the network to verify them.")
+    else:
+        print("✅ All modules cached. 'evermod create' will not need the network.")
+
+def run(action: str, jobs: int = DEFAULT_JOBS):
+    match action:
+        case "warm": warm(jobs)
+        case _: print(f"❌ Unknown cache action: {action}")
@@ -1,21 +1,198 @@
-import json, shutil
+import json, time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from evermod.utils.paths import get_versions_file
 from evermod.utils.gradle_tools import refresh_environment
+from evermod.utils.state import get_state, get_template_versions
+from evermod.utils.workspace_settings import WorkspaceSettings, project_path_for
+from evermod.utils.formatting import format_size
+from evermod.utils.materialize import Materializer, get_default_mode
+from evermod.utils.tracing import span, traced
 from evermod.commands.create_helper.io_utils import ask, sanitize_string, sanitize_package
 from evermod.commands.create_helper.template_utils import render_template
 from evermod.commands.create_helper.structure_builder import create_mod_structure
-from evermod.commands.create_helper.evermod_downloader import download_evermod_module
+from evermod.commands.create_helper.evermod_downloader import download_evermod_module, prefetch_module
+
+DEFAULT_AUTHOR = "WipoDev"
+SPEC_JOBS = 4
+
+def load_versions() -> dict | None:
+    versions = get_template_versions()
+    if versions is None:
+        print("❌ 'versions.json' not found in templates/")
+    return versions
+
+def normalize_spec(spec: dict, versions: dict) -> dict:
+    """Fill a mod definition (name, id, version, package, author, target) with wizard defaults."""
+    mod_name = spec.get("name") or "NewMod"
+    mod_id = sanitize_string(spec.get("id") or sanitize_string(mod_name))
+    author = spec.get("author") or DEFAULT_AUTHOR
+    return {
+        "name": mod_name,
+        "id": mod_id,
+        "version": spec.get("version") or list(versions.keys())[0],
+        "author": author,
+        "package": sanitize_package(spec.get("package") or f"net.{sanitize_string(author)}.{mod_id}"),
+        "target": spec.get("target") or ".",
+    }
+
+@traced("create mod", "create")
+def create_mod(spec: dict, versions: dict, is_workspace: bool, quiet: bool = False,
+               materializer: Materializer | None = None, prefetch=None) -> Path:
+    """
+    Generate one mod from a normalized spec. Does not touch settings.gradle nor
+    refresh Gradle, so several mods can be created concurrently.
+    Static files go through `materializer` (plain copies by default); `prefetch`
+    is a module download already started with prefetch_module().
+    """
+    materializer = materializer or Materializer()
+    mod_name, mc_version = spec["name"], spec["version"]
+    version_info = versions[mc_version]
+    package_parts = spec["package"].split(".")
+
+    mod_dir = Path(spec["target"]).resolve() / mod_name
+    mod_dir.mkdir(parents=True, exist_ok=False)
+
+    with span("mod structure", "create", mod=mod_name):
+        templates_dir, src_main_java, src_main_java_mod, src_main_resources = create_mod_structure(mod_dir, package_parts, materializer)
+
+    context = version_info.copy()
+    context.update({
+        "minecraft_version": mc_version,
+        "mod_id": spec["id"],
+        "mod_group": sanitize_string(spec["author"]),
+        "mod_name": mod_name,
+        "mod_authors": spec["author"],
+        "package_name": spec["package"],
+    })
+
+    with span("render templates", "create", mod=mod_name):
+        for tpl, output in [
+            (templates_dir / "template.build.gradle.j2", mod_dir / "build.gradle"),
+            (templates_dir / "template.gradle.properties.j2", mod_dir / "gradle.properties"),
+            (templates_dir / "template.MainMod.java.j2", src_main_java_mod / "MainMod.java"),
+            (templates_dir / "template.pack.mcmeta.j2", src_main_resources / "pack.mcmeta"),
+        ]:
+            render_template(tpl, context, output)
+
+    if not is_workspace:
+        gradle_dir = mod_dir / "gradle" / "wrapper"
+        gradle_dir.mkdir(parents=True, exist_ok=True)
+        with span("standalone files", "create", mod=mod_name):
+            for tpl_file, dst_file, editable in [
+                (".gitignore", mod_dir / ".gitignore", True),
+                (".gitattributes", mod_dir / ".gitattributes", True),
+                ("gradlew", mod_dir / "gradlew", True),
+                ("gradlew.bat", mod_dir / "gradlew.bat", True),
+                ("template.settings.gradle.j2", mod_dir / "settings.gradle", True),
+                ("gradle/wrapper/gradle-wrapper.jar", gradle_dir / "gradle-wrapper.jar", False),
+                ("gradle/wrapper/gradle-wrapper.properties", gradle_dir / "gradle-wrapper.properties", True),
+            ]:
+                materializer.file(templates_dir / tpl_file, dst_file, editable)
+
+        with span("embed EverMod module", "create", version=mc_version):
+            download_evermod_module(mc_version, src_main_java, quiet=quiet, materializer=materializer, prefetch=prefetch)
+
+    return mod_dir
+
+def register_includes(settings_path: Path, mod_dirs: list[Path], cwd: Path):
+    """Register every new mod in settings.gradle with a single rewrite."""
+    settings = WorkspaceSettings(settings_path)
+    added = set(settings.add([project_path_for(mod_dir, cwd) for mod_dir in mod_dirs]))
+    for mod_dir in mod_dirs:
+        if project_path_for(mod_dir, cwd) in added:
+            print(f"🧩 Mod '{mod_dir.name}' registered in workspace settings.gradle")
+        else:
+            print(f"ℹ️ Mod '{mod_dir.name}' is already registered in workspace.")
+    settings.save()
+
+def remember_mods(cwd: Path, mods: dict[Path, str], versions: dict):
+    """Record new workspace mods ({mod_dir: minecraft version}) in the state store."""
+    get_state().add_workspace_modules(cwd, {
+        project_path_for(mod_dir, cwd): (mc_version, versions[mc_version].get("forge_version"))
+        for mod_dir, mc_version in mods.items()
+    })
+
+def run_spec(spec_file: str, link: str = "copy"):
+    """Create every mod listed in a JSON spec file, then register and refresh once."""
+    print("🧩 EverMod — Bulk mod creation")
+    print("--------------------------------")
+
+    versions = load_versions()
+    if versions is None:
+        return
+
+    try:
+        data = json.loads(Path(spec_file).read_text(encoding="utf-8"))
+    except Exception as e:
+        print(f"❌ Could not read spec file '{spec_file}': {e}")
+        return
+    entries = data.get("mods", []) if isinstance(data, dict) else data
+    specs = [normalize_spec(entry, versions) for entry in entries]
+    if not specs:
+        print("⚠️  No mods defined in spec file.")
+        return
+
+    for spec in specs:
+        if spec["version"] not in versions:
+            print(f"❌ Unsupported version for '{spec['name']}': {spec['version']}")
+            return
+        if (Path(spec["target"]).resolve() / spec["name"]).exists():
+            print(f"⚠️ Folder '{spec['name']}' already exists in {Path(spec['target']).resolve()}")
+            return
+
+    cwd = Path(".").resolve()
+    settings_path = cwd / "settings.gradle"
+    is_workspace = settings_path.exists()
+
+    def timed_create(spec: dict):
+        start = time.perf_counter()
+        materializer = Materializer(link)
+        try:
+            mod_dir = create_mod(spec, versions, is_workspace, quiet=True, materializer=materializer)
+            return spec, mod_dir, None, time.perf_counter() - start, materializer
+        except Exception as e:
+            return spec, None, e, time.perf_counter() - start, materializer
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=SPEC_JOBS) as pool:
+        results = list(pool.map(timed_create, specs))
+
+    created = {}
+    saved = 0
+    for spec, mod_dir, error, seconds, materializer in results:
+        if error:
+            print(f" ❌ {spec['name']:<24} failed after {seconds:.2f}s: {error}")
+        else:
+            created[mod_dir] = spec["version"]
+            saved += materializer.stats["bytes_saved"]
+            linked = f"  🔗 {materializer.summary()}" if link != "copy" else ""
+            print(f" ✅ {spec['name']:<24} Minecraft {spec['version']:<8} {seconds:.2f}s{linked}")
+
+    if is_workspace and created:
+        register_includes(settings_path, list(created), cwd)
+        remember_mods(cwd, created, versions)
+
+    print(f"\n✅ {len(created)}/{len(specs)} mods created in {time.perf_counter() - start:.2f}s")
+    if link != "copy":
+        print(f"🔗 Materialization ({link}): {format_size(saved)} saved")
+    print(f"🏗️ Workspace mode: {'ON' if is_workspace else 'OFF'}")
+    print("--------------------------------")
+
+    if created:
+        refresh_environment()
+
+def run(spec_file: str | None = None, link: str | None = None):
+    link = link or get_default_mode()
+    if spec_file:
+        run_spec(spec_file, link)
+        return
 
-def run():
     print("🧩 EverMod — Mod creation wizard")
     print("--------------------------------")
 
-    versions_path = get_versions_file()
-    if not versions_path.exists():
-        print("❌ 'versions.json' not found in templates/")
+    versions = load_versions()
+    if versions is None:
         return
-    versions = json.loads(versions_path.read_text(encoding="utf-8"))
 
     mod_name = ask("Mod name", "NewMod")
     suggested_modid = sanitize_string(mod_name)
@@ -27,75 +204,48 @@ def run():
         print(f"❌ Unsupported version: {mc_version}")
         return
 
+    cwd = Path(".").resolve()
+    settings_path = cwd / "settings.gradle"
+    is_workspace = settings_path.exists()
+
+    # Standalone mods embed the EverMod module: download it while the remaining
+    # prompts are answered and the templates rendered
+    prefetch = None if is_workspace else prefetch_module(mc_version)
+
     version_info = versions[mc_version]
-    author = ask("Author name", "WipoDev")
+    author = ask("Author name", DEFAULT_AUTHOR)
     safe_author = sanitize_string(author)
     package_default = f"net.{safe_author}.{mod_id}"
     package_name = sanitize_package(ask("Package name", package_default))
-    package_parts = package_name.split(".")
 
     target_base = Path(ask("Target directory", ".")).resolve()
     mod_dir = target_base / mod_name
     if mod_dir.exists():
         print(f"⚠️ Folder '{mod_name}' already exists in {target_base}")
         return
-    mod_dir.mkdir(parents=True, exist_ok=True)
 
-    templates_dir, src_main_java, src_main_java_mod, src_main_resources = create_mod_structure(mod_dir, package_parts)
+    spec = {
+        "name": mod_name,
+        "id": mod_id,
+        "version": mc_version,
+        "author": author,
+        "package": package_name,
+        "target": str(target_base),
+    }
+    start = time.perf_counter()
+    materializer = Materializer(link)
+    create_mod(spec, versions, is_workspace, materializer=materializer, prefetch=prefetch)
+    seconds = time.perf_counter() - start
 
-    context = version_info.copy()
-    context.update({
-        "minecraft_version": mc_version,
-        "mod_id": mod_id,
-        "mod_group": safe_author,
-        "mod_name": mod_name,
-        "mod_authors": author,
-        "package_name": package_name,
-    })
-
-    for tpl, output in [
-        (templates_dir / "template.build.gradle.j2", mod_dir / "build.gradle"),
-        (templates_dir / "template.gradle.properties.j2", mod_dir / "gradle.properties"),
-        (templates_dir / "template.MainMod.java.j2", src_main_java_mod / "MainMod.java"),
-        (templates_dir / "template.pack.mcmeta.j2", src_main_resources / "pack.mcmeta"),
-    ]:
-        render_template(tpl, context, output)
-
-    cwd = Path(".").resolve()
-    settings_path = cwd / "settings.gradle"
-    is_workspace = settings_path.exists()
-
-    if not is_workspace:
-        gradle_dir = mod_dir / "gradle" / "wrapper"
-        gradle_dir.mkdir(parents=True, exist_ok=True)
-        for tpl_file, dst_file in [
-            (".gitignore", mod_dir / ".gitignore"),
-            (".gitattributes", mod_dir / ".gitattributes"),
-            ("gradlew", mod_dir / "gradlew"),
-            ("gradlew.bat", mod_dir / "gradlew.bat"),
-            ("template.settings.gradle.j2", mod_dir / "settings.gradle"),
-            ("gradle/wrapper/gradle-wrapper.jar", gradle_dir / "gradle-wrapper.jar"),
-            ("gradle/wrapper/gradle-wrapper.properties", gradle_dir / "gradle-wrapper.properties"),
-        ]:
-            shutil.copy2(templates_dir / tpl_file, dst_file)
-
-        download_evermod_module(mc_version, src_main_java)
-    else:
-        relative_path = mod_dir.relative_to(cwd)
-        include_path = str(relative_path).replace("\\", ":").replace("/", ":")
-        include_line = f'include("{include_path}")'
-
-        content = settings_path.read_text(encoding="utf-8")
-        if include_line not in content:
-            with open(settings_path, "a", encoding="utf-8") as f:
-                f.write(f"\n{include_line}\n")
-            print(f"🧩 Mod '{mod_name}' registered in workspace settings.gradle")
-        else:
-            print(f"ℹ️ Mod '{mod_name}' is already registered in workspace.")
+    if is_workspace:
+        register_includes(settings_path, [mod_dir], cwd)
+        remember_mods(cwd, {mod_dir: mc_version}, versions)
 
     print(f"\n✅ Mod '{mod_name}' created successfully!")
     print(f"📦 Minecraft {mc_version} (Forge {version_info['forge_version']})")
     print(f"📂 Location: {mod_dir}")
+    if link != "copy":
+        print(f"🔗 Materialization ({link}): {materializer.summary()} in {seconds:.2f}s")
     print(f"🏗️ Workspace mode: {'ON' if is_workspace else 'OFF'}")
     print("--------------------------------")
 
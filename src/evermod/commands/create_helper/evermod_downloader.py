@@ -1,54 +1,339 @@
-import json, urllib.request, hashlib, zipfile, io
+import json, os, shutil, tempfile, threading, time, urllib.request, urllib.error, http.client, hashlib
+from concurrent.futures import Future
 from pathlib import Path
+from evermod.utils.archive import extract_zip
+from evermod.utils.http_cache import fetch_cached, read_cached
+from evermod.utils.module_cache import ModuleCache
+from evermod.utils.materialize import Materializer
+from evermod.utils.file_manifest import merkle_root, verify_files
+from evermod.utils.tracing import span, add_bytes
 
-CACHE_DIR = Path.home() / ".evermod" / "cache"
-CACHE_DIR.mkdir(parents=True, exist_ok=True)
+EVERMOD_RELEASES_URL = "https://wipodev.com/EverMod/releases/"
+EVERMOD_LATEST_URL = f"{EVERMOD_RELEASES_URL}latest/"
+RELEASE_MANIFEST_CACHE = "release-versions.json"
+RELEASE_SIGNATURE_CACHE = "release-versions.json.sig"
 
-EVERMOD_LATEST_URL = "https://wipodev.com/EverMod/releases/latest/"
+CHUNK_SIZE = 64 * 1024
+DOWNLOAD_RETRIES = 3
+PROGRESS_INTERVAL = 0.2  # seconds between progress line updates
 
-def download_evermod_module(mc_version: str, extract_to: Path):
-    """Download and extract the latest EverMod module for a given MC version."""
-    try:
-        print("\n🌐 Fetching latest EverMod module information...")
-        with urllib.request.urlopen(f"{EVERMOD_LATEST_URL}versions.json") as response:
-            release_data = json.load(response)
+class ChecksumMismatch(Exception):
+    """Raised when a downloaded file does not match its expected SHA-256."""
 
-        release_tag = release_data.get("version", "unknown")
-        modules = release_data.get("modules", {})
+class SignatureError(Exception):
+    """Raised when the release manifest does not match its published signature."""
 
-        if not modules:
-            print("⚠️  No module data found in release manifest.")
-            return
+def _format_progress(done: int, total: int | None, received: int, elapsed: float) -> str:
+    speed = received / elapsed / 1024 / 1024 if elapsed > 0 else 0.0
+    if total:
+        return f"   {done * 100 // total:3d}%  {done / 1024 / 1024:.1f}/{total / 1024 / 1024:.1f} MB  {speed:.1f} MB/s"
+    return f"   {done / 1024 / 1024:.1f} MB  {speed:.1f} MB/s"
 
-        module_info = modules.get(mc_version)
-        if not module_info:
-            print(f"⚠️  No EverMod module available for Minecraft {mc_version}.")
-            return
+def _fetch_into_part(url: str, part: Path, digest, quiet: bool, timeout: float):
+    """
+    Stream `url` into `part`, resuming from its current size with a Range request.
+    `digest` must already cover the bytes present in `part`. Returns the digest
+    covering the whole `part` file (a new one if the server restarted from zero).
+    """
+    offset = part.stat().st_size if part.exists() else 0
+    request = urllib.request.Request(url)
+    if offset:
+        request.add_header("Range", f"bytes={offset}-")
 
-        zip_name = Path(module_info["path"]).name
-        sha256_expected = module_info["sha256"]
-        module_url = f"{EVERMOD_LATEST_URL}{zip_name}"
+    try:
+        response = urllib.request.urlopen(request, timeout=timeout)
+    except urllib.error.HTTPError as e:
+        if e.code == 416 and offset:
+            return digest  # nothing left to fetch; the checksum decides if it is complete
+        raise
 
-        cache_zip = CACHE_DIR / zip_name
-        if cache_zip.exists():
-            print("💾 Using cached EverMod module...")
-            data = cache_zip.read_bytes()
+    with response:
+        if offset and response.status != 206:
+            # Server ignored the Range header: start over from scratch
+            offset = 0
+            digest = hashlib.sha256()
+            mode = "wb"
         else:
-            print(f"⬇️  Downloading EverMod core module for {mc_version}...")
-            with urllib.request.urlopen(module_url) as r:
-                data = r.read()
-            cache_zip.write_bytes(data)
-
-        sha256_actual = hashlib.sha256(data).hexdigest()
-        if sha256_actual != sha256_expected:
-            print("❌ Checksum mismatch! Removing cached file.")
-            cache_zip.unlink(missing_ok=True)
+            mode = "ab" if offset else "wb"
+
+        total = None
+        content_range = response.headers.get("Content-Range")
+        if content_range and "/" in content_range and not content_range.endswith("/*"):
+            total = int(content_range.rsplit("/", 1)[1])
+        elif response.headers.get("Content-Length"):
+            total = offset + int(response.headers["Content-Length"])
+
+        received, start, last_report = 0, time.perf_counter(), 0.0
+        try:
+            with open(part, mode) as f:
+                for chunk in iter(lambda: response.read(CHUNK_SIZE), b""):
+                    f.write(chunk)
+                    digest.update(chunk)
+                    received += len(chunk)
+                    add_bytes("downloaded", len(chunk))
+                    now = time.perf_counter()
+                    if not quiet and now - last_report >= PROGRESS_INTERVAL:
+                        print("\r" + _format_progress(offset + received, total, received, now - start), end="", flush=True)
+                        last_report = now
+        finally:
+            if not quiet:
+                print("\r" + _format_progress(offset + received, total, received, time.perf_counter() - start))
+        if total is not None and offset + received < total:
+            raise urllib.error.URLError(f"connection closed after {offset + received} of {total} bytes")
+        return digest
+
+def _hash_part(part: Path):
+    """SHA-256 object covering the bytes already in `part` (empty if missing)."""
+    digest = hashlib.sha256()
+    if part.exists():
+        with open(part, "rb") as f:
+            for chunk in iter(lambda: f.read(CHUNK_SIZE), b""):
+                digest.update(chunk)
+    return digest
+
+def download_file(url: str, dest: Path, sha256_expected: str | None = None,
+                  quiet: bool = False, retries: int = DOWNLOAD_RETRIES, timeout: float = 30) -> Path:
+    """
+    Download `url` to `dest` through a `.part` file, hashing while streaming.
+
+    Interrupted transfers are resumed with HTTP Range requests (also across runs,
+    since the `.part` file is kept). `dest` only appears, atomically, once the
+    SHA-256 matches `sha256_expected`; a mismatch discards the partial file and
+    raises ChecksumMismatch.
+    """
+    part = dest.with_name(dest.name + ".part")
+    if part.exists() and not quiet:
+        print(f"↪️  Resuming download from {part.stat().st_size // 1024}KB...")
+
+    start = time.perf_counter()
+    for attempt in range(1, retries + 1):
+        try:
+            # Hashed again on every attempt: an interrupted attempt may have
+            # restarted the file from zero (server ignoring Range)
+            digest = _hash_part(part)
+            with span("download", "network", url=url, attempt=attempt):
+                digest = _fetch_into_part(url, part, digest, quiet, timeout)
+            break
+        except (OSError, http.client.HTTPException) as e:
+            if isinstance(e, urllib.error.HTTPError) or attempt == retries:
+                raise
+            if not quiet:
+                print(f"⚠️  Download interrupted ({e}), resuming ({attempt}/{retries - 1})...")
+
+    sha256_actual = digest.hexdigest()
+    if sha256_expected and sha256_actual != sha256_expected:
+        part.unlink(missing_ok=True)
+        raise ChecksumMismatch(f"expected {sha256_expected}, got {sha256_actual}")
+
+    os.replace(part, dest)
+    if not quiet:
+        elapsed = time.perf_counter() - start
+        size_mb = dest.stat().st_size / 1024 / 1024
+        print(f"📥 Downloaded {url.rsplit('/', 1)[-1]} ({size_mb:.1f} MB in {elapsed:.2f}s)")
+    return dest
+
+def verify_manifest_signature(url: str, body: bytes, force: bool = False,
+                              sig_name: str = RELEASE_SIGNATURE_CACHE):
+    """
+    Check `body` against the detached signature published next to it (`<url>.sig`,
+    cached as `sig_name`). Raises SignatureError when it does not match.
+    """
+    from evermod.auth.security import verify_data_signature  # loads cryptography only when needed
+
+    signature = fetch_cached(f"{url}.sig", sig_name, force=force, allow_stale=True)
+    if verify_data_signature(body, signature):
+        return
+    # The cached signature may predate a manifest that was just refreshed
+    signature = fetch_cached(f"{url}.sig", sig_name, force=True, allow_stale=True)
+    if not verify_data_signature(body, signature):
+        raise SignatureError(f"invalid signature for {url.rsplit('/', 1)[-1]}")
+
+def fetch_release_manifest(force: bool = False) -> dict:
+    """
+    Return the latest release manifest (versions.json), verified against its signature.
+    It is kept in the HTTP cache, so the last known copy is used when offline.
+    """
+    url = f"{EVERMOD_LATEST_URL}versions.json"
+    body = fetch_cached(url, RELEASE_MANIFEST_CACHE, force=force, allow_stale=True)
+    verify_manifest_signature(url, body, force)
+    return json.loads(body.decode("utf-8"))
+
+def release_url(tag: str) -> str:
+    """Base URL of a published release ('latest' or a tag)."""
+    return EVERMOD_LATEST_URL if tag == "latest" else f"{EVERMOD_RELEASES_URL}{tag}/"
+
+def fetch_file_manifest(tag: str = "latest", force: bool = False) -> dict:
+    """
+    Return the signed per-file listing (files.json) of a release: for each module,
+    its Merkle root and the size / SHA-256 of every file.
+    """
+    url = f"{release_url(tag)}files.json"
+    name = f"release-{tag}-files.json"
+    body = fetch_cached(url, name, force=force, allow_stale=True)
+    verify_manifest_signature(url, body, force, f"{name}.sig")
+    return json.loads(body.decode("utf-8"))
+
+def read_cached_release_manifest() -> dict | None:
+    """Last known release manifest, without touching the network."""
+    body = read_cached(f"{EVERMOD_LATEST_URL}versions.json", RELEASE_MANIFEST_CACHE)
+    return json.loads(body) if body else None
+
+def fetch_module_zip(module_info: dict, cache: ModuleCache, quiet: bool = False,
+                     rehash: bool = False) -> tuple[Path, bool]:
+    """
+    Return (cached zip path, downloaded) for a manifest module entry, downloading
+    it into the cache when missing. Raises ChecksumMismatch on a corrupt download.
+    """
+    zip_name = Path(module_info["path"]).name
+    sha256_expected = module_info["sha256"]
+
+    cache_zip = cache.get(sha256_expected, rehash=rehash)
+    if cache_zip:
+        return cache_zip, False
+
+    download_file(f"{EVERMOD_LATEST_URL}{zip_name}", cache.object_path(sha256_expected), sha256_expected, quiet=quiet)
+    return cache.add(sha256_expected, zip_name), True
+
+def get_module_tree(cache: ModuleCache, sha256: str, cache_zip: Path) -> Path:
+    """Extracted copy of a cached module zip, shared by every mod materialized from it."""
+    tree = cache.tree_path(sha256)
+    if not tree.exists():
+        tmp = tree.with_name(f"{tree.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        with span("extract module tree", "create"):
+            extract_zip(cache_zip, tmp, quiet=True)
+        try:
+            os.replace(tmp, tree)
+        except OSError:
+            shutil.rmtree(tmp, ignore_errors=True)  # another create finished it first
+    return tree
+
+def resolve_module(mc_version: str, quiet: bool = False) -> tuple[dict, Path, bool]:
+    """
+    Fetch the release manifest and the module zip for `mc_version` into the cache.
+    Returns (module info, cached zip, downloaded); raises LookupError when the
+    release has no module for that version.
+    """
+    with span("release manifest", "network"):
+        modules = fetch_release_manifest().get("modules", {})
+    if not modules:
+        raise LookupError("No module data found in release manifest.")
+    module_info = modules.get(mc_version)
+    if not module_info:
+        raise LookupError(f"No EverMod module available for Minecraft {mc_version}.")
+    cache_zip, downloaded = fetch_module_zip(module_info, ModuleCache(), quiet=quiet)
+    return module_info, cache_zip, downloaded
+
+def prefetch_module(mc_version: str) -> Future:
+    """
+    Start resolve_module() in a background thread (silently) and return its future,
+    so the download overlaps with prompts and template rendering.
+    """
+    future = Future()
+
+    def work():
+        try:
+            with span("prefetch module", "network", version=mc_version):
+                future.set_result(resolve_module(mc_version, quiet=True))
+        except BaseException as e:
+            future.set_exception(e)
+
+    threading.Thread(target=work, name=f"evermod-prefetch-{mc_version}", daemon=True).start()
+    return future
+
+def verify_extracted_files(mc_version: str, module_info: dict, dest: Path, paths: list[str]) -> list[str] | None:
+    """
+    Check just-extracted `paths` against the module's entry in the signed files.json.
+    Returns the paths that differ, or None when the release has no file manifest
+    (or it cannot be fetched). Raises SignatureError if files.json does not match
+    the Merkle root recorded in versions.json.
+    """
+    root = module_info.get("files_root")
+    if not root or not paths:
+        return None
+    for force in (False, True):  # a cached files.json may be older than versions.json
+        try:
+            entry = fetch_file_manifest(force=force).get("modules", {}).get(mc_version)
+        except SignatureError:
+            raise
+        except Exception:
+            return None
+        if entry and entry.get("root") == root and merkle_root(entry["files"]) == root:
+            return verify_files(dest, entry, paths)
+    raise SignatureError(f"files.json does not match the release root of {mc_version}")
+
+def _module_files_ok(mc_version: str, module_info: dict, root: Path, paths: list[str], log) -> bool:
+    """Verify module files under `root` against files.json, printing the outcome."""
+    with span("verify module files", "hash", files=len(paths)):
+        mismatches = verify_extracted_files(mc_version, module_info, root, paths)
+    if mismatches:
+        print(f"❌ {len(mismatches)} module file(s) differ from or are missing in files.json: {', '.join(mismatches[:5])}")
+        return False
+    if mismatches is not None:
+        log(f"🔎 {len(paths)} module file(s) match the signed file manifest.")
+    return True
+
+def _move_tree(src_dir: Path, dst_dir: Path):
+    """Move every file under `src_dir` into `dst_dir` (same filesystem), replacing existing ones."""
+    for current, _, names in os.walk(src_dir):
+        target = dst_dir / Path(current).relative_to(src_dir)
+        target.mkdir(parents=True, exist_ok=True)
+        for name in names:
+            os.replace(Path(current) / name, target / name)
+
+def download_evermod_module(mc_version: str, extract_to: Path, quiet: bool = False,
+                            materializer: Materializer | None = None, prefetch: Future | None = None):
+    """
+    Download and extract the latest EverMod module for a given MC version.
+    With a linking `materializer`, files come from the shared extracted tree instead.
+    A `prefetch` future from prefetch_module() is joined instead of fetching again.
+    """
+    log = (lambda *args, **kwargs: None) if quiet else print
+    try:
+        try:
+            if prefetch is None:
+                log("\n🌐 Fetching latest EverMod module information...")
+                log(f"⬇️  Resolving EverMod core module for {mc_version}...")
+                module_info, cache_zip, downloaded = resolve_module(mc_version, quiet=quiet)
+            else:
+                if not prefetch.done():
+                    log(f"\n⏳ Waiting for the EverMod {mc_version} module download...")
+                with span("wait for prefetch", "network"):
+                    module_info, cache_zip, downloaded = prefetch.result()
+        except LookupError as e:
+            print(f"⚠️  {e}")
             return
+        except ChecksumMismatch:
+            print(f"❌ Checksum mismatch for EverMod {mc_version}! Discarding downloaded file.")
+            return
+        if not downloaded:
+            log("💾 Using cached EverMod module...")
 
-        print("✅ Integrity verified. Extracting EverMod module...")
-        with zipfile.ZipFile(io.BytesIO(data)) as z:
-            z.extractall(extract_to)
-        print(f"📦 EverMod {mc_version} module embedded successfully.")
+        if materializer and materializer.mode != "copy":
+            log(f"✅ Integrity verified. Linking EverMod module ({materializer.mode})...")
+            tree = get_module_tree(ModuleCache(), module_info["sha256"], cache_zip)
+            paths = [(Path(current) / name).relative_to(tree).as_posix()
+                     for current, _, names in os.walk(tree) for name in names]
+            if not _module_files_ok(mc_version, module_info, tree, paths, log):
+                shutil.rmtree(tree, ignore_errors=True)  # extracted again from the verified zip next time
+                return
+            with span("link module", "create", mode=materializer.mode):
+                # Mod sources: never hardlinked, an in-place edit would reach the cache and every other mod
+                materializer.tree(tree, extract_to, editable=True)
+        else:
+            log("✅ Integrity verified. Extracting EverMod module...")
+            # Extract next to the mod and verify there: nothing reaches src/main/java before it matches files.json
+            extract_to.parent.mkdir(parents=True, exist_ok=True)
+            staging = Path(tempfile.mkdtemp(prefix=".evermod-module-", dir=extract_to.parent))
+            try:
+                stats = extract_zip(cache_zip, staging, quiet=quiet)
+                if not _module_files_ok(mc_version, module_info, staging, stats["written"], log):
+                    return
+                _move_tree(staging, extract_to)
+            finally:
+                shutil.rmtree(staging, ignore_errors=True)
+        log(f"📦 EverMod {mc_version} module embedded successfully.")
 
+    except SignatureError as e:
+        print(f"⛔ Release verification failed ({e}). Do not use the EverMod {mc_version} module.")
     except Exception as e:
-        print(f"⚠️  Could not fetch or extract EverMod module: {e}")
+        print(f"⚠️  Could not fetch or extract EverMod {mc_version} module: {e}")
@@ -1,9 +1,9 @@
-import shutil
 from pathlib import Path
 from evermod.utils.paths import get_templates_dir
+from evermod.utils.materialize import Materializer
 
-def create_mod_structure(mod_dir: Path, package_parts: list[str]):
-    """Create folder structure and copy static template files."""
+def create_mod_structure(mod_dir: Path, package_parts: list[str], materializer: Materializer | None = None):
+    """Create folder structure and materialize static template files (copied by default)."""
     src_main_java = mod_dir / "src" / "main" / "java"
     src_main_java_mod = src_main_java / Path(*package_parts)
     src_main_resources = mod_dir / "src" / "main" / "resources"
@@ -14,11 +14,12 @@ def create_mod_structure(mod_dir: Path, package_parts: list[str]):
     src_main_metainf.mkdir(parents=True, exist_ok=True)
 
     templates_dir = get_templates_dir()
+    materializer = materializer or Materializer()
 
-    for tpl_file, dst_file in [
-        ("mods.toml", src_main_metainf / "mods.toml"),
-        ("LICENSE.txt", mod_dir / "LICENSE.txt"),
+    for tpl_file, dst_file, editable in [
+        ("mods.toml", src_main_metainf / "mods.toml", True),
+        ("LICENSE.txt", mod_dir / "LICENSE.txt", True),
     ]:
-        shutil.copy2(templates_dir / tpl_file, dst_file)
+        materializer.file(templates_dir / tpl_file, dst_file, editable)
 
     return templates_dir, src_main_java, src_main_java_mod, src_main_resources
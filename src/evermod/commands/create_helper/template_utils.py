@@ -1,9 +1,39 @@
-from jinja2 import Template
+from functools import lru_cache
+from jinja2 import Environment, FileSystemLoader, FileSystemBytecodeCache, Template
 from pathlib import Path
+from evermod.utils.paths import get_cache_dir, get_templates_dir
+
+def get_bytecode_cache_dir() -> Path:
+    """Compiled templates live in ~/.evermod/cache/jinja."""
+    cache_dir = get_cache_dir() / "jinja"
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    return cache_dir
+
+@lru_cache(maxsize=None)
+def get_environment() -> Environment:
+    """Shared Jinja2 environment over the global templates folder, compiled once per process."""
+    return Environment(
+        loader=FileSystemLoader(str(get_templates_dir())),
+        bytecode_cache=FileSystemBytecodeCache(str(get_bytecode_cache_dir())),
+    )
+
+def clear_template_cache():
+    """Drop compiled templates (in memory and on disk), e.g. after new templates are installed."""
+    FileSystemBytecodeCache(str(get_bytecode_cache_dir())).clear()
+    get_environment.cache_clear()
 
 def render_template(template_path: Path, context: dict, output_path: Path):
     """Render a Jinja2 template and write to destination."""
-    with open(template_path, encoding="utf-8") as f:
-        template = Template(f.read())
+    try:
+        name = template_path.relative_to(get_templates_dir()).as_posix()
+    except ValueError:
+        name = None
+
+    if name is not None:
+        template = get_environment().get_template(name)
+    else:
+        # Templates outside the global folder are compiled on the fly
+        with open(template_path, encoding="utf-8") as f:
+            template = Template(f.read())
     result = template.render(context)
     output_path.write_text(result, encoding="utf-8")
@@ -1,9 +1,12 @@
 import os
 import json
+import time
 from pathlib import Path
 from xml.sax.saxutils import escape
 import pathspec
 import re
+from evermod.utils.tracing import span, count, add_bytes
+from evermod.utils.pack_report import PackReport
 
 # ─────────────────────────────────────────────
 # ⚙️  Utility functions
@@ -17,27 +20,36 @@ def load_gitignore(base_path: Path):
     lines = gitignore_path.read_text(encoding="utf-8").splitlines()
     return pathspec.PathSpec.from_lines("gitwildmatch", lines)
 
+DEFAULT_CONFIG = {
+    "exclude": [
+        ".git",
+        ".gitignore",
+        ".gitattributes",
+        "build",
+        "dist",
+        "__pycache__",
+        "__init__.py",
+        "*.log",
+        "*.zip",
+        ".idea",
+        ".vscode"
+    ],
+    "use_gitignore": True,
+    "output": None,
+    "follow_symlinks": False,
+    "secrets": "redact",
+    "secrets_allow": [],
+    "report": True,
+    "budget_weights": {}
+}
+
+def default_config() -> dict:
+    return {**DEFAULT_CONFIG, "exclude": list(DEFAULT_CONFIG["exclude"])}
+
 def load_config(base_path: Path) -> dict:
     """Load EverMix config file (evermix.config.json) or return defaults."""
     config_path = base_path / "evermix.config.json"
-    defaults = {
-        "exclude": [
-            ".git",
-            ".gitignore",
-            ".gitattributes",
-            "build",
-            "dist",
-            "__pycache__",
-            "__init__.py",
-            "*.log",
-            "*.zip",
-            ".idea",
-            ".vscode"
-        ],
-        "use_gitignore": True,
-        "output": None,
-        "follow_symlinks": False
-    }
+    defaults = default_config()
 
     if config_path.exists():
         try:
@@ -47,6 +59,12 @@ def load_config(base_path: Path) -> dict:
             print(f"⚠️  Could not parse evermix.config.json: {e}")
     return defaults
 
+def output_path(base_path: Path, config: dict) -> Path:
+    return base_path / (config["output"] or f"{base_path.name}-evermix.xml")
+
+def report_path(output_file: Path) -> Path:
+    return output_file.with_name(f"{output_file.stem}.report.json")
+
 def is_binary_file(path: Path) -> bool:
     """Detect if a file is binary by inspecting its first bytes."""
     try:
@@ -66,24 +84,29 @@ def count_tokens(text: str) -> int:
     """Estimate tokens by splitting words and symbols (approximation)."""
     return len(re.findall(r"\w+|[^\w\s]", text))
 
-# ─────────────────────────────────────────────
-# 🧩  Main command
-# ─────────────────────────────────────────────
+def make_scanner(config: dict):
+    """SecretScanner for the config's "secrets" action (flag, redact, exclude), or None when "off"."""
+    from evermod.utils.secret_scan import ACTIONS, SecretScanner
 
-def run(project_path: str = "."):
-    base_path = Path(project_path).resolve()
-    project_name = base_path.name
-    config = load_config(base_path)
+    action = config.get("secrets", "redact")
+    if action == "off":
+        return None
+    if action not in ACTIONS:
+        print(f"⚠️  Unknown secrets action '{action}' in evermix.config.json, using 'redact'.")
+        action = "redact"
+    return SecretScanner(action, config.get("secrets_allow", []))
+
+def make_excluder(base_path: Path, config: dict, output_file: Path):
+    """Return should_exclude(path) applying .gitignore, exclude patterns and the pack (and its report) itself."""
+    from fnmatch import fnmatch
 
     gitignore_spec = load_gitignore(base_path) if config.get("use_gitignore", True) else None
     exclude_patterns = config["exclude"]
-    output_name = config["output"] or f"{project_name}-evermix.xml"
-    output_file = base_path / output_name
-    follow_symlinks = config.get("follow_symlinks", False)
+    report_file = report_path(output_file)
 
-    # helper: exclusion rules
     def should_exclude(path: Path) -> bool:
-        from fnmatch import fnmatch
+        if path in (output_file, report_file) or path.name == f"{output_file.name}.tmp":
+            return True
         rel = str(path.relative_to(base_path))
         if gitignore_spec and gitignore_spec.match_file(rel):
             return True
@@ -91,94 +114,486 @@ def run(project_path: str = "."):
             if fnmatch(path.name, pattern) or fnmatch(rel, pattern):
                 return True
         return False
+    return should_exclude
 
-    # ─────────────────────────────
-    #  Scan files
-    # ─────────────────────────────
-    print(f"📦 Generating EverMix for {project_name} ...\n")
-
-    all_files, binary_files, total_chars, total_tokens = [], [], 0, 0
-
+def iter_files(base_path: Path, should_exclude, follow_symlinks: bool = False):
+    """Yield every packable file in a stable order (a folder's files before its subfolders)."""
     for root, dirs, files in os.walk(base_path, followlinks=follow_symlinks):
         root_path = Path(root)
-        dirs[:] = [d for d in dirs if not should_exclude(root_path / d)]
+        dirs[:] = sorted(d for d in dirs if not should_exclude(root_path / d))
+        for file in sorted(files):
+            if not should_exclude(root_path / file):
+                yield root_path / file
 
-        for file in files:
-            full_path = root_path / file
-            if should_exclude(full_path):
-                continue
-            all_files.append(full_path)
+def scan_files(base_path: Path, should_exclude, follow_symlinks: bool = False) -> list[Path]:
+    return list(iter_files(base_path, should_exclude, follow_symlinks))
 
-    if not all_files:
-        print("⚠️  No files found after filtering.")
-        return
-
-    print(f"🧩 Found {len(all_files)} total files. Processing...\n")
+def pack_order(rel: Path) -> tuple:
+    """Sort key matching iter_files() order."""
+    return rel.parent.parts, rel.name
 
-    with open(output_file, "w", encoding="utf-8") as out:
-        out.write('<?xml version="1.0" encoding="UTF-8"?>\n<project>\n')
+def pack_header(project_name: str, budget: int | None = None) -> str:
+    budget_note = (f"\n    Packed under a budget of {budget:,} tokens: files marked type=\"omitted\" in <structure>"
+                   f"\n    were left out to fit it.") if budget else ""
+    return f"""<?xml version="1.0" encoding="UTF-8"?>
+<project>
 
-        intro = f"""
   <context>
     This XML file was automatically generated by EverMix for project "{project_name}".
     It consolidates all project files for analysis, documentation, and AI-assisted refactoring.
-    Binary files are listed in <structure> but excluded from <file> blocks.
+    Binary files are listed in <structure> but excluded from <file> blocks.{budget_note}
   </context>
 """
-        out.write(intro)
-        out.write("  <structure>\n")
-
-        for path in all_files:
-            rel = path.relative_to(base_path)
-            if is_binary_file(path):
-                out.write(f'    <path type="binary">{rel}</path>\n')
-                binary_files.append(rel)
+
+def structure_line(rel: Path, binary: bool, omitted: bool = False) -> str:
+    if binary:
+        return f'    <path type="binary">{rel}</path>\n'
+    return f'    <path type="omitted">{rel}</path>\n' if omitted else f"    <path>{rel}</path>\n"
+
+def file_block(rel: Path, content: str) -> str:
+    return f'  <file name="{rel}">\n{escape(content)}\n  </file>\n'
+
+# ─────────────────────────────────────────────
+# 📦  Packing API
+# iter_pack() lazily yields one PackRecord per
+# file; write_pack() renders any iterable of
+# records as EverMix XML. Callers can filter,
+# transform or stream records in between:
+#
+#   from evermod.commands import evermix
+#   records = (r for r in evermix.iter_pack("MyMod")
+#              if r.kind == evermix.TEXT and r.size < 100_000)
+#   with open("pack.xml", "w", encoding="utf-8") as out:
+#       stats = evermix.write_pack(records, out, "MyMod")
+# ─────────────────────────────────────────────
+
+TEXT, BINARY = "text", "binary"
+
+class PackRecord:
+    """
+    One packable file. `path` is relative to the project, `source` is the file
+    on disk (None for records built in memory). Contents are only read when
+    text() or tokens is used, so filtering on path, kind, size or mtime costs
+    no I/O.
+    """
+
+    def __init__(self, path: Path, kind: str, size: int, source: Path | None = None, text: str | None = None,
+                 mtime: float = 0.0):
+        self.path = path
+        self.kind = kind
+        self.size = size
+        self.mtime = mtime
+        self.source = source
+        self._text = text
+        self._tokens = None
+
+    def __repr__(self):
+        return f"PackRecord({str(self.path)!r}, {self.kind!r}, size={self.size})"
+
+    def text(self) -> str:
+        """Contents as text ("" for binaries). Read from disk on every call unless held in memory."""
+        if self._text is not None:
+            return self._text
+        if self.kind == BINARY or self.source is None:
+            return ""
+        return self.source.read_text(encoding="utf-8", errors="ignore")
+
+    @property
+    def tokens(self) -> int:
+        """Estimated token count (reads the file the first time)."""
+        if self._tokens is None:
+            self._tokens = count_tokens(self.text())
+        return self._tokens
+
+    def with_text(self, text: str) -> "PackRecord":
+        """Copy of this record with replaced contents (redaction, stripping comments...)."""
+        return PackRecord(self.path, TEXT, len(text.encode("utf-8")), self.source, text, self.mtime)
+
+def make_record(base_path: Path, path: Path) -> PackRecord | None:
+    """Record for a file on disk, or None if it vanished."""
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+    kind = BINARY if is_binary_file(path) else TEXT
+    return PackRecord(path.relative_to(base_path), kind, stat.st_size, path, mtime=stat.st_mtime)
+
+def iter_pack(path: str | Path = ".", config: dict | None = None):
+    """
+    Lazily yield a PackRecord for every file EverMix would pack, in pack order.
+    `config` overrides the defaults like evermix.config.json (which is read
+    when `config` is None).
+    """
+    base_path = Path(path).resolve()
+    config = load_config(base_path) if config is None else {**default_config(), **config}
+    should_exclude = make_excluder(base_path, config, output_path(base_path, config))
+    for file in iter_files(base_path, should_exclude, config.get("follow_symlinks", False)):
+        record = make_record(base_path, file)
+        if record is not None:
+            yield record
+
+def write_pack(records, writer, project_name: str = "project", scanner=None, report=None,
+               omit: set[Path] | None = None, budget: int | None = None) -> dict:
+    """
+    Write `records` as EverMix XML to `writer` (anything with .write(str)).
+    The <structure> list comes first, so the records themselves are collected,
+    but their contents are read one file at a time. A `scanner` (see
+    make_scanner) checks each text right after it is read and may redact it or
+    drop it; a `report` (PackReport) receives every packed file. Paths in
+    `omit` (see select_budget) are listed as omitted and never read; `budget`
+    only goes into the <context> note. Returns the pack stats: {"files",
+    "binary", "tokens", "chars", "errors", "secrets", "excluded", "omitted"}
+    where "binary" lists the binary paths, "errors" holds (path, error) for
+    unreadable files, "secrets" the scanner findings, "excluded" the files
+    dropped because of them and "omitted" the records left out by `omit`.
+    """
+    records = list(records)
+    omit = omit or set()
+    stats = {"files": len(records), "binary": [], "tokens": 0, "chars": 0, "errors": [], "secrets": [], "excluded": [],
+             "omitted": []}
+
+    writer.write(pack_header(project_name, budget))
+    writer.write("  <structure>\n")
+    for record in records:
+        writer.write(structure_line(record.path, record.kind == BINARY, record.path in omit))
+        if record.path in omit and record.kind != BINARY:
+            stats["omitted"].append(record)
+        elif record.kind == BINARY:
+            stats["binary"].append(record.path)
+            if report is not None:
+                report.add(record.path, record.size, 0, binary=True)
+    writer.write("  </structure>\n\n")
+
+    for record in records:
+        if record.path in omit:
+            continue  # only its path is packed
+        drop = scanner is not None and scanner.check_name(record.path)
+        if record.kind == BINARY:
+            continue
+        try:
+            with span("read", "io"):
+                text = record.text()
+        except OSError as e:
+            stats["errors"].append((record.path, e))
+            continue
+        content = text
+        if scanner is not None and not drop:
+            with span("scan secrets", "evermix"):
+                content = scanner.scan(record.path, text)
+        if drop or content is None:
+            stats["excluded"].append(record.path)
+            continue
+        with span("count tokens", "evermix"):
+            if content is not text:
+                tokens = count_tokens(content)  # redacted
+            else:
+                if record._tokens is None:
+                    record._tokens = count_tokens(content)
+                tokens = record._tokens
+        stats["chars"] += len(content)
+        stats["tokens"] += tokens
+        if report is not None:
+            report.add(record.path, record.size, tokens)
+        writer.write(file_block(record.path, content))
+
+    writer.write("</project>\n")
+    if scanner is not None:
+        stats["secrets"] = list(scanner.findings)
+    return stats
+
+def select_budget(records: list[PackRecord], budget: int, project_name: str = "project",
+                  weights: dict[str, float] | None = None) -> tuple[set[Path], int]:
+    """
+    Paths to omit so the pack fits `budget` estimated tokens, and the tokens the
+    pack will take. Every file keeps its <structure> line; <file> blocks are
+    chosen by importance per token (see evermod.utils.pack_budget). `weights`
+    maps globs to score multipliers (0 never packs the file).
+    """
+    from evermod.utils.pack_budget import glob_weight, select_within_budget
+
+    fixed = count_tokens(pack_header(project_name, budget) + "  <structure>\n  </structure>\n\n</project>\n"
+                         + "".join(structure_line(r.path, r.kind == BINARY, True) for r in records))
+    items = []
+    for record in records:
+        if record.kind == BINARY:
+            continue
+        try:
+            tokens = record.tokens
+        except OSError:
+            continue  # reported by write_pack
+        cost = tokens + count_tokens(file_block(record.path, ""))
+        items.append((record.path, record.mtime, cost, glob_weight(record.path, weights or {})))
+
+    keep, used = select_within_budget(items, max(budget - fixed, 0))
+    return {path for path, *_ in items} - keep, fixed + used
+
+MAX_LISTED_FINDINGS = 20
+REPORT_TOP = 10      # largest files kept in the report, folders listed in the summary
+LISTED_LARGEST = 5   # largest files printed in the summary
+FINDING_ACTIONS = {"flag": "flagged", "redact": "redacted", "exclude": "excluded"}
+
+def describe_finding(finding: dict) -> str:
+    where = f"{finding['path']}:{finding['line']}" if finding["line"] else str(finding["path"])
+    action = FINDING_ACTIONS[finding["action"]]
+    if finding["rule"] == "suspicious-file" and finding["action"] == "redact":
+        action = "values redacted"
+    return f"{where}  {finding['rule']} → {action}"
+
+def index_entry(record: PackRecord, scanner=None) -> dict:
+    """Rendered form of a record kept by watch mode: {"binary", "block", "chars", "tokens", "size"}."""
+    drop = scanner is not None and scanner.check_name(record.path)
+    if record.kind == BINARY:
+        return {"binary": True, "block": "", "chars": 0, "tokens": 0, "size": record.size}
+    try:
+        content = record.text()
+    except OSError as e:
+        print(f"⚠️  Could not read {record.source}: {e}")
+        return {"binary": False, "block": "", "chars": 0, "tokens": 0, "size": record.size}
+    if scanner is not None and not drop:
+        content = scanner.scan(record.path, content)
+    if drop or content is None:
+        return {"binary": False, "block": "", "chars": 0, "tokens": 0, "size": record.size}
+    return {"binary": False, "block": file_block(record.path, content), "chars": len(content),
+            "tokens": count_tokens(content), "size": record.size}
+
+# ─────────────────────────────────────────────
+# 👀  Watch mode
+# The index maps every packed file to its record
+# (escaped <file> block + counts); on a change only
+# the touched records are re-read, and the XML is
+# rewritten from memory.
+# ─────────────────────────────────────────────
+
+WATCH_DEBOUNCE = 0.15  # seconds of quiet before regenerating
+WATCH_MAX_DELAY = 2.0  # regenerate at the latest this long after the first event
+CONFIG_FILES = {".gitignore", "evermix.config.json"}
+
+def index_report(index: dict[Path, dict]) -> PackReport:
+    """PackReport of the files an index packs (the same files a one-shot run reports)."""
+    report = PackReport(REPORT_TOP)
+    for rel in sorted(index, key=pack_order):
+        entry = index[rel]
+        if entry["binary"] or entry["block"]:
+            report.add(rel, entry["size"], entry["tokens"], binary=entry["binary"])
+    return report
+
+def write_index(output_file: Path, project_name: str, index: dict[Path, dict]):
+    """Write the pack from in-memory records (atomically, so readers never see half a file)."""
+    order = sorted(index, key=pack_order)
+    parts = [pack_header(project_name), "  <structure>\n"]
+    parts += [structure_line(rel, index[rel]["binary"]) for rel in order]
+    parts.append("  </structure>\n\n")
+    parts += [index[rel]["block"] for rel in order]
+    parts.append("</project>\n")
+    tmp = output_file.with_name(f"{output_file.name}.tmp")
+    tmp.write_text("".join(parts), encoding="utf-8")
+    os.replace(tmp, output_file)
+
+def watch(base_path: Path, poll: bool = False):
+    """Pack once, then keep the index in memory and regenerate on every (debounced) change."""
+    from evermod.utils.watcher import create_watcher, collect_changes
+
+    project_name = base_path.name
+
+    def setup():
+        config = load_config(base_path)
+        output_file = output_path(base_path, config)
+        should_exclude = make_excluder(base_path, config, output_file)
+        follow = config.get("follow_symlinks", False)
+        return (output_file, should_exclude, lambda: scan_files(base_path, should_exclude, follow), make_scanner(config),
+                config.get("report", True))
+
+    def is_excluded(path: Path) -> bool:
+        # A path is packed only if neither it nor any parent folder is excluded
+        rel_parts = path.relative_to(base_path).parts
+        return any(should_exclude(base_path.joinpath(*rel_parts[:i])) for i in range(1, len(rel_parts) + 1))
+
+    def read_entry(path: Path) -> dict | None:
+        record = make_record(base_path, path)
+        return None if record is None else index_entry(record, scanner)
+
+    def full_scan() -> dict[Path, dict]:
+        with span("index", "evermix"):
+            entries = {p.relative_to(base_path): read_entry(p) for p in list_files()}
+            return {rel: entry for rel, entry in entries.items() if entry is not None}
+
+    def summary(index: dict[Path, dict]) -> str:
+        return f"{len(index)} files, {sum(r['tokens'] for r in index.values()):,} tokens"
+
+    def report_secrets(seen: int) -> int:
+        if scanner is None:
+            return 0
+        for finding in scanner.findings[seen:]:
+            print(f"🕵️  {describe_finding(finding)}")
+        return len(scanner.findings)
+
+    output_file, should_exclude, list_files, scanner, with_report = setup()
+    start = time.perf_counter()
+    index = full_scan()
+    write_index(output_file, project_name, index)
+    if with_report:
+        index_report(index).write_json(report_path(output_file))
+    print(f"📦 EverMix index built for {project_name}: {summary(index)} in {time.perf_counter() - start:.2f}s → {output_file.name}")
+    reported = report_secrets(0)
+
+    watcher = create_watcher(base_path, is_excluded, list_files, poll)
+    print(f"👀 Watching {base_path} ({'inotify' if type(watcher).__name__ == 'InotifyWatcher' else 'polling'}). Press Ctrl+C to stop.")
+
+    try:
+        while True:
+            changed = collect_changes(watcher, WATCH_DEBOUNCE, WATCH_MAX_DELAY)
+            start = time.perf_counter()
+            if changed is None or any(p.name in CONFIG_FILES and p.parent == base_path for p in changed):
+                # Lost events or new exclusion rules: rebuild everything
+                watcher.close()
+                output_file, should_exclude, list_files, scanner, with_report = setup()
+                reported = 0
+                index = full_scan()
+                watcher = create_watcher(base_path, is_excluded, list_files, poll)
+                updated = len(index)
             else:
-                out.write(f"    <path>{rel}</path>\n")
-        out.write("  </structure>\n\n")
-
-        # file contents
-        for path in all_files:
-            rel = path.relative_to(base_path)
-            if rel in binary_files:
-                continue
-            try:
-                content = path.read_text(encoding="utf-8", errors="ignore")
-                total_chars += len(content)
-                total_tokens += count_tokens(content)
-            except Exception as e:
-                print(f"⚠️  Could not read {path}: {e}")
-                continue
-
-            out.write(f'  <file name="{rel}">\n{escape(content)}\n  </file>\n')
-
-        out.write("</project>\n")
+                updated = 0
+                for path in changed:
+                    rel = path.relative_to(base_path)
+                    entry = read_entry(path) if path.is_file() and not is_excluded(path) else None
+                    if entry is not None:
+                        index[rel] = entry
+                        updated += 1
+                    else:
+                        # Deleted, excluded, or a removed folder: drop it and everything below
+                        gone = [r for r in index if r == rel or rel in r.parents]
+                        for r in gone:
+                            del index[r]
+                        updated += len(gone)
+                if not updated:
+                    continue
+            with span("write pack", "evermix"):
+                write_index(output_file, project_name, index)
+                if with_report:
+                    index_report(index).write_json(report_path(output_file))
+            stamp = time.strftime("%H:%M:%S")
+            print(f"🔁 [{stamp}] {updated} file(s) updated → {output_file.name} "
+                  f"in {(time.perf_counter() - start) * 1000:.1f} ms ({summary(index)})")
+            reported = report_secrets(reported)
+    except KeyboardInterrupt:
+        print("\n👋 Watch stopped.")
+    finally:
+        watcher.close()
+
+# ─────────────────────────────────────────────
+# 🧩  Main command
+# ─────────────────────────────────────────────
+
+def run(project_path: str = ".", watch_mode: bool = False, poll: bool = False, budget: int | None = None):
+    base_path = Path(project_path).resolve()
+    if watch_mode:
+        if budget:
+            print("⚠️  --budget is ignored in watch mode: the whole project is kept in the index.")
+        watch(base_path, poll)
+        return
+
+    project_name = base_path.name
+    config = load_config(base_path)
+    output_file = output_path(base_path, config)
+
+    # ─────────────────────────────
+    #  Scan files
+    # ─────────────────────────────
+    print(f"📦 Generating EverMix for {project_name} ...\n")
+
+    with span("scan files", "evermix"):
+        records = list(iter_pack(base_path, config))
+    count("files walked", len(records))
+
+    if not records:
+        print("⚠️  No files found after filtering.")
+        return
+
+    print(f"🧩 Found {len(records)} total files. Processing...\n")
+
+    omit, estimate = set(), 0
+    if budget:
+        with span("select budget", "evermix"):
+            omit, estimate = select_budget(records, budget, project_name, config.get("budget_weights", {}))
+        if estimate > budget:
+            print(f"⚠️  The file list alone takes ~{estimate:,} tokens: no file contents fit in a budget of {budget:,}.\n")
+
+    report = PackReport(REPORT_TOP)
+    with open(output_file, "w", encoding="utf-8") as out:
+        with span("pack contents", "evermix"):
+            stats = write_pack(records, out, project_name, make_scanner(config), report, omit, budget)
+        add_bytes("evermix output", out.tell())
+    count("binary files", len(stats["binary"]))
+    report_file = report.write_json(report_path(output_file)) if config.get("report", True) else None
+
+    for rel, error in stats["errors"]:
+        print(f"⚠️  Could not read {base_path / rel}: {error}")
+    findings = stats["secrets"]
 
     # ─────────────────────────────
     #  Output summary
     # ─────────────────────────────
+    from evermod.utils.formatting import format_size
+
     YELLOW = "\033[33m"
     GREEN = "\033[92m"
     RESET = "\033[0m"
 
     print("✔ Packing completed successfully!\n")
 
-    if binary_files:
-        print("📄 Binary Files Detected:")
-        print("─────────────────────────")
-        print(f"{YELLOW}{len(binary_files)} files detected as binary by content inspection:{RESET}")
-        for i, f in enumerate(binary_files, 1):
-            print(f"{i}. {f}")
+    folder, rows = report.breakdown()
+    if rows:
+        print(f"📂 Token Breakdown ({project_name if folder == '.' else folder}/):")
+        print("──────────────────")
+        for name, (files, tokens, size) in rows[:REPORT_TOP]:
+            share = tokens / report.tokens * 100 if report.tokens else 0.0
+            label = "(files here)" if name == "." else f"{Path(name).name}/"
+            print(f"  {tokens:>10,} tokens {share:5.1f}%  {files:>5} files {format_size(size):>9}  {label}")
+        if len(rows) > REPORT_TOP:
+            print(f"  ... and {len(rows) - REPORT_TOP} more")
+        print()
+
+    largest = report.largest_by_tokens()[:LISTED_LARGEST]
+    if largest:
+        print("🏆 Largest Files:")
+        print("────────────────")
+        for tokens, name in largest:
+            print(f"  {tokens:>10,} tokens  {name}")
+        print()
+
+    if report.binary_files:
+        print(f"📄 {YELLOW}{report.binary_files} binary files ({format_size(report.binary_bytes)}) detected by content "
+              f"inspection: listed in <structure>, excluded from the output.{RESET}\n")
+
+    if findings:
+        print("🕵️  Secrets Detected:")
+        print("─────────────────────")
+        for finding in findings[:MAX_LISTED_FINDINGS]:
+            print(f"{YELLOW}  {describe_finding(finding)}{RESET}")
+        if len(findings) > MAX_LISTED_FINDINGS:
+            print(f"  ... and {len(findings) - MAX_LISTED_FINDINGS} more")
+        if findings[0]["action"] == "flag":
+            print(f"{YELLOW}Flagged only: set \"secrets\": \"redact\" or \"exclude\" in evermix.config.json to keep them out of the pack.{RESET}")
         print()
-        print(f"{YELLOW}These files have been excluded from the output.{RESET}")
-        print(f"{YELLOW}Please review them if you expected them to contain text content.{RESET}\n")
 
     print("📊 Pack Summary:")
     print("────────────────")
-    print(f"  Total Files: {len(all_files)} files")
-    print(f" Total Tokens: {total_tokens:,} tokens")
-    print(f"  Total Chars: {total_chars:,} chars")
+    print(f"  Total Files: {stats['files']} files")
+    if budget:
+        omitted = stats["omitted"]
+        print(f"       Budget: ~{estimate:,} / {budget:,} tokens, {len(omitted)} file(s) omitted "
+              f"({sum(r.tokens for r in omitted):,} tokens)")
+    print(f" Total Tokens: {stats['tokens']:,} tokens")
+    print(f"  Total Chars: {stats['chars']:,} chars")
     print(f"       Output: {output_file.name}")
-    print(f"     Security: ✔ No suspicious files detected\n")
+    if report_file:
+        print(f"       Report: {report_file.name}")
+    if findings:
+        files_hit = len({finding["path"] for finding in findings})
+        print(f"     Security: ⚠️  {len(findings)} finding(s) in {files_hit} file(s)\n")
+    elif config.get("secrets") == "off":
+        print(f"     Security: secret scan disabled\n")
+    else:
+        print(f"     Security: ✔ No secrets or suspicious files detected\n")
     print(f"{GREEN}🎉 All Done!{RESET}")
     print("Your repository has been successfully packed.")
@@ -3,6 +3,8 @@ from datetime import date
 from pathlib import Path
 from evermod.auth.security import require_internal_auth, sign_file
 from evermod.utils.publisher import publish_release, create_main_tag, is_prerelease
+from evermod.utils.file_manifest import build_entry
+from evermod.utils.tracing import span, add_bytes
 
 def run(release_tag: str, publish: bool, auto: bool = False, target: str = "."):
     require_internal_auth(f"release:{release_tag}")
@@ -47,8 +49,11 @@ def run(release_tag: str, publish: bool, auto: bool = False, target: str = "."):
         "status": status,
         "date": str(date.today()),
         "modules": {},
-        "workspace": {}
+        "workspace": {},
+        "files_manifest": "files.json"
     }
+    # Per-file listing of every module (signed separately, see step 3)
+    files_manifest = {"schema": 1, "version": release_tag, "modules": {}}
 
     # ------------------------------------------------------------
     # 📦 1. Compress each module (evermod-{version}.zip)
@@ -65,23 +70,31 @@ def run(release_tag: str, publish: bool, auto: bool = False, target: str = "."):
 
         # Copy only 'net' folder into a temp location to zip cleanly
         temp_dir = RELEASE_DIR / f"_temp_{version}"
-        if temp_dir.exists():
-            shutil.rmtree(temp_dir)
-        shutil.copytree(net_path, temp_dir / "net")
-
-        shutil.make_archive(str(zip_path).replace(".zip", ""), "zip", temp_dir)
+        with span("stage module", "io", module=version):
+            if temp_dir.exists():
+                shutil.rmtree(temp_dir)
+            shutil.copytree(net_path, temp_dir / "net")
+
+        with span("compress module", "zip", module=version):
+            shutil.make_archive(str(zip_path).replace(".zip", ""), "zip", temp_dir)
+        add_bytes("compressed", zip_path.stat().st_size)
+        with span("file manifest", "hash", module=version):
+            files_entry = build_entry(temp_dir)
         shutil.rmtree(temp_dir)
 
         size_kb = f"{zip_path.stat().st_size // 1024}KB"
-        sha256 = hashlib.sha256(zip_path.read_bytes()).hexdigest()
+        with span("hash archive", "hash", module=version):
+            sha256 = hashlib.sha256(zip_path.read_bytes()).hexdigest()
 
         release_info["modules"][version] = {
             "path": str(zip_path.relative_to(ROOT)).replace("\\", "/"),
             "size": size_kb,
-            "sha256": sha256
+            "sha256": sha256,
+            "files_root": files_entry["root"]
         }
+        files_manifest["modules"][version] = files_entry
 
-        print(f"✅ Compressed {zip_name} ({size_kb})")
+        print(f"✅ Compressed {zip_name} ({size_kb}, {len(files_entry['files'])} files)")
 
     # ------------------------------------------------------------
     # 🧩 2. Create full framework workspace zip
@@ -112,35 +125,39 @@ def run(release_tag: str, publish: bool, auto: bool = False, target: str = "."):
         "README.md",
     ]
 
-    for item in include_items:
-        src = ROOT / item
-        dst = temp_framework / item
-        if not src.exists():
-            print(f"⚠️  Missing {item}, skipped.")
-            continue
-        if src.is_dir():
-            # Special case: framework folder → exclude all /build directories
-            if item == "framework":
-                print("📁 Copying framework (excluding build folders)...")
-                for root_dir, dirs, files in os.walk(src):
-                    if "build" in dirs:
-                        dirs.remove("build")  # exclude build/
-                    rel_path = Path(root_dir).relative_to(ROOT)
-                    target_dir = temp_framework / rel_path
-                    target_dir.mkdir(parents=True, exist_ok=True)
-                    for f in files:
-                        shutil.copy2(Path(root_dir) / f, target_dir / f)
+    with span("stage workspace", "io"):
+        for item in include_items:
+            src = ROOT / item
+            dst = temp_framework / item
+            if not src.exists():
+                print(f"⚠️  Missing {item}, skipped.")
+                continue
+            if src.is_dir():
+                # Special case: framework folder → exclude all /build directories
+                if item == "framework":
+                    print("📁 Copying framework (excluding build folders)...")
+                    for root_dir, dirs, files in os.walk(src):
+                        if "build" in dirs:
+                            dirs.remove("build")  # exclude build/
+                        rel_path = Path(root_dir).relative_to(ROOT)
+                        target_dir = temp_framework / rel_path
+                        target_dir.mkdir(parents=True, exist_ok=True)
+                        for f in files:
+                            shutil.copy2(Path(root_dir) / f, target_dir / f)
+                else:
+                    shutil.copytree(src, dst)
             else:
-                shutil.copytree(src, dst)
-        else:
-            shutil.copy2(src, dst)
+                shutil.copy2(src, dst)
 
     # Compress workspace package
-    shutil.make_archive(str(framework_zip).replace(".zip", ""), "zip", temp_framework)
+    with span("compress workspace", "zip"):
+        shutil.make_archive(str(framework_zip).replace(".zip", ""), "zip", temp_framework)
+    add_bytes("compressed", framework_zip.stat().st_size)
     shutil.rmtree(temp_framework)
 
     size_kb = f"{framework_zip.stat().st_size // 1024}KB"
-    sha256 = hashlib.sha256(framework_zip.read_bytes()).hexdigest()
+    with span("hash archive", "hash", module="workspace"):
+        sha256 = hashlib.sha256(framework_zip.read_bytes()).hexdigest()
     release_info["workspace"] = {
         "path": str(framework_zip.relative_to(ROOT)).replace("\\", "/"),
         "size": size_kb,
@@ -150,22 +167,31 @@ def run(release_tag: str, publish: bool, auto: bool = False, target: str = "."):
     print(f"✅ Created evermod-framework.zip ({size_kb})")
 
     # ------------------------------------------------------------
-    # 🧾 3. Write versions.json and sign
+    # 🧾 3. Write files.json + versions.json and sign both
     # ------------------------------------------------------------
+    files_json = RELEASE_DIR / "files.json"
+    files_json.write_text(json.dumps(files_manifest, indent=2), encoding="utf-8")
+    print(f"\n🧾 files.json generated → {files_json}")
+    with span("sign", "crypto", file="files.json"):
+        sign_file(files_json)
+
     versions_json = RELEASE_DIR / "versions.json"
     versions_json.write_text(json.dumps(release_info, indent=2), encoding="utf-8")
     print(f"\n🧾 versions.json generated → {versions_json}")
 
     # --- Sign file ---
-    sign_file(versions_json)
+    with span("sign", "crypto", file="versions.json"):
+        sign_file(versions_json)
 
     # ------------------------------------------------------------
     # 🚀 4. Publish release (optional)
     # ------------------------------------------------------------
     if publish:
-        publish_release(release_tag, RELEASE_DIR, ROOT)
+        with span("publish", "git"):
+            publish_release(release_tag, RELEASE_DIR, ROOT)
 
     # --- Create main tag ---
-    create_main_tag(release_tag, auto, ROOT)
+    with span("tag", "git"):
+        create_main_tag(release_tag, auto, ROOT)
 
     print("\n🎉 EverMod release build completed successfully!\n")
@@ -0,0 +1,125 @@
+import subprocess, time, zipfile
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from evermod.utils.archive import file_matches
+from evermod.utils.module_cache import ModuleCache
+from evermod.utils.state import get_state
+from evermod.utils.workspace_settings import WorkspaceSettings
+from evermod.commands.create_helper.evermod_downloader import read_cached_release_manifest
+
+DEFAULT_JOBS = 16
+EMBEDDED_ROOT = Path("src") / "main" / "java"
+
+def read_properties(path: Path) -> dict:
+    """Minimal gradle.properties parser (key=value, '#' comments)."""
+    props = {}
+    if not path.exists():
+        return props
+    for line in path.read_text(encoding="utf-8", errors="ignore").splitlines():
+        line = line.strip()
+        if not line or line.startswith(("#", "!")) or "=" not in line:
+            continue
+        key, value = line.split("=", 1)
+        props[key.strip()] = value.strip()
+    return props
+
+def git_state(mod_dir: Path) -> str:
+    """Branch plus ahead/behind and dirty markers for a mod with its own repository."""
+    if not (mod_dir / ".git").exists():
+        return "—"
+    result = subprocess.run(
+        ["git", "-C", str(mod_dir), "status", "--porcelain=v1", "--branch"],
+        capture_output=True, text=True
+    )
+    if result.returncode != 0:
+        return "error"
+    lines = result.stdout.splitlines()
+    header = lines[0][3:] if lines and lines[0].startswith("## ") else "?"
+    header = header.removeprefix("No commits yet on ").removeprefix("Initial commit on ")
+    branch = header.split("...", 1)[0].split(" ", 1)[0]
+    state = branch
+    if "[" in header:
+        state += " " + header[header.index("["):].replace("ahead ", "↑").replace("behind ", "↓")
+    changes = len(lines) - 1
+    return f"{state} ✎{changes}" if changes else state
+
+def module_state(mod_dir: Path, members: list[zipfile.ZipInfo] | None) -> str:
+    """Compare the embedded EverMod module with the cached release module (by CRC)."""
+    base = mod_dir / EMBEDDED_ROOT
+    if members is None:
+        return "? not cached" if (base / "net" / "evermod").exists() else "—"
+    present = [info for info in members if (base / info.filename).exists()]
+    if not present:
+        return "—"
+    changed = sum(1 for info in members if not file_matches(base / info.filename, info))
+    return "✔ latest" if not changed else f"✘ {changed} file(s) differ"
+
+def discover_modules(root: Path) -> list[tuple[str, Path]]:
+    """Projects registered in settings.gradle, or the root itself for a standalone mod."""
+    settings = WorkspaceSettings(root / "settings.gradle")
+    if not settings.includes:
+        return [(root.name, root)]
+    return [(project, root.joinpath(*project.split(":"))) for project in settings.includes]
+
+def run(jobs: int = DEFAULT_JOBS):
+    start = time.perf_counter()
+    root = Path(".").resolve()
+    if not (root / "settings.gradle").exists():
+        print("⚠️  settings.gradle not found. Run 'evermod status' from a workspace or mod root.")
+        return
+
+    modules = discover_modules(root)
+
+    # Resolve release module members once per Minecraft version, from local caches only
+    manifest = read_cached_release_manifest() or {}
+    release_modules = manifest.get("modules", {})
+    cache = ModuleCache()
+    members_by_version: dict[str, list[zipfile.ZipInfo] | None] = {}
+
+    props_by_module = {name: read_properties(path / "gradle.properties") for name, path in modules}
+    for props in props_by_module.values():
+        mc_version = props.get("minecraft_version")
+        if mc_version in members_by_version:
+            continue
+        info = release_modules.get(mc_version)
+        zip_path = cache.object_path(info["sha256"]) if info else None
+        if zip_path and zip_path.exists():
+            with zipfile.ZipFile(zip_path) as z:
+                members_by_version[mc_version] = [m for m in z.infolist() if not m.is_dir()]
+        else:
+            members_by_version[mc_version] = None
+
+    def inspect(entry: tuple[str, Path]) -> list[str]:
+        name, path = entry
+        if not path.exists():
+            return [name, "—", "—", "missing", "—"]
+        props = props_by_module[name]
+        mc_version = props.get("minecraft_version", "?")
+        return [
+            name,
+            mc_version,
+            props.get("forge_version", "?"),
+            git_state(path),
+            module_state(path, members_by_version.get(mc_version)),
+        ]
+
+    with ThreadPoolExecutor(max_workers=max(1, jobs)) as pool:
+        rows = list(pool.map(inspect, modules))
+
+    if modules != [(root.name, root)]:
+        get_state().record_workspace(root, {
+            name: (props_by_module[name].get("minecraft_version"), props_by_module[name].get("forge_version"))
+            for name, _ in modules
+        })
+
+    headers = ["Module", "Minecraft", "Forge", "Git", "EverMod"]
+    widths = [max(len(row[i]) for row in rows + [headers]) for i in range(len(headers))]
+
+    print(f"🧩 EverMod workspace: {root.name}")
+    print("  ".join(h.ljust(w) for h, w in zip(headers, widths)).rstrip())
+    print("  ".join("─" * w for w in widths))
+    for row in rows:
+        print("  ".join(cell.ljust(w) for cell, w in zip(row, widths)).rstrip())
+
+    release = manifest.get("version")
+    print(f"\n📦 {len(rows)} module(s) · release manifest: {'v' + release if release else 'not cached'} · {time.perf_counter() - start:.2f}s")
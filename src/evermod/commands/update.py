@@ -1,37 +1,51 @@
-import json, shutil, tempfile, subprocess, urllib.request
+import json, os, shutil, tempfile, subprocess
 from pathlib import Path
 from packaging import version
-from evermod.utils.paths import get_global_dir, get_templates_dir
+from evermod.utils.paths import get_templates_dir
+from evermod.utils.hashing import hash_files
+from evermod.utils.state import get_state
+from evermod.utils.http_cache import fetch_json_cached
+from evermod.utils.tracing import span
+from evermod.commands.create_helper.template_utils import clear_template_cache
 
 MANIFEST_URL = "https://raw.githubusercontent.com/wipodev/evermod-templates/main/manifest.json"
 REPO_URL = "https://github.com/wipodev/evermod-templates.git"
 
-def run(force: bool = False, silent: bool = False):
-    global_dir = get_global_dir()
+def record_templates(manifest: dict, templates_dir: Path):
+    """Store the installed templates (manifest, versions.json, file hashes) in the state store."""
+    paths = [Path(current) / name for current, _, names in os.walk(templates_dir) for name in names]
+    digests = hash_files(paths)
+    files = {
+        path.relative_to(templates_dir).as_posix(): (path.stat().st_size, digests[path][0])
+        for path in paths if path in digests
+    }
+    versions_path = templates_dir / "versions.json"
+    versions = json.loads(versions_path.read_text(encoding="utf-8")) if versions_path.exists() else None
+    get_state().set_installed_templates(manifest, versions, files)
+
+def run(force: bool = False, silent: bool = False, ttl: int | None = None):
     templates_dir = get_templates_dir()
-    local_manifest_path = global_dir / "version.json"
+    state = get_state()
 
     if not silent:
         print("🔍 Checking for EverMod template updates...")
 
     # === Fetch remote manifest ===
+    # Silent checks (shell hooks, CI) are answered from the local cache within
+    # the TTL; interactive runs always revalidate with a conditional request.
     try:
-        with urllib.request.urlopen(MANIFEST_URL) as response:
-            remote_manifest = json.load(response)
+        remote_manifest = fetch_json_cached(
+            MANIFEST_URL, "templates-manifest.json",
+            ttl=ttl if silent else 0, force=force
+        )
     except Exception as e:
         if not silent:
             print(f"❌ Unable to read remote manifest: {e}")
         return
 
     remote_version = remote_manifest.get("version", "0.0.0")
-    local_version = "0.0.0"
-
-    if local_manifest_path.exists():
-        try:
-            local_data = json.loads(local_manifest_path.read_text(encoding="utf-8"))
-            local_version = local_data.get("version", "0.0.0")
-        except Exception:
-            pass
+    installed = state.installed_templates()
+    local_version = installed["version"] if installed else "0.0.0"
 
     remote_v = version.parse(remote_version)
     local_v = version.parse(local_version)
@@ -64,10 +78,11 @@ def run(force: bool = False, silent: bool = False):
             print("⬇️  Downloading new templates...")
 
         try:
-            subprocess.run(
-                ["git", "clone", "--depth", "1", REPO_URL, str(tmp_path)],
-                stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, check=True
-            )
+            with span("git clone templates", "git", url=REPO_URL):
+                subprocess.run(
+                    ["git", "clone", "--depth", "1", REPO_URL, str(tmp_path)],
+                    stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, check=True
+                )
         except subprocess.CalledProcessError:
             if not silent:
                 print("❌ Failed to clone the repository.")
@@ -79,13 +94,14 @@ def run(force: bool = False, silent: bool = False):
                 print("❌ Remote repository does not contain 'templates' folder.")
             return
 
-        if templates_dir.exists():
-            shutil.rmtree(templates_dir)
-        shutil.copytree(remote_templates, templates_dir)
+        with span("install templates", "io"):
+            if templates_dir.exists():
+                shutil.rmtree(templates_dir)
+            shutil.copytree(remote_templates, templates_dir)
+            clear_template_cache()
 
-        local_manifest_path.write_text(
-            json.dumps(remote_manifest, indent=2), encoding="utf-8"
-        )
+        with span("record templates", "hash"):
+            record_templates(remote_manifest, templates_dir)
 
         if not silent:
             print(f"✅ Templates updated successfully to version v{remote_version}.")
@@ -0,0 +1,173 @@
+import json, sys, time
+from pathlib import Path
+from evermod.utils.file_manifest import diff_entries, merkle_root
+from evermod.utils.hashing import HashCache, hash_files
+from evermod.utils.http_cache import read_cached
+from evermod.utils.module_cache import ModuleCache
+from evermod.commands.create_helper.evermod_downloader import (
+    EVERMOD_LATEST_URL, RELEASE_MANIFEST_CACHE, RELEASE_SIGNATURE_CACHE, fetch_file_manifest,
+)
+
+DEFAULT_JOBS = 4
+
+def _release_artifacts(manifest: dict) -> list[tuple[str, dict]]:
+    """(label, entry) for every artifact a release manifest references."""
+    artifacts = [(f"module {version}", info) for version, info in manifest.get("modules", {}).items()]
+    if manifest.get("workspace", {}).get("sha256"):
+        artifacts.append(("workspace", manifest["workspace"]))
+    return artifacts
+
+def _load_local_cache() -> tuple[bytes | None, bytes | None, list[tuple[str, str, Path]]]:
+    """Cached release manifest, its signature and the module zips it references."""
+    url = f"{EVERMOD_LATEST_URL}versions.json"
+    body = read_cached(url, RELEASE_MANIFEST_CACHE)
+    signature = read_cached(f"{url}.sig", RELEASE_SIGNATURE_CACHE)
+    if body is None:
+        return None, signature, []
+
+    cache = ModuleCache()
+    entries = [
+        (label, info["sha256"], cache.object_path(info["sha256"]))
+        for label, info in _release_artifacts(json.loads(body))
+        if label != "workspace"  # the workspace package is never cached
+    ]
+    return body, signature, entries
+
+def _load_release_dir(release_dir: Path) -> tuple[bytes | None, bytes | None, list[tuple[str, str, Path]]]:
+    """versions.json, its signature and the artifacts of a local release folder."""
+    manifest_path = release_dir / "versions.json"
+    sig_path = release_dir / "versions.json.sig"
+    if not manifest_path.exists():
+        return None, None, []
+    body = manifest_path.read_bytes()
+    signature = sig_path.read_bytes() if sig_path.exists() else None
+    entries = [
+        (label, info["sha256"], release_dir / Path(info["path"]).name)
+        for label, info in _release_artifacts(json.loads(body))
+    ]
+    return body, signature, entries
+
+def _check_file_manifest(release_dir: Path, manifest: dict) -> bool:
+    """Signature of files.json and its per-module Merkle roots against versions.json."""
+    from evermod.auth.security import verify_data_signature
+
+    name = manifest.get("files_manifest")
+    if not name:
+        return True  # released before per-file manifests existed
+    files_path = release_dir / name
+    sig_path = files_path.with_name(files_path.name + ".sig")
+    if not files_path.exists() or not sig_path.exists():
+        print(f"⛔ {name} or its signature is missing.")
+        return False
+    body = files_path.read_bytes()
+    if not verify_data_signature(body, sig_path.read_bytes()):
+        print(f"⛔ {name} signature is INVALID.")
+        return False
+
+    listed = json.loads(body).get("modules", {})
+    bad = [
+        version for version, info in manifest.get("modules", {}).items()
+        if version not in listed or merkle_root(listed[version]["files"]) != info.get("files_root")
+    ]
+    if bad:
+        print(f"⛔ {name} does not match versions.json for: {', '.join(bad)}")
+        return False
+    print(f"✅ {name} signature and Merkle roots verified ({sum(len(m['files']) for m in listed.values())} files).")
+    return True
+
+def _load_file_manifest(source: str) -> dict:
+    """files.json of a local release folder (signature checked) or of a published tag."""
+    from evermod.auth.security import verify_data_signature
+
+    folder = Path(source)
+    if (folder / "files.json").exists():
+        body = (folder / "files.json").read_bytes()
+        sig_path = folder / "files.json.sig"
+        if not sig_path.exists() or not verify_data_signature(body, sig_path.read_bytes()):
+            raise ValueError(f"invalid or missing signature for {folder / 'files.json'}")
+        return json.loads(body)
+    return fetch_file_manifest(source)
+
+def diff(old: str, new: str):
+    """Print which module files changed between two releases (tags or local release folders)."""
+    try:
+        old_manifest, new_manifest = _load_file_manifest(old), _load_file_manifest(new)
+    except Exception as e:
+        print(f"❌ Could not load file manifests: {e}")
+        sys.exit(1)
+
+    print(f"🔀 EverMod {old_manifest.get('version', old)} → {new_manifest.get('version', new)}")
+    old_modules, new_modules = old_manifest.get("modules", {}), new_manifest.get("modules", {})
+    for version in sorted(old_modules.keys() | new_modules.keys()):
+        changes = diff_entries(old_modules.get(version), new_modules.get(version))
+        if version not in old_modules:
+            print(f"\n 🆕 module {version}: new ({len(changes['added'])} files)")
+        elif version not in new_modules:
+            print(f"\n 🗑️  module {version}: removed")
+            continue
+        elif not any(changes.values()):
+            print(f"\n ✅ module {version}: unchanged")
+            continue
+        else:
+            print(f"\n 📝 module {version}: {len(changes['changed'])} changed, "
+                  f"{len(changes['added'])} added, {len(changes['removed'])} removed")
+        for mark, key in (("~", "changed"), ("+", "added"), ("-", "removed")):
+            for path in changes[key]:
+                print(f"    {mark} {path}")
+
+def run(target: str | None = None, jobs: int = DEFAULT_JOBS, diff_tags: list[str] | None = None):
+    from evermod.auth.security import verify_data_signature
+
+    if diff_tags:
+        diff(*diff_tags)
+        return
+
+    start = time.perf_counter()
+    if target:
+        source = Path(target).resolve()
+        body, signature, entries = _load_release_dir(source)
+        print(f"🔍 Verifying release folder {source}")
+    else:
+        body, signature, entries = _load_local_cache()
+        print("🔍 Verifying local EverMod cache")
+
+    if body is None:
+        print("❌ No versions.json found." if target else "❌ No cached release manifest. Run 'evermod cache warm' first.")
+        sys.exit(1)
+
+    ok = True
+    if signature is None:
+        print("⛔ versions.json.sig missing — manifest is unsigned.")
+        ok = False
+    elif verify_data_signature(body, signature):
+        print("✅ versions.json signature verified.")
+    else:
+        print("⛔ versions.json signature is INVALID.")
+        ok = False
+    if target:
+        ok &= _check_file_manifest(source, json.loads(body))
+
+    cache = HashCache()
+    results = hash_files([path for _, _, path in entries], cache, jobs)
+
+    width = max([len(label) for label, _, _ in entries] + [8])
+    cached_hits = 0
+    for label, expected, path in entries:
+        result = results.get(path)
+        if result is None:
+            print(f" —  {label:<{width}} {'missing' if target else 'not cached'} ({path.name})")
+            if target:
+                ok = False
+            continue
+        digest, cached = result
+        cached_hits += cached
+        if digest == expected:
+            print(f" ✅ {label:<{width}} {path.name}{'  (hash cache)' if cached else ''}")
+        else:
+            print(f" ❌ {label:<{width}} {path.name}: SHA-256 mismatch")
+            ok = False
+
+    print(f"\n{'✅' if ok else '❌'} {len(results)} artifact(s) checked in {time.perf_counter() - start:.2f}s "
+          f"({cached_hits} from hash cache, {len(results) - cached_hits} hashed with {jobs} job(s))")
+    if not ok:
+        sys.exit(1)
@@ -1,6 +1,6 @@
 import json
-from pathlib import Path
 from evermod.utils.paths import get_global_dir, get_manifest_path
+from evermod.utils.state import get_state
 
 def show_full_version():
     """Display CLI version, framework compatibility, and templates info."""
@@ -14,17 +14,18 @@ def show_full_version():
     cli_manifest = json.loads(cli_manifest_path.read_text(encoding="utf-8"))
     cli_version = cli_manifest.get("version", "unknown")
 
-    # --- Templates Manifest (global .evermod folder) ---
+    # --- Templates and workspaces (state store in the global .evermod folder) ---
     global_dir = get_global_dir()
-    template_manifest_path = global_dir / "version.json"
+    state = get_state()
+    installed = state.installed_templates()
 
-    if template_manifest_path.exists():
-        template_manifest = json.loads(template_manifest_path.read_text(encoding="utf-8"))
-        templates_version = template_manifest.get("version", "not installed")
-        templates_date = template_manifest.get("released", "unknown date")
+    if installed:
+        templates_version = installed["version"]
+        templates_date = installed["released"] or "unknown date"
     else:
         templates_version = "not installed"
         templates_date = "—"
+    workspaces = state.workspaces()
 
     # --- Output summary ---
     print("🧩 EverMod CLI Information")
@@ -33,3 +34,6 @@ def show_full_version():
     print(f"Installed Templates:   v{templates_version}")
     print(f"Templates Released:    {templates_date}")
     print(f"Global Path:           {global_dir}")
+    print(f"Known Workspaces:      {len(workspaces)}")
+    for workspace in workspaces[:5]:
+        print(f"  • {workspace['name']} ({workspace['modules']} mods) — {workspace['root']}")
@@ -1,4 +1,5 @@
 import argparse
+import importlib
 import sys
 import os
 
@@ -7,8 +8,25 @@ if not getattr(sys, 'frozen', False):
     if src_path not in sys.path:
         sys.path.insert(0, src_path)
 
-from evermod.commands import create, evermix, add, update, version, release
-from evermod.utils import gradle_tools
+# Command modules are imported only when dispatched, so '--help' and '-v'
+# don't pay for jinja2, cryptography, pathspec, urllib... at startup.
+# (Keep this list in sync with 'hiddenimports' in evermod.spec.)
+COMMAND_MODULES = {
+    "create": "evermod.commands.create",
+    "evermix": "evermod.commands.evermix",
+    "add": "evermod.commands.add",
+    "update": "evermod.commands.update",
+    "cache": "evermod.commands.cache",
+    "refresh": "evermod.utils.gradle_tools",
+    "status": "evermod.commands.status",
+    "verify": "evermod.commands.verify",
+    "release": "evermod.commands.release",
+    "version": "evermod.commands.version",
+}
+
+def load_command(name: str):
+    """Import and return the module implementing a command."""
+    return importlib.import_module(COMMAND_MODULES[name])
 
 def main():
     parser = argparse.ArgumentParser(
@@ -21,29 +39,69 @@ def main():
         action="store_true",
         help="Show EverMod CLI, framework, and templates version information"
     )
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        help="Record where the command spends its time (Chrome trace JSON + summary)"
+    )
+    parser.add_argument(
+        "--profile-out",
+        metavar="FILE",
+        help="Trace file written by --profile (default: evermod-<command>.trace.json)"
+    )
 
     subparsers = parser.add_subparsers(dest="command")
 
     # create
-    subparsers.add_parser("create", help="Create a new mod from a Forge MDK template")
+    create_parser = subparsers.add_parser("create", help="Create a new mod from a Forge MDK template")
+    create_parser.add_argument("--spec", help="JSON file with a list of mods to create without prompts")
+    create_parser.add_argument("--link", choices=["copy", "auto", "hardlink"],
+                               help="Reuse static files via reflinks/hardlinks when supported (default: copy, or $EVERMOD_LINK_MODE)")
 
     # evermix
     evermix_parser = subparsers.add_parser("evermix", help="Generate evermix documentation for mods")
     evermix_parser.add_argument("target", nargs="?", default=".", help="Target mod")
+    evermix_parser.add_argument("--watch", action="store_true", help="Keep the file index in memory and regenerate on every change")
+    evermix_parser.add_argument("--poll", action="store_true", help="With --watch, poll for changes instead of using inotify")
+    evermix_parser.add_argument("--budget", type=int, metavar="TOKENS", help="Pack the most important files that fit in this many tokens; the rest are listed as omitted")
 
     # add
-    add_parser = subparsers.add_parser("add", help="Add a mod as a Git submodule")
-    add_parser.add_argument("user", help="GitHub username")
-    add_parser.add_argument("name", help="Mod name")
-    add_parser.add_argument("target", nargs="?", default=".", help="Target directory where submodule will be added")
+    add_parser = subparsers.add_parser("add", help="Add one or more mods as Git submodules")
+    add_parser.add_argument("repos", nargs="*", help="GitHub 'user/name' pairs (or the legacy form: <user> <name> [target])")
+    add_parser.add_argument("--list", dest="list_file", help="File with one 'user/name' per line")
+    add_parser.add_argument("--target", default=".", help="Target directory where submodules will be added")
+    add_parser.add_argument("--depth", type=int, help="Shallow clone with the given history depth")
+    add_parser.add_argument("--filter", dest="filter_spec", help="Partial clone filter, e.g. 'blob:none'")
+    add_parser.add_argument("-j", "--jobs", type=int, default=4, help="Parallel clones (default: 4)")
+    add_parser.add_argument("--base-url", default="https://github.com", help=argparse.SUPPRESS)
 
     # update
     update_parser = subparsers.add_parser("update", help="Update the EverMod framework or templates")
     update_parser.add_argument("--force", action="store_true", help="Force update even if versions are the same")
     update_parser.add_argument("--silent", action="store_true", help="Run update in silent mode (no prompts)")
+    update_parser.add_argument("--ttl", type=int, default=None, help="Seconds a cached manifest is trusted in silent mode (default: 3600)")
+
+    # cache
+    cache_parser = subparsers.add_parser("cache", help="Manage the local EverMod module cache")
+    cache_parser.add_argument("action", choices=["warm"], help="'warm' prefetches the module of every Minecraft version")
+    cache_parser.add_argument("-j", "--jobs", type=int, default=4, help="Parallel downloads (default: 4)")
 
     # refresh
-    subparsers.add_parser("refresh", help="Refresh Gradle dependencies and reindex Java environment")
+    refresh_parser = subparsers.add_parser("refresh", help="Refresh Gradle dependencies and reindex Java environment")
+    refresh_parser.add_argument("--force", action="store_true", help="Refresh dependencies even if no Gradle input changed")
+    refresh_parser.add_argument("--status", action="store_true", help="Show the state of the background refresh job")
+    refresh_parser.add_argument("--wait", action="store_true", help="Wait for the background refresh job to finish")
+    refresh_parser.add_argument("--foreground", action="store_true", help=argparse.SUPPRESS)
+
+    # status
+    status_parser = subparsers.add_parser("status", help="Show versions, git state and EverMod module state of every workspace mod")
+    status_parser.add_argument("-j", "--jobs", type=int, default=16, help="Parallel checks (default: 16)")
+
+    # verify
+    verify_parser = subparsers.add_parser("verify", help="Check release signatures and artifact hashes")
+    verify_parser.add_argument("target", nargs="?", help="Release folder with versions.json (default: the local cache)")
+    verify_parser.add_argument("-j", "--jobs", type=int, default=4, help="Parallel hash jobs (default: 4)")
+    verify_parser.add_argument("--diff", nargs=2, metavar=("OLD", "NEW"), help="List files changed between two releases (tags or release folders)")
 
     # release (internal, hidden)
     release_parser = subparsers.add_parser("release", help=argparse.SUPPRESS)
@@ -60,17 +118,46 @@ def main():
     args = parser.parse_args()
 
     if args.version:
-      version.show_full_version()
+      load_command("version").show_full_version()
       return
 
+    if args.command not in COMMAND_MODULES:
+        parser.print_help()
+        return
+
+    if not args.profile:
+        dispatch(args)
+        return
+
+    from pathlib import Path
+    from evermod.utils import tracing
+    tracing.enable()
+    try:
+        with tracing.span(f"evermod {args.command}", "command"):
+            with tracing.span("import command", "startup", module=COMMAND_MODULES[args.command]):
+                load_command(args.command)
+            dispatch(args)
+    finally:
+        trace_path = Path(args.profile_out or f"evermod-{args.command}.trace.json").resolve()
+        tracing.write_trace(trace_path)
+        print()
+        for line in tracing.summarize():
+            print(line)
+        print(f"📈 Trace written → {trace_path} (open in https://ui.perfetto.dev or chrome://tracing)")
+
+def dispatch(args):
+    """Run the command selected on the command line."""
+    command = load_command(args.command)
     match args.command:
-        case "create": create.run()
-        case "evermix": evermix.run(args.target)
-        case "add": add.run(args.user, args.name, args.target)
-        case "update": update.run(args.force, args.silent)
-        case "refresh": gradle_tools.refresh_environment()
-        case "release": release.run(args.release_tag, args.publish, args.auto, args.target)
-        case _: parser.print_help()
+        case "create": command.run(args.spec, args.link)
+        case "evermix": command.run(args.target, args.watch, args.poll, args.budget)
+        case "add": command.run(args.repos, args.target, args.list_file, args.depth, args.filter_spec, args.jobs, args.base_url)
+        case "update": command.run(args.force, args.silent, args.ttl)
+        case "cache": command.run(args.action, args.jobs)
+        case "refresh": command.refresh_environment(args.force, not args.foreground, args.status, args.wait)
+        case "status": command.run(args.jobs)
+        case "verify": command.run(args.target, args.jobs, args.diff)
+        case "release": command.run(args.release_tag, args.publish, args.auto, args.target)
 
 if __name__ == "__main__":
     main()
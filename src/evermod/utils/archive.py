@@ -0,0 +1,121 @@
+import mmap, os, threading, time, zipfile, zlib
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from evermod.utils.tracing import span, add_bytes
+
+# ====================================================
+# 📦 EverMod Archive Utility
+# Extracts zips straight from disk (memory-mapped when
+# possible) with a thread pool, skipping files that
+# are already present with the same CRC-32.
+# ====================================================
+
+CHUNK_SIZE = 64 * 1024
+
+def file_matches(path: Path, info: zipfile.ZipInfo) -> bool:
+    """True if `path` already holds the content of zip member `info`."""
+    try:
+        if path.stat().st_size != info.file_size:
+            return False
+        crc = 0
+        with open(path, "rb") as f:
+            for chunk in iter(lambda: f.read(CHUNK_SIZE), b""):
+                crc = zlib.crc32(chunk, crc)
+        return crc == info.CRC
+    except OSError:
+        return False
+
+def _member_target(dest: Path, info: zipfile.ZipInfo) -> Path:
+    """Resolve the output path of a member, refusing entries that escape `dest`."""
+    parts = [p for p in info.filename.replace("\\", "/").split("/") if p not in ("", ".")]
+    if ".." in parts or (parts and ":" in parts[0]):
+        raise ValueError(f"unsafe path in archive: {info.filename}")
+    return dest.joinpath(*parts)
+
+class _MappedArchive(mmap.mmap):
+    """Read-only memory map exposing the file API zipfile expects."""
+
+    def seekable(self) -> bool:
+        return True
+
+class _ZipReaders(threading.local):
+    """One ZipFile per worker thread, each over its own view of the archive."""
+
+    def __init__(self, zip_path: Path, handles: list, lock: threading.Lock):
+        self.zip_path = zip_path
+        self.handles = handles  # shared by all threads, closed by close_all()
+        self.lock = lock
+        self.zip = None
+
+    def get(self) -> zipfile.ZipFile:
+        if self.zip is None:
+            f = open(self.zip_path, "rb")
+            try:
+                view = _MappedArchive(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except (ValueError, OSError):
+                view = None
+            self.zip = zipfile.ZipFile(view if view is not None else f)
+            with self.lock:
+                self.handles.append((self.zip, view, f))
+        return self.zip
+
+    def close_all(self):
+        for z, view, f in self.handles:
+            z.close()
+            if view is not None:
+                view.close()
+            f.close()
+
+def extract_zip(zip_path: Path, dest: Path, workers: int | None = None, quiet: bool = False) -> dict:
+    """
+    Extract `zip_path` into `dest` in parallel and return stats:
+    {"files", "extracted", "skipped", "bytes", "seconds", "written" (member names)}.
+    Members whose target already matches (size + CRC-32) are not rewritten.
+    """
+    start = time.perf_counter()
+    dest.mkdir(parents=True, exist_ok=True)
+
+    with zipfile.ZipFile(zip_path) as z:
+        members = z.infolist()
+
+    for info in members:
+        target = _member_target(dest, info)
+        (target if info.is_dir() else target.parent).mkdir(parents=True, exist_ok=True)
+    files = [info for info in members if not info.is_dir()]
+
+    readers = _ZipReaders(zip_path, [], threading.Lock())
+
+    def extract_one(info: zipfile.ZipInfo) -> int:
+        target = _member_target(dest, info)
+        if file_matches(target, info):
+            return -1
+        with readers.get().open(info) as src, open(target, "wb") as out:
+            for chunk in iter(lambda: src.read(CHUNK_SIZE), b""):
+                out.write(chunk)
+        return info.file_size
+
+    workers = workers or min(8, (os.cpu_count() or 1) + 2)
+    try:
+        with span("extract " + zip_path.name, "zip", files=len(files), workers=workers):
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                results = list(pool.map(extract_one, files))
+    finally:
+        readers.close_all()
+
+    written = [size for size in results if size >= 0]
+    stats = {
+        "files": len(files),
+        "extracted": len(written),
+        "skipped": len(files) - len(written),
+        "bytes": sum(written),
+        "seconds": time.perf_counter() - start,
+        "written": [info.filename for info, size in zip(files, results) if size >= 0],
+    }
+    add_bytes("extracted", stats["bytes"])
+    if not quiet:
+        speed = stats["bytes"] / stats["seconds"] / 1024 / 1024 if stats["seconds"] > 0 else 0.0
+        print(
+            f"🗜️  Extracted {stats['extracted']} files ({stats['bytes'] / 1024 / 1024:.1f} MB, "
+            f"{speed:.1f} MB/s), {stats['skipped']} unchanged skipped in {stats['seconds']:.2f}s"
+        )
+    return stats
@@ -0,0 +1,92 @@
+import hashlib, os
+from pathlib import Path
+from evermod.utils.hashing import hash_files
+
+# ====================================================
+# 🧾 EverMod File Manifest
+# Per-file listing of a module (path → size, SHA-256)
+# plus a Merkle root over the sorted entries:
+#   leaf = H(0x00 ‖ "path\nsize\nsha256")
+#   node = H(0x01 ‖ left ‖ right)  (odd node promoted)
+# The root goes into the signed versions.json, so a
+# files.json can be trusted entry by entry and two
+# releases can be compared without their archives.
+# ====================================================
+
+def _leaf(path: str, info: dict) -> bytes:
+    return hashlib.sha256(b"\x00" + f"{path}\n{info['size']}\n{info['sha256']}".encode("utf-8")).digest()
+
+def merkle_root(files: dict[str, dict]) -> str:
+    """Merkle root (hex) of a {path: {"size", "sha256"}} listing."""
+    level = [_leaf(path, files[path]) for path in sorted(files)]
+    if not level:
+        return hashlib.sha256(b"").hexdigest()
+    while len(level) > 1:
+        paired = [hashlib.sha256(b"\x01" + level[i] + level[i + 1]).digest() for i in range(0, len(level) - 1, 2)]
+        if len(level) % 2:
+            paired.append(level[-1])
+        level = paired
+    return level[0].hex()
+
+def build_entry(root: Path, jobs: int = 4) -> dict:
+    """{"root", "files"} for every file under `root`, paths relative to it (as stored in the zip)."""
+    paths = [Path(current) / name for current, _, names in os.walk(root) for name in names]
+    digests = hash_files(paths, jobs=jobs)
+    files = {
+        path.relative_to(root).as_posix(): {"size": path.stat().st_size, "sha256": digests[path][0]}
+        for path in sorted(paths)
+    }
+    return {"root": merkle_root(files), "files": files}
+
+def unlisted_files(dest: Path, entry: dict) -> list[str]:
+    """
+    Files in the module's folders under `dest` that the manifest does not list.
+    Those folders are the topmost ones holding listed files; `dest` itself may
+    also hold the mod's own sources, so only its direct files are checked.
+    """
+    listed = entry["files"]
+    roots = []
+    for parent in sorted({p.rpartition("/")[0] for p in listed}):  # a folder sorts before its subfolders
+        if not any(parent == root or parent.startswith(root + "/") for root in roots if root):
+            roots.append(parent)
+
+    found = []
+    for root in roots:
+        if not root:
+            names = [item.name for item in os.scandir(dest) if item.is_file()] if dest.is_dir() else []
+            found += [name for name in names if name not in listed]
+            continue
+        for current, _, names in os.walk(dest.joinpath(*root.split("/"))):
+            rel = Path(current).relative_to(dest).as_posix()
+            found += [f"{rel}/{name}" for name in names if f"{rel}/{name}" not in listed]
+    return sorted(found)
+
+def verify_files(dest: Path, entry: dict, paths: list[str] | None = None, jobs: int = 4) -> list[str]:
+    """
+    Check files extracted under `dest` against a manifest entry.
+    Only `paths` are hashed when given. Returns the paths that are missing or
+    differ, and the ones present but not listed (in `paths` or in the module's
+    folders, see unlisted_files).
+    """
+    wanted = [p for p in (paths if paths is not None else entry["files"]) if p in entry["files"]]
+    targets = {p: dest.joinpath(*p.split("/")) for p in wanted}
+    digests = hash_files(list(targets.values()), jobs=jobs)
+    mismatches = [
+        p for p, target in targets.items()
+        if target not in digests or digests[target][0] != entry["files"][p]["sha256"]
+    ]
+    unlisted = {p for p in paths or [] if p not in entry["files"] and not p.endswith("/")}
+    return mismatches + sorted(unlisted | set(unlisted_files(dest, entry)))
+
+def diff_entries(old: dict | None, new: dict | None) -> dict[str, list[str]]:
+    """Added / removed / changed paths between two manifest entries of a module."""
+    old_files = (old or {}).get("files", {})
+    new_files = (new or {}).get("files", {})
+    if old and new and old.get("root") == new.get("root"):
+        return {"added": [], "removed": [], "changed": []}
+    return {
+        "added": sorted(new_files.keys() - old_files.keys()),
+        "removed": sorted(old_files.keys() - new_files.keys()),
+        "changed": sorted(p for p in old_files.keys() & new_files.keys()
+                          if old_files[p]["sha256"] != new_files[p]["sha256"]),
+    }
@@ -0,0 +1,13 @@
+# ====================================================
+# 🔤 EverMod Formatting
+# Human-readable values shared by command summaries,
+# reports and traces.
+# ====================================================
+
+def format_size(size: int) -> str:
+    """Byte count as B / KB / MB / GB (1024-based)."""
+    for unit in ("B", "KB", "MB"):
+        if size < 1024:
+            return f"{size:.0f} {unit}" if unit == "B" else f"{size:.1f} {unit}"
+        size /= 1024
+    return f"{size:.1f} GB"
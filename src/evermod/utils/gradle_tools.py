@@ -1,26 +1,320 @@
+import hashlib, json, os, sys, time
 import subprocess
 import platform
 from pathlib import Path
+from evermod.utils.tracing import span, traced, count
 
-def refresh_environment():
-    print("🔄 Refreshing Gradle and Java environment...")
+# Folders never holding Gradle inputs (outputs, caches, VCS metadata)
+SKIP_DIRS = {".git", ".gradle", ".evermod", ".idea", ".vscode", "build", "out", "run", "bin", "node_modules"}
+DEPENDENCY_FILES = {"build.gradle", "build.gradle.kts", "gradle.properties", "gradle-wrapper.properties"}
+STRUCTURE_FILES = {"settings.gradle", "settings.gradle.kts"}
 
-    gradlew = Path("./gradlew")
-    if not gradlew.exists():
-        print("⚠️  gradlew not found in this directory.")
-        return
+def get_fingerprint_path(root: Path) -> Path:
+    return root / ".evermod" / "refresh.json"
+
+@traced("gradle fingerprint", "hash")
+def compute_fingerprint(root: Path) -> dict:
+    """
+    Hash every input that affects dependency resolution, split in two groups:
+    'dependencies' (build scripts, properties, wrapper) and 'structure' (settings).
+    """
+    fingerprint = {"dependencies": {}, "structure": {}}
+    for current, dirs, files in os.walk(root):
+        dirs[:] = [d for d in dirs if d not in SKIP_DIRS]
+        for file in files:
+            if file in DEPENDENCY_FILES:
+                group = "dependencies"
+            elif file in STRUCTURE_FILES:
+                group = "structure"
+            else:
+                continue
+            path = Path(current) / file
+            rel = path.relative_to(root).as_posix()
+            fingerprint[group][rel] = hashlib.sha256(path.read_bytes()).hexdigest()
+            count("gradle inputs hashed")
+    return fingerprint
+
+def load_fingerprint(root: Path) -> dict | None:
+    try:
+        return json.loads(get_fingerprint_path(root).read_text(encoding="utf-8"))
+    except Exception:
+        return None
+
+def save_fingerprint(root: Path, fingerprint: dict):
+    path = get_fingerprint_path(root)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    ignore = path.parent / ".gitignore"
+    if not ignore.exists():
+        ignore.write_text("*\n", encoding="utf-8")  # local state, never committed
+    path.write_text(json.dumps(fingerprint, indent=2), encoding="utf-8")
+
+def plan_refresh(root: Path, force: bool = False) -> tuple[str, dict]:
+    """
+    Decide what kind of refresh the workspace needs:
+    'full' (--refresh-dependencies), 'sync' (--offline) or 'skip'.
+    """
+    current = compute_fingerprint(root)
+    previous = load_fingerprint(root)
+    if force or previous is None or previous.get("dependencies") != current["dependencies"]:
+        return "full", current
+    if previous.get("structure") != current["structure"]:
+        return "sync", current
+    return "skip", current
+
+# ─────────────────────────────────────────────
+# 🔒 Background refresh job
+# One detached worker per workspace holds an OS lock on
+# .evermod/refresh.lock (released by the OS if it dies) and
+# describes itself in .evermod/refresh.job.json; requests
+# arriving while it runs leave .evermod/refresh.pending and
+# are folded into a single extra pass by that worker.
+# ─────────────────────────────────────────────
+
+def _state_path(root: Path, name: str) -> Path:
+    return root / ".evermod" / name
+
+def _read_json(path: Path) -> dict | None:
+    try:
+        return json.loads(path.read_text(encoding="utf-8"))
+    except Exception:
+        return None
+
+def _pid_alive(pid: int) -> bool:
+    if platform.system() == "Windows":
+        import ctypes
+        kernel32 = ctypes.windll.kernel32
+        handle = kernel32.OpenProcess(0x1000, False, pid)  # PROCESS_QUERY_LIMITED_INFORMATION
+        if not handle:
+            return False
+        code = ctypes.c_ulong()
+        kernel32.GetExitCodeProcess(handle, ctypes.byref(code))
+        kernel32.CloseHandle(handle)
+        return code.value == 259  # STILL_ACTIVE
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        pass
+    return True
+
+def get_running_job(root: Path) -> dict | None:
+    """Info of the refresh job running in this workspace, or None."""
+    info = _read_json(_state_path(root, "refresh.job.json"))
+    if info and _pid_alive(info.get("pid", -1)):
+        return info
+    return None
+
+def _acquire_lock(root: Path):
+    """Open handle holding the workspace lock, or None if another worker has it."""
+    lock = _state_path(root, "refresh.lock")
+    lock.parent.mkdir(parents=True, exist_ok=True)
+    handle = open(lock, "a+b")
+    try:
+        if platform.system() == "Windows":
+            import msvcrt
+            handle.seek(0)
+            msvcrt.locking(handle.fileno(), msvcrt.LK_NBLCK, 1)
+        else:
+            import fcntl
+            fcntl.flock(handle.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+    except OSError:
+        handle.close()
+        return None
+
+    # Written aside and moved into place, so readers never see it half-written
+    job = _state_path(root, "refresh.job.json")
+    tmp = job.with_name(f"{job.name}.{os.getpid()}.tmp")
+    tmp.write_text(json.dumps({"pid": os.getpid(), "started": time.time()}), encoding="utf-8")
+    os.replace(tmp, job)
+    return handle
+
+def _release_lock(root: Path, handle):
+    _state_path(root, "refresh.job.json").unlink(missing_ok=True)
+    if platform.system() == "Windows":
+        import msvcrt
+        handle.seek(0)
+        msvcrt.locking(handle.fileno(), msvcrt.LK_UNLCK, 1)
+    handle.close()  # closing also drops a flock
+
+def _request_pending(root: Path, force: bool):
+    pending = _state_path(root, "refresh.pending")
+    previous = _read_json(pending) or {}
+    pending.write_text(json.dumps({"force": force or previous.get("force", False)}), encoding="utf-8")
+
+def _take_pending(root: Path) -> dict | None:
+    pending = _state_path(root, "refresh.pending")
+    data = _read_json(pending)
+    pending.unlink(missing_ok=True)
+    return data
+
+def _evermod_command() -> list[str]:
+    if getattr(sys, "frozen", False):
+        return [sys.executable]
+    return [sys.executable, "-m", "evermod.main"]
+
+def _spawn_worker(root: Path, force: bool) -> subprocess.Popen:
+    log = _state_path(root, "refresh.log")
+    log.parent.mkdir(parents=True, exist_ok=True)
+    cmd = _evermod_command() + ["refresh", "--foreground"] + (["--force"] if force else [])
+
+    env = os.environ.copy()
+    src_dir = str(Path(__file__).resolve().parents[2])
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [src_dir, env.get("PYTHONPATH")]))
+
+    kwargs = {}
+    if platform.system() == "Windows":
+        kwargs["creationflags"] = subprocess.DETACHED_PROCESS | subprocess.CREATE_NEW_PROCESS_GROUP
+    else:
+        kwargs["start_new_session"] = True
+
+    with open(log, "w", encoding="utf-8") as out:
+        return subprocess.Popen(cmd, cwd=root, env=env, stdin=subprocess.DEVNULL,
+                                stdout=out, stderr=subprocess.STDOUT, **kwargs)
+
+def _run_gradle(root: Path, mode: str, fingerprint: dict) -> bool:
+    flag = "--refresh-dependencies" if mode == "full" else "--offline"
+    if mode == "sync":
+        print("ℹ️  Only the project structure changed; syncing offline.")
 
     # Detect OS and use correct syntax
     if platform.system() == "Windows":
-        gradle_cmd = [".\\gradlew.bat", "--refresh-dependencies"]
+        gradle_cmd = [".\\gradlew.bat", flag]
     else:
-        gradle_cmd = ["./gradlew", "--refresh-dependencies"]
+        gradle_cmd = ["./gradlew", flag]
 
+    start = time.time()
     try:
-        subprocess.run(gradle_cmd, check=True, shell=True)
+        with span("gradle " + flag, "gradle"):
+            subprocess.run(gradle_cmd, check=True, cwd=root)
+        save_fingerprint(root, fingerprint)
         print("✅ Gradle dependencies refreshed successfully.")
-    except subprocess.CalledProcessError:
+        ok = True
+    except (subprocess.CalledProcessError, OSError):
         print("❌ Failed to refresh Gradle dependencies.")
+        ok = False
+
+    _state_path(root, "refresh.status.json").write_text(json.dumps({
+        "mode": mode, "ok": ok, "finished": time.time(), "seconds": round(time.time() - start, 2)
+    }), encoding="utf-8")
+    return ok
+
+def run_refresh_job(root: Path, force: bool = False):
+    """Foreground refresh under the workspace lock, re-run once per batch of pending requests."""
+    lock = _acquire_lock(root)
+    if lock is None:
+        _request_pending(root, force)
+        # The holder may have checked for requests just before ours landed
+        lock = _acquire_lock(root)
+        if lock is None:
+            print("⏳ Another refresh is running in this workspace; request queued for it.")
+            return
+        force = (_take_pending(root) or {}).get("force", force)
+
+    while lock is not None:
+        try:
+            while True:
+                mode, fingerprint = plan_refresh(root, force)
+                if mode == "skip":
+                    print("✅ Gradle inputs unchanged since last refresh, nothing to do. (Use '--force' to refresh anyway.)")
+                else:
+                    _run_gradle(root, mode, fingerprint)
+                pending = _take_pending(root)
+                if pending is None:
+                    break
+                print("🔁 Changes requested during the refresh, running again...")
+                force = pending.get("force", False)
+        finally:
+            _release_lock(root, lock)
+
+        # A request queued between the last check and the release: take it
+        # (unless another worker got the lock first, then it is theirs)
+        if not _state_path(root, "refresh.pending").exists():
+            break
+        lock = _acquire_lock(root)
+        if lock is not None:
+            pending = _take_pending(root)
+            if pending is None:
+                _release_lock(root, lock)
+                break
+            print("🔁 Changes requested during the refresh, running again...")
+            force = pending.get("force", False)
+
+def print_refresh_status(root: Path):
+    job = get_running_job(root)
+    last = _read_json(_state_path(root, "refresh.status.json"))
+    if job:
+        print(f"⏳ Refresh running (pid {job['pid']}, {time.time() - job['started']:.0f}s elapsed)")
+    else:
+        print("💤 No refresh running.")
+    if last:
+        finished = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(last["finished"]))
+        result = "succeeded" if last["ok"] else "FAILED"
+        print(f"🕑 Last refresh ({last['mode']}) {result} at {finished} in {last['seconds']}s")
+
+    log = _state_path(root, "refresh.log")
+    if log.exists():
+        tail = log.read_text(encoding="utf-8", errors="ignore").splitlines()[-10:]
+        if tail:
+            print(f"\n📄 {log.relative_to(root)} (last lines):")
+            for line in tail:
+                print(f"   {line}")
+
+def wait_for_refresh(root: Path, poll: float = 0.5, worker: subprocess.Popen | None = None):
+    """
+    Block until no refresh job runs. A `worker` just spawned may not hold the
+    lock yet, so it is followed through its process handle first.
+    """
+    if worker is not None:
+        print(f"⏳ Waiting for refresh job (pid {worker.pid})...")
+        worker.wait()
+    job = get_running_job(root)
+    if job:
+        print(f"⏳ Waiting for refresh job (pid {job['pid']})...")
+        while get_running_job(root):
+            time.sleep(poll)
+    print_refresh_status(root)
+
+def refresh_environment(force: bool = False, background: bool = True, status: bool = False, wait: bool = False):
+    root = Path(".").resolve()
+    if status:
+        print_refresh_status(root)
+        return
+
+    print("🔄 Refreshing Gradle and Java environment...")
+
+    gradlew = Path("./gradlew")
+    if not gradlew.exists():
+        print("⚠️  gradlew not found in this directory.")
+        return
+
+    if not background:
+        run_refresh_job(root, force)
+    else:
+        worker = None
+        job = get_running_job(root)
+        if job:
+            # Coalesce: the running worker picks this request up when it finishes
+            # (a plain '--wait' only joins it)
+            if force or not wait:
+                _request_pending(root, force)
+                if get_running_job(root):
+                    print(f"⏳ A refresh is already running (pid {job['pid']}); it will include these changes.")
+                else:
+                    # It finished before seeing the request: run it
+                    worker = _spawn_worker(root, force)
+                    print(f"🚀 Gradle refresh started in background (pid {worker.pid}).")
+        elif plan_refresh(root, force)[0] == "skip":
+            print("✅ Gradle inputs unchanged since last refresh, nothing to do. (Use '--force' to refresh anyway.)")
+            return
+        else:
+            with span("spawn refresh worker", "gradle"):
+                worker = _spawn_worker(root, force)
+            print(f"🚀 Gradle refresh started in background (pid {worker.pid}).")
+            print("   Log: .evermod/refresh.log — check with 'evermod refresh --status' or join with '--wait'.")
+
+        if wait:
+            wait_for_refresh(root, worker=worker)
 
     print("\n💡 Tip: If you're using VS Code, run this after reload:")
     print("   → Press Ctrl + Shift + P → 'Java: Clean the Java language server workspace'")
@@ -0,0 +1,67 @@
+import hashlib, threading
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from evermod.utils.state import StateStore, get_state
+from evermod.utils.tracing import span, count, add_bytes
+
+CHUNK_SIZE = 64 * 1024
+DEFAULT_JOBS = 4
+
+def sha256_file(path: Path) -> str:
+    """Hash a file in chunks without loading it into memory."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(CHUNK_SIZE), b""):
+            digest.update(chunk)
+        add_bytes("hashed", f.tell())
+    return digest.hexdigest()
+
+class HashCache:
+    """
+    SHA-256 of files keyed by (path, size, mtime), kept in the state store
+    (file_hashes table), so unchanged files are never rehashed.
+    New digests are buffered and written in one transaction by save().
+    """
+
+    def __init__(self, store: StateStore | None = None):
+        self.store = store or get_state()
+        self._lock = threading.Lock()
+        self._pending: dict[str, tuple[int, int, str]] = {}
+
+    def sha256(self, path: Path) -> tuple[str, bool]:
+        """Return (digest, cached) for `path`."""
+        key = str(path.resolve())
+        stat = path.stat()
+        entry = self.store.file_hash(key)
+        if entry and entry[0] == stat.st_size and entry[1] == stat.st_mtime_ns:
+            count("hash cache hits")
+            return entry[2], True
+
+        digest = sha256_file(path)
+        with self._lock:
+            self._pending[key] = (stat.st_size, stat.st_mtime_ns, digest)
+        return digest, False
+
+    def save(self):
+        with self._lock:
+            pending, self._pending = self._pending, {}
+        if pending:
+            self.store.set_file_hashes(pending)
+
+def hash_files(paths: list[Path], cache: HashCache | None = None, jobs: int = DEFAULT_JOBS) -> dict[Path, tuple[str, bool]]:
+    """
+    Hash `paths` concurrently (hashlib releases the GIL on large buffers).
+    Returns {path: (digest, cached)}; missing files are left out.
+    """
+    def one(path: Path):
+        try:
+            return path, cache.sha256(path) if cache else (sha256_file(path), False)
+        except FileNotFoundError:
+            return path, None
+
+    with span("hash files", "hash", files=len(paths), jobs=jobs):
+        with ThreadPoolExecutor(max_workers=max(1, jobs)) as pool:
+            results = {path: result for path, result in pool.map(one, paths) if result}
+    if cache:
+        cache.save()
+    return results
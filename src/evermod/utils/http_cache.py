@@ -0,0 +1,82 @@
+import json, os, time, urllib.request, urllib.error
+from evermod.utils.state import get_state
+from evermod.utils.tracing import span, count, add_bytes
+
+# ====================================================
+# 🌐 EverMod HTTP Cache
+# Keeps small remote documents (manifests) in the
+# state store (manifests table) together with their
+# ETag / Last-Modified validators, so repeated checks
+# are free within the TTL and cost a 304 afterwards.
+# ====================================================
+
+DEFAULT_TTL = 3600  # seconds
+TTL_ENV_VAR = "EVERMOD_MANIFEST_TTL"
+
+def get_default_ttl() -> int:
+    """TTL in seconds, overridable through EVERMOD_MANIFEST_TTL."""
+    try:
+        return int(os.environ.get(TTL_ENV_VAR, DEFAULT_TTL))
+    except ValueError:
+        return DEFAULT_TTL
+
+def read_cached(url: str, name: str) -> bytes | None:
+    """Return the last stored body for `url` without any network access."""
+    entry = get_state().manifest(name)
+    if entry and entry["url"] == url:
+        return entry["body"]
+    return None
+
+def fetch_cached(url: str, name: str, ttl: int | None = None, force: bool = False,
+                 allow_stale: bool = False, timeout: float = 10) -> bytes:
+    """
+    Fetch `url` through the local HTTP cache and return the response body.
+
+    - Within `ttl` seconds of the last validation, the cached body is returned
+      without any network round-trip.
+    - After that, a conditional GET (If-None-Match / If-Modified-Since) is sent;
+      a 304 answer only refreshes the timestamp.
+    - `force` skips the TTL check (the request is still conditional).
+    - `allow_stale` returns the cached body when the network is unavailable.
+    """
+    ttl = get_default_ttl() if ttl is None else ttl
+    state = get_state()
+    entry = state.manifest(name)
+    cached = entry is not None and entry["url"] == url
+
+    if cached and not force and time.time() - entry["fetched_at"] < ttl:
+        count("http cache hits")
+        return entry["body"]
+
+    request = urllib.request.Request(url)
+    if cached:
+        if entry["etag"]:
+            request.add_header("If-None-Match", entry["etag"])
+        if entry["last_modified"]:
+            request.add_header("If-Modified-Since", entry["last_modified"])
+
+    try:
+        with span("GET " + name, "network", url=url, conditional=cached) as request_span:
+            with urllib.request.urlopen(request, timeout=timeout) as response:
+                body = response.read()
+                headers = response.headers
+            request_span.set(status=response.status, bytes=len(body))
+        add_bytes("downloaded", len(body))
+    except urllib.error.HTTPError as e:
+        if e.code == 304 and cached:
+            state.touch_manifest(name)
+            return entry["body"]
+        if allow_stale and cached:
+            return entry["body"]
+        raise
+    except Exception:
+        if allow_stale and cached:
+            return entry["body"]
+        raise
+
+    state.set_manifest(name, url, body, headers.get("ETag"), headers.get("Last-Modified"))
+    return body
+
+def fetch_json_cached(url: str, name: str, **kwargs) -> dict:
+    """Same as fetch_cached() but decodes the body as JSON."""
+    return json.loads(fetch_cached(url, name, **kwargs).decode("utf-8"))
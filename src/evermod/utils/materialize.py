@@ -0,0 +1,113 @@
+import os, platform, shutil, threading
+from pathlib import Path
+from evermod.utils.formatting import format_size
+
+# ====================================================
+# 🔗 EverMod Materializer
+# Places static files (template store, extracted
+# modules) into new mods as reflinks (copy-on-write
+# clones) or hardlinks when the filesystem allows it,
+# falling back to plain copies otherwise.
+#   copy     → always copy (default)
+#   auto     → reflink, else copy
+#   hardlink → hardlink, else reflink, else copy
+# Hardlinks share the inode with the store, so files
+# meant to be edited in the mod are never hardlinked.
+# ====================================================
+
+MODES = ("copy", "auto", "hardlink")
+MODE_ENV_VAR = "EVERMOD_LINK_MODE"
+FICLONE = 0x40049409  # _IOW(0x94, 9, int), Linux
+
+# (method, source device, target device) pairs known not to work
+_unsupported: set[tuple[str, int, int]] = set()
+_unsupported_lock = threading.Lock()
+
+def get_default_mode() -> str:
+    """Materialization mode from EVERMOD_LINK_MODE, 'copy' if unset or invalid."""
+    mode = os.environ.get(MODE_ENV_VAR, "copy").strip().lower()
+    return mode if mode in MODES else "copy"
+
+def _reflink(src: Path, dst: Path):
+    system = platform.system()
+    if system == "Linux":
+        import fcntl
+        with open(src, "rb") as s, open(dst, "wb") as d:
+            try:
+                fcntl.ioctl(d.fileno(), FICLONE, s.fileno())
+            except OSError:
+                d.close()
+                dst.unlink(missing_ok=True)
+                raise
+        shutil.copystat(src, dst)
+    elif system == "Darwin":
+        import ctypes, ctypes.util
+        libc = ctypes.CDLL(ctypes.util.find_library("c"), use_errno=True)
+        if libc.clonefile(os.fsencode(src), os.fsencode(dst), 0) != 0:
+            errno = ctypes.get_errno()
+            raise OSError(errno, os.strerror(errno), str(dst))
+    else:
+        raise OSError(f"reflinks are not supported on {system}")
+
+def _hardlink(src: Path, dst: Path):
+    os.link(src, dst)
+
+_METHODS = {"reflink": _reflink, "hardlink": _hardlink}
+
+class Materializer:
+    """Materializes files for one mod and keeps its stats."""
+
+    def __init__(self, mode: str = "copy"):
+        if mode not in MODES:
+            raise ValueError(f"unknown materialization mode '{mode}' (expected one of {', '.join(MODES)})")
+        self.mode = mode
+        self.stats = {"files": 0, "reflink": 0, "hardlink": 0, "copy": 0, "bytes_saved": 0}
+        self._lock = threading.Lock()
+
+    def _methods(self, editable: bool) -> list[str]:
+        if self.mode == "copy":
+            return []
+        if self.mode == "hardlink" and not editable:
+            return ["hardlink", "reflink"]
+        return ["reflink"]
+
+    def file(self, src: Path, dst: Path, editable: bool = False) -> str:
+        """Place `src` at `dst`; returns the method used ('reflink', 'hardlink' or 'copy')."""
+        used = "copy"
+        if self._methods(editable):
+            devices = (src.stat().st_dev, dst.parent.stat().st_dev)
+            for method in self._methods(editable):
+                key = (method, *devices)
+                if key in _unsupported:
+                    continue
+                try:
+                    _METHODS[method](src, dst)
+                    used = method
+                    break
+                except OSError:
+                    with _unsupported_lock:
+                        _unsupported.add(key)
+        if used == "copy":
+            shutil.copy2(src, dst)
+
+        with self._lock:
+            self.stats["files"] += 1
+            self.stats[used] += 1
+            if used != "copy":
+                self.stats["bytes_saved"] += src.stat().st_size
+        return used
+
+    def tree(self, src_dir: Path, dst_dir: Path, editable: bool = False):
+        """Materialize every file under `src_dir` into `dst_dir`, keeping the layout."""
+        for current, _, files in os.walk(src_dir):
+            target = dst_dir / Path(current).relative_to(src_dir)
+            target.mkdir(parents=True, exist_ok=True)
+            for name in files:
+                dst = target / name
+                if dst.exists():
+                    dst.unlink()
+                self.file(Path(current) / name, dst, editable)
+
+    def summary(self) -> str:
+        methods = ", ".join(f"{self.stats[m]} {m}" for m in ("reflink", "hardlink", "copy") if self.stats[m])
+        return f"{self.stats['files']} files ({methods or 'none'}), {format_size(self.stats['bytes_saved'])} saved"
@@ -0,0 +1,117 @@
+import os, shutil, threading
+from pathlib import Path
+from evermod.utils.paths import get_cache_dir, ensure_dir
+from evermod.utils.hashing import sha256_file
+from evermod.utils.state import StateStore, get_state
+
+# ====================================================
+# 💾 EverMod Module Cache
+# Content-addressed store for downloaded module zips:
+#   ~/.evermod/cache/modules/<sha256>.zip
+#   ~/.evermod/cache/modules/trees/<sha256>/ (extracted,
+#   only kept for linked materialization)
+# The state store (cache_entries) remembers size/mtime
+# of every object so unchanged files are never
+# rehashed, and last-use times drive the LRU eviction.
+# ====================================================
+
+DEFAULT_MAX_MB = 512
+MAX_MB_ENV_VAR = "EVERMOD_CACHE_MAX_MB"
+
+def get_max_bytes() -> int:
+    """Size cap of the module cache, overridable through EVERMOD_CACHE_MAX_MB."""
+    try:
+        return int(os.environ.get(MAX_MB_ENV_VAR, DEFAULT_MAX_MB)) * 1024 * 1024
+    except ValueError:
+        return DEFAULT_MAX_MB * 1024 * 1024
+
+class ModuleCache:
+    """Module zips keyed by SHA-256, indexed in the state store (cache_entries)."""
+
+    def __init__(self, root: Path | None = None, max_bytes: int | None = None, store: StateStore | None = None):
+        self.root = ensure_dir(root or get_cache_dir() / "modules")
+        self.max_bytes = get_max_bytes() if max_bytes is None else max_bytes
+        self.store = store or get_state()
+        self._lock = threading.Lock()
+
+    def object_path(self, sha256: str) -> Path:
+        return self.root / f"{sha256}.zip"
+
+    def tree_path(self, sha256: str) -> Path:
+        return self.root / "trees" / sha256
+
+    # --- lookups ---
+
+    def get(self, sha256: str, rehash: bool = False) -> Path | None:
+        """
+        Return the cached object for `sha256`, or None.
+        Files whose size and mtime still match the index are trusted without
+        rehashing (unless `rehash`); anything else is hashed once and dropped
+        if corrupted.
+        """
+        path = self.object_path(sha256)
+        with self._lock:
+            entry = self.store.cache_entry(sha256)
+            if not path.exists():
+                if entry is not None:
+                    self.store.remove_cache_entry(sha256)
+                return None
+
+            stat = path.stat()
+            if not rehash and entry and entry["size"] == stat.st_size and entry["mtime_ns"] == stat.st_mtime_ns:
+                self.store.touch_cache_entry(sha256)
+                return path
+
+        # Hashed without the lock, so concurrent lookups (cache warm -j N) run in parallel
+        try:
+            intact = sha256_file(path) == sha256
+        except OSError:
+            intact = False  # evicted meanwhile
+
+        with self._lock:
+            if not intact:
+                path.unlink(missing_ok=True)
+                self.store.remove_cache_entry(sha256)
+                return None
+            try:
+                current = path.stat()
+            except OSError:
+                self.store.remove_cache_entry(sha256)
+                return None
+            if (current.st_size, current.st_mtime_ns) == (stat.st_size, stat.st_mtime_ns):
+                # Only record what was hashed; a file rewritten meanwhile is checked next time
+                entry = self.store.cache_entry(sha256)
+                name = entry["name"] if entry else path.name
+                self.store.set_cache_entry(sha256, name, stat.st_size, stat.st_mtime_ns)
+            return path
+
+    def add(self, sha256: str, name: str) -> Path:
+        """
+        Register an object already written to object_path(sha256) (the caller
+        verified its hash) and evict least recently used entries over the cap.
+        """
+        path = self.object_path(sha256)
+        stat = path.stat()
+        with self._lock:
+            self.store.set_cache_entry(sha256, name, stat.st_size, stat.st_mtime_ns)
+            self._evict(keep=sha256)
+        return path
+
+    def total_size(self) -> int:
+        return self.store.cache_size()
+
+    # --- eviction ---
+
+    def _evict(self, keep: str | None = None):
+        total = self.store.cache_size()
+        if total <= self.max_bytes:
+            return
+        for entry in self.store.cache_entries_by_age():
+            if total <= self.max_bytes:
+                break
+            if entry["sha256"] == keep:
+                continue
+            self.object_path(entry["sha256"]).unlink(missing_ok=True)
+            shutil.rmtree(self.tree_path(entry["sha256"]), ignore_errors=True)
+            self.store.remove_cache_entry(entry["sha256"])
+            total -= entry["size"]
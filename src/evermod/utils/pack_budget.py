@@ -0,0 +1,90 @@
+import math
+from fnmatch import fnmatch
+from pathlib import Path
+
+# ====================================================
+# ✂️ EverMod Pack Budget
+# Picks the files worth packing when the pack must
+# fit a token budget:
+#   tier   → importance of the file kind: entry point,
+#            build files, sources, configs, docs, then
+#            resources; user globs multiply it
+#   select → tiers are filled in order; inside a tier
+#            files go greedily by value per token
+#            (recently modified files get a boost),
+#            O(n log n)
+# ====================================================
+
+ENTRY_FILES = {"MainMod.java"}
+BUILD_FILES = {"build.gradle", "build.gradle.kts", "settings.gradle", "settings.gradle.kts", "gradle.properties",
+               "mods.toml", "neoforge.mods.toml", "fabric.mod.json", "pack.mcmeta", "pyproject.toml"}
+SOURCE_EXTENSIONS = {".java", ".kt", ".kts", ".groovy", ".scala", ".py", ".js", ".ts"}
+CONFIG_EXTENSIONS = {".toml", ".properties", ".cfg", ".ini", ".yml", ".yaml"}
+DOC_EXTENSIONS = {".md", ".txt", ".rst"}
+RESOURCE_FOLDERS = {"resources", "assets", "data"}
+
+KIND_SCORES = {"entry": 5.0, "build": 4.0, "source": 3.0, "config": 2.0, "doc": 1.5, "resource": 1.0, "other": 1.0}
+RECENCY_BOOST = 0.5  # inside a tier, the newest file is worth 1.5x, the oldest 1x
+
+def file_kind(path: Path) -> str:
+    if path.name in ENTRY_FILES:
+        return "entry"
+    if path.name in BUILD_FILES:
+        return "build"
+    if RESOURCE_FOLDERS & set(path.parts[:-1]):
+        return "resource"
+    suffix = path.suffix.lower()
+    if suffix in SOURCE_EXTENSIONS:
+        return "source"
+    if suffix in CONFIG_EXTENSIONS:
+        return "config"
+    if suffix in DOC_EXTENSIONS:
+        return "doc"
+    return "other"
+
+def glob_weight(path: Path, weights: dict[str, float]) -> float:
+    """Product of the weights of every matching glob (1 when none match)."""
+    weight, rel = 1.0, path.as_posix()
+    for pattern, value in weights.items():
+        if fnmatch(rel, pattern) or fnmatch(path.name, pattern):
+            weight *= value
+    return weight
+
+def select_within_budget(items: list[tuple[Path, float, int, float]], budget: int) -> tuple[set[Path], int]:
+    """
+    items are (path, mtime, cost in tokens, user weight). Returns the paths to keep
+    and their total cost, never above `budget`.
+
+    Files are taken by importance (kind score × user weight) first, so 300 tiny
+    JSON models never push out MainMod.java or build.gradle. Within one
+    importance, value = recency × log2(2 + cost) per token: a bigger file carries
+    more, with diminishing returns, so many small files beat one huge file.
+    """
+    if not items:
+        return set(), 0
+
+    # Recency as an mtime percentile (share of strictly older files): robust to one
+    # very old or very new file, and equal mtimes (a fresh clone) rank the same
+    by_age = sorted(range(len(items)), key=lambda i: items[i][1])
+    recency = [0.0] * len(items)
+    older = 0
+    for rank, i in enumerate(by_age):
+        if rank and items[i][1] != items[by_age[rank - 1]][1]:
+            older = rank
+        recency[i] = older / (len(items) - 1) if len(items) > 1 else 0.0
+
+    candidates = []
+    for i, (path, _, cost, weight) in enumerate(items):
+        importance = KIND_SCORES[file_kind(path)] * weight
+        if importance <= 0 or cost > budget:
+            continue
+        value = (1 + RECENCY_BOOST * recency[i]) * math.log2(2 + cost)
+        candidates.append((importance, value / max(cost, 1), cost, path))
+
+    candidates.sort(key=lambda c: (-c[0], -c[1], c[3]))
+    keep, used = set(), 0
+    for _, _, cost, path in candidates:
+        if used + cost <= budget:
+            keep.add(path)
+            used += cost
+    return keep, used
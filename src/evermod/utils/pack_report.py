@@ -0,0 +1,96 @@
+import heapq, json
+from pathlib import Path
+
+# ====================================================
+# 📊 EverMod Pack Report
+# Where the tokens and bytes of a pack go, built
+# while the files stream by:
+#   - per-directory totals (files, tokens, bytes),
+#     each file counted in all of its parent folders
+#   - the N largest files by tokens and by bytes,
+#     kept in bounded min-heaps
+# Memory grows with the number of folders, never
+# with the number of files.
+# ====================================================
+
+class PackReport:
+    """Streaming cost report: feed every packed file to add(), then read the totals."""
+
+    def __init__(self, top: int = 10):
+        self.top = top
+        self.files = self.tokens = self.bytes = 0
+        self.binary_files = self.binary_bytes = 0
+        self.dirs: dict[str, list[int]] = {}  # folder → [files, tokens, bytes], subtree totals
+        self._by_tokens: list[tuple[int, str]] = []
+        self._by_bytes: list[tuple[int, str]] = []
+
+    @staticmethod
+    def _push(heap: list, top: int, item: tuple):
+        if len(heap) < top:
+            heapq.heappush(heap, item)
+        elif item > heap[0]:
+            heapq.heapreplace(heap, item)
+
+    def add(self, path: Path, size: int, tokens: int, binary: bool = False):
+        self.files += 1
+        self.tokens += tokens
+        self.bytes += size
+        if binary:
+            self.binary_files += 1
+            self.binary_bytes += size
+        for parent in path.parents:
+            totals = self.dirs.setdefault(parent.as_posix(), [0, 0, 0])
+            totals[0] += 1
+            totals[1] += tokens
+            totals[2] += size
+        name = path.as_posix()
+        if tokens:
+            self._push(self._by_tokens, self.top, (tokens, name))
+        self._push(self._by_bytes, self.top, (size, name))
+
+    def largest_by_tokens(self) -> list[tuple[int, str]]:
+        return sorted(self._by_tokens, reverse=True)
+
+    def largest_by_bytes(self) -> list[tuple[int, str]]:
+        return sorted(self._by_bytes, reverse=True)
+
+    def breakdown(self) -> tuple[str, list[tuple[str, list[int]]]]:
+        """
+        (folder, [(child, totals)]) for the first folder where the tokens split:
+        single-child chains like src/main/java/com/example are skipped. The
+        folder's own files are reported as "." when they hold any tokens.
+        """
+        children: dict[str, list[str]] = {}
+        for folder in self.dirs:
+            if folder != ".":
+                children.setdefault(Path(folder).parent.as_posix(), []).append(folder)
+
+        node = "."
+        while True:
+            kids = children.get(node, [])
+            if len(kids) != 1 or self.dirs[kids[0]][1] != self.dirs[node][1] or self.dirs[kids[0]][1] == 0:
+                break
+            node = kids[0]
+
+        rows = [(kid, self.dirs[kid]) for kid in children.get(node, [])]
+        own = [a - sum(totals[i] for _, totals in rows) for i, a in enumerate(self.dirs.get(node, [0, 0, 0]))]
+        if own[0]:
+            rows.append((".", own))
+        rows.sort(key=lambda row: (-row[1][1], -row[1][2], row[0]))
+        return node, rows
+
+    def to_dict(self) -> dict:
+        return {
+            "files": self.files,
+            "tokens": self.tokens,
+            "bytes": self.bytes,
+            "binary": {"files": self.binary_files, "bytes": self.binary_bytes},
+            "largest_by_tokens": [{"path": p, "tokens": t} for t, p in self.largest_by_tokens()],
+            "largest_by_bytes": [{"path": p, "bytes": b} for b, p in self.largest_by_bytes()],
+            "directories": {folder: {"files": f, "tokens": t, "bytes": b}
+                            for folder, (f, t, b) in sorted(self.dirs.items())},
+        }
+
+    def write_json(self, path: Path) -> Path:
+        path.write_text(json.dumps(self.to_dict(), indent=2), encoding="utf-8")
+        return path
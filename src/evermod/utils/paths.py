@@ -1,6 +1,16 @@
 import sys
+from functools import lru_cache
 from pathlib import Path
 
+# The get_*() helpers only compute paths; code that writes somewhere calls
+# ensure_dir() first, so reads never create directories as a side effect.
+
+@lru_cache(maxsize=None)
+def ensure_dir(path: Path) -> Path:
+    """Create `path` (and its parents) once per process and return it."""
+    path.mkdir(parents=True, exist_ok=True)
+    return path
+
 def get_global_dir() -> Path:
     """
     Returns the global EverMod configuration directory.
@@ -8,15 +18,15 @@ def get_global_dir() -> Path:
       Windows → C:\\Users\\<user>\\.evermod
       Linux/macOS → /home/<user>/.evermod
     """
-    base = Path.home() / ".evermod"
-    base.mkdir(parents=True, exist_ok=True)
-    return base
+    return Path.home() / ".evermod"
 
 def get_templates_dir() -> Path:
     """Returns the path to the global Forge templates directory."""
-    templates = get_global_dir() / "templates"
-    templates.mkdir(parents=True, exist_ok=True)
-    return templates
+    return get_global_dir() / "templates"
+
+def get_cache_dir() -> Path:
+    """Returns the global EverMod cache directory (downloads, HTTP responses)."""
+    return get_global_dir() / "cache"
 
 def get_versions_file() -> Path:
     """Returns the versions.json file inside the global templates folder."""
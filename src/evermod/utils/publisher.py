@@ -1,6 +1,7 @@
 import subprocess
 from pathlib import Path
 import shutil, tempfile
+from evermod.utils.tracing import span, count
 
 # ====================================================
 # 📦 EverMod Publisher Utility
@@ -12,12 +13,14 @@ def run_command(cmd, cwd=None, silent=False):
     """Utility to run shell commands with optional live output."""
     if not silent:
         print(f"> {' '.join(cmd)}")
-    if silent:
-        result = subprocess.run(cmd, cwd=cwd, text=True, capture_output=True)
-        output = result.stdout.strip() if result.stdout else ""
-    else:
-        result = subprocess.run(cmd, cwd=cwd, text=True)
-        output = ""
+    count(f"{cmd[0]} calls")
+    with span(" ".join(cmd[:2]), "git" if cmd[0] == "git" else "subprocess", argv=cmd):
+        if silent:
+            result = subprocess.run(cmd, cwd=cwd, text=True, capture_output=True)
+            output = result.stdout.strip() if result.stdout else ""
+        else:
+            result = subprocess.run(cmd, cwd=cwd, text=True)
+            output = ""
     if result.returncode != 0:
         print(f"❌ Command failed: {' '.join(cmd)}")
         if result.stderr:
@@ -65,9 +68,10 @@ def publish_release(release_tag: str, source_dir: Path, repo_path: Path | None =
         return
 
     temp_dir = Path(tempfile.gettempdir()) / f"evermod_release_{release_tag}"
-    if temp_dir.exists():
-        shutil.rmtree(temp_dir)
-    shutil.copytree(source_dir, temp_dir)
+    with span("stage release folder", "io"):
+        if temp_dir.exists():
+            shutil.rmtree(temp_dir)
+        shutil.copytree(source_dir, temp_dir)
 
     ensure_releases_branch(cwd)
 
@@ -83,18 +87,19 @@ def publish_release(release_tag: str, source_dir: Path, repo_path: Path | None =
     latest_path = cwd / "releases" / "latest"
 
     # --- Copy version folder (from temp instead of original) ---
-    if release_path.exists():
-        shutil.rmtree(release_path)
-    shutil.copytree(temp_dir, release_path)
-
-    # --- Optionally update 'latest/' alias ---
-    if not prerelease:
-        if latest_path.exists():
-            shutil.rmtree(latest_path)
-        shutil.copytree(temp_dir, latest_path)
-        print(f"🔁 Updated 'latest/' → {release_tag}")
-    else:
-        print(f"⚠️  Pre-release detected ({release_tag}), skipping update of 'latest/'")
+    with span("copy release folders", "io"):
+        if release_path.exists():
+            shutil.rmtree(release_path)
+        shutil.copytree(temp_dir, release_path)
+
+        # --- Optionally update 'latest/' alias ---
+        if not prerelease:
+            if latest_path.exists():
+                shutil.rmtree(latest_path)
+            shutil.copytree(temp_dir, latest_path)
+            print(f"🔁 Updated 'latest/' → {release_tag}")
+        else:
+            print(f"⚠️  Pre-release detected ({release_tag}), skipping update of 'latest/'")
 
     # --- Commit and push changes ---
     run_command(["git", "add", "releases/"], cwd=cwd)
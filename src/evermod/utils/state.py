@@ -0,0 +1,324 @@
+import json, sqlite3, threading, time
+from functools import lru_cache
+from pathlib import Path
+from evermod.utils.paths import get_global_dir, get_versions_file, ensure_dir
+
+# ====================================================
+# 🗄️ EverMod State Store
+# One SQLite database (~/.evermod/state.db) for the
+# state that used to be spread over ad-hoc files:
+#   templates        installed version + manifest
+#   template_files   path → size, SHA-256
+#   file_hashes      path → size, mtime, SHA-256
+#   cache_entries    module zips: size, last use
+#   manifests        last fetched remote documents
+#   workspaces       known workspaces and modules
+# Files from older versions (version.json, hashes.json,
+# cache/modules/index.json, cache/http/*) are imported
+# once when the database is created.
+# ====================================================
+
+SCHEMA_VERSION = 1
+STATE_FILE = "state.db"
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS templates (
+    id INTEGER PRIMARY KEY CHECK (id = 1),
+    version TEXT NOT NULL,
+    released TEXT,
+    manifest TEXT NOT NULL,
+    versions TEXT,
+    installed_at REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS template_files (
+    path TEXT PRIMARY KEY,
+    size INTEGER NOT NULL,
+    sha256 TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS file_hashes (
+    path TEXT PRIMARY KEY,
+    size INTEGER NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    sha256 TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS cache_entries (
+    sha256 TEXT PRIMARY KEY,
+    name TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    last_used REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS cache_entries_last_used ON cache_entries (last_used);
+CREATE TABLE IF NOT EXISTS manifests (
+    name TEXT PRIMARY KEY,
+    url TEXT NOT NULL,
+    body BLOB NOT NULL,
+    etag TEXT,
+    last_modified TEXT,
+    fetched_at REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS workspaces (
+    root TEXT PRIMARY KEY,
+    name TEXT NOT NULL,
+    last_seen REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS workspace_modules (
+    root TEXT NOT NULL REFERENCES workspaces (root) ON DELETE CASCADE,
+    project TEXT NOT NULL,
+    minecraft_version TEXT,
+    forge_version TEXT,
+    PRIMARY KEY (root, project)
+);
+"""
+
+class StateStore:
+    """
+    Thin wrapper over the state database. A single connection is shared by
+    every thread of the process (guarded by a lock); other processes are
+    handled by SQLite itself (WAL journal, busy timeout).
+    """
+
+    def __init__(self, path: Path | None = None):
+        self.path = path or get_global_dir() / STATE_FILE
+        ensure_dir(self.path.parent)
+        self._lock = threading.RLock()
+        self._db = sqlite3.connect(self.path, timeout=10, check_same_thread=False, isolation_level=None)
+        self._db.row_factory = sqlite3.Row
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        self._db.execute("PRAGMA foreign_keys=ON")
+        with self._lock:
+            if self._db.execute("PRAGMA user_version").fetchone()[0] < SCHEMA_VERSION:
+                self._create()
+
+    def _create(self):
+        with self.transaction():
+            for statement in SCHEMA.split(";"):
+                if statement.strip():
+                    self._db.execute(statement)
+            self._import_legacy()
+            self._db.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+
+    def transaction(self):
+        return _Transaction(self)
+
+    def _query(self, sql: str, params=()) -> list[sqlite3.Row]:
+        with self._lock:
+            return self._db.execute(sql, params).fetchall()
+
+    def _execute(self, sql: str, params=()):
+        with self._lock:
+            self._db.execute(sql, params)
+
+    def _executemany(self, sql: str, rows):
+        with self.transaction():
+            self._db.executemany(sql, rows)
+
+    # --- templates ---
+
+    def installed_templates(self) -> dict | None:
+        """{"version", "released", "manifest", "versions", "installed_at"} of the installed templates."""
+        rows = self._query("SELECT * FROM templates WHERE id = 1")
+        if not rows:
+            return None
+        row = dict(rows[0])
+        row["manifest"] = json.loads(row["manifest"])
+        row["versions"] = json.loads(row["versions"]) if row["versions"] else None
+        return row
+
+    def set_installed_templates(self, manifest: dict, versions: dict | None, files: dict[str, tuple[int, str]]):
+        """Record a template install: its manifest, versions.json and {path: (size, sha256)}."""
+        with self.transaction():
+            self._db.execute(
+                "INSERT OR REPLACE INTO templates (id, version, released, manifest, versions, installed_at) "
+                "VALUES (1, ?, ?, ?, ?, ?)",
+                (manifest.get("version", "0.0.0"), manifest.get("released"), json.dumps(manifest),
+                 json.dumps(versions) if versions is not None else None, time.time()),
+            )
+            self._db.execute("DELETE FROM template_files")
+            self._db.executemany("INSERT INTO template_files (path, size, sha256) VALUES (?, ?, ?)",
+                                 [(path, size, sha) for path, (size, sha) in files.items()])
+
+    def template_files(self) -> dict[str, tuple[int, str]]:
+        return {row["path"]: (row["size"], row["sha256"]) for row in self._query("SELECT * FROM template_files")}
+
+    # --- file hashes ---
+
+    def file_hash(self, path: str) -> tuple[int, int, str] | None:
+        """(size, mtime_ns, sha256) last recorded for an absolute path."""
+        rows = self._query("SELECT size, mtime_ns, sha256 FROM file_hashes WHERE path = ?", (path,))
+        return tuple(rows[0]) if rows else None
+
+    def set_file_hashes(self, entries: dict[str, tuple[int, int, str]]):
+        self._executemany("INSERT OR REPLACE INTO file_hashes (path, size, mtime_ns, sha256) VALUES (?, ?, ?, ?)",
+                          [(path, *entry) for path, entry in entries.items()])
+
+    # --- module cache ---
+
+    def cache_entry(self, sha256: str) -> dict | None:
+        rows = self._query("SELECT * FROM cache_entries WHERE sha256 = ?", (sha256,))
+        return dict(rows[0]) if rows else None
+
+    def set_cache_entry(self, sha256: str, name: str, size: int, mtime_ns: int, last_used: float | None = None):
+        self._execute(
+            "INSERT OR REPLACE INTO cache_entries (sha256, name, size, mtime_ns, last_used) VALUES (?, ?, ?, ?, ?)",
+            (sha256, name, size, mtime_ns, last_used or time.time()),
+        )
+
+    def touch_cache_entry(self, sha256: str):
+        self._execute("UPDATE cache_entries SET last_used = ? WHERE sha256 = ?", (time.time(), sha256))
+
+    def remove_cache_entry(self, sha256: str):
+        self._execute("DELETE FROM cache_entries WHERE sha256 = ?", (sha256,))
+
+    def cache_entries_by_age(self) -> list[dict]:
+        """Every cache entry, least recently used first."""
+        return [dict(row) for row in self._query("SELECT * FROM cache_entries ORDER BY last_used")]
+
+    def cache_size(self) -> int:
+        return self._query("SELECT COALESCE(SUM(size), 0) FROM cache_entries")[0][0]
+
+    # --- fetched manifests ---
+
+    def manifest(self, name: str) -> dict | None:
+        """{"url", "body", "etag", "last_modified", "fetched_at"} stored under `name`."""
+        rows = self._query("SELECT * FROM manifests WHERE name = ?", (name,))
+        return dict(rows[0]) if rows else None
+
+    def set_manifest(self, name: str, url: str, body: bytes, etag: str | None, last_modified: str | None):
+        self._execute(
+            "INSERT OR REPLACE INTO manifests (name, url, body, etag, last_modified, fetched_at) VALUES (?, ?, ?, ?, ?, ?)",
+            (name, url, body, etag, last_modified, time.time()),
+        )
+
+    def touch_manifest(self, name: str):
+        self._execute("UPDATE manifests SET fetched_at = ? WHERE name = ?", (time.time(), name))
+
+    # --- workspaces ---
+
+    def record_workspace(self, root: Path, modules: dict[str, tuple[str | None, str | None]] | None = None):
+        """
+        Remember a workspace. `modules` ({project: (minecraft, forge)}) replaces the
+        known module list when given, otherwise the existing one is kept.
+        """
+        key = str(root.resolve())
+        with self.transaction():
+            self._db.execute("INSERT OR REPLACE INTO workspaces (root, name, last_seen) VALUES (?, ?, ?)",
+                             (key, root.name, time.time()))
+            if modules is not None:
+                self._db.execute("DELETE FROM workspace_modules WHERE root = ?", (key,))
+                self._db.executemany(
+                    "INSERT INTO workspace_modules (root, project, minecraft_version, forge_version) VALUES (?, ?, ?, ?)",
+                    [(key, project, mc, forge) for project, (mc, forge) in modules.items()],
+                )
+
+    def add_workspace_modules(self, root: Path, modules: dict[str, tuple[str | None, str | None]]):
+        """Register new modules of a workspace, keeping the ones already known."""
+        key = str(root.resolve())
+        with self.transaction():
+            self._db.execute("INSERT OR REPLACE INTO workspaces (root, name, last_seen) VALUES (?, ?, ?)",
+                             (key, root.name, time.time()))
+            self._db.executemany(
+                "INSERT OR REPLACE INTO workspace_modules (root, project, minecraft_version, forge_version) VALUES (?, ?, ?, ?)",
+                [(key, project, mc, forge) for project, (mc, forge) in modules.items()],
+            )
+
+    def workspaces(self) -> list[dict]:
+        """Known workspaces with their module count, most recently seen first."""
+        return [dict(row) for row in self._query(
+            "SELECT w.root, w.name, w.last_seen, COUNT(m.project) AS modules FROM workspaces w "
+            "LEFT JOIN workspace_modules m ON m.root = w.root GROUP BY w.root ORDER BY w.last_seen DESC"
+        )]
+
+    def workspace_modules(self, root: Path) -> dict[str, tuple[str | None, str | None]]:
+        rows = self._query("SELECT * FROM workspace_modules WHERE root = ? ORDER BY project", (str(root.resolve()),))
+        return {row["project"]: (row["minecraft_version"], row["forge_version"]) for row in rows}
+
+    # --- migration ---
+
+    def _import_legacy(self):
+        """Import the JSON state files written by previous versions (best effort)."""
+        global_dir = self.path.parent
+        cache_dir = global_dir / "cache"
+
+        manifest = _read_json(global_dir / "version.json")
+        if manifest:
+            versions = _read_json(global_dir / "templates" / "versions.json")
+            self._db.execute(
+                "INSERT OR REPLACE INTO templates (id, version, released, manifest, versions, installed_at) "
+                "VALUES (1, ?, ?, ?, ?, ?)",
+                (manifest.get("version", "0.0.0"), manifest.get("released"), json.dumps(manifest),
+                 json.dumps(versions) if versions else None, time.time()),
+            )
+
+        hashes = _read_json(cache_dir / "hashes.json") or {}
+        self._db.executemany(
+            "INSERT OR REPLACE INTO file_hashes (path, size, mtime_ns, sha256) VALUES (?, ?, ?, ?)",
+            [(path, e["size"], e["mtime_ns"], e["sha256"]) for path, e in hashes.items()
+             if {"size", "mtime_ns", "sha256"} <= e.keys()],
+        )
+
+        index = _read_json(cache_dir / "modules" / "index.json") or {}
+        self._db.executemany(
+            "INSERT OR REPLACE INTO cache_entries (sha256, name, size, mtime_ns, last_used) VALUES (?, ?, ?, ?, ?)",
+            [(sha, e.get("name", f"{sha}.zip"), e.get("size", 0), e.get("mtime_ns", 0), e.get("last_used", 0))
+             for sha, e in index.items()],
+        )
+
+        http_dir = cache_dir / "http"
+        for meta_path in http_dir.glob("*.meta.json") if http_dir.exists() else []:
+            meta = _read_json(meta_path)
+            body_path = meta_path.with_name(meta_path.name.removesuffix(".meta.json"))
+            if meta and meta.get("url") and body_path.exists():
+                self._db.execute(
+                    "INSERT OR REPLACE INTO manifests (name, url, body, etag, last_modified, fetched_at) VALUES (?, ?, ?, ?, ?, ?)",
+                    (body_path.name, meta["url"], body_path.read_bytes(), meta.get("etag"),
+                     meta.get("last_modified"), meta.get("fetched_at", 0)),
+                )
+
+class _Transaction:
+    """BEGIN/COMMIT under the store lock; nested uses join the outer transaction."""
+
+    def __init__(self, store: StateStore):
+        self.store = store
+
+    def __enter__(self):
+        self.store._lock.acquire()
+        self.outer = not self.store._db.in_transaction
+        if self.outer:
+            try:
+                self.store._db.execute("BEGIN IMMEDIATE")
+            except BaseException:
+                self.store._lock.release()
+                raise
+        return self.store._db
+
+    def __exit__(self, exc_type, exc, tb):
+        try:
+            if self.outer:
+                self.store._db.execute("ROLLBACK" if exc_type else "COMMIT")
+        finally:
+            self.store._lock.release()
+        return False
+
+def _read_json(path: Path):
+    try:
+        return json.loads(path.read_text(encoding="utf-8"))
+    except Exception:
+        return None
+
+@lru_cache(maxsize=1)
+def get_state() -> StateStore:
+    """Process-wide state store, opened on first use."""
+    return StateStore()
+
+def get_template_versions() -> dict | None:
+    """
+    Minecraft versions supported by the installed templates (versions.json),
+    as recorded by 'evermod update'. Templates installed by hand fall back
+    to reading the file.
+    """
+    installed = get_state().installed_templates()
+    if installed and installed["versions"] is not None:
+        return installed["versions"]
+    return _read_json(get_versions_file())
@@ -0,0 +1,161 @@
+import json, os, threading, time
+from functools import wraps
+from pathlib import Path
+from evermod.utils.formatting import format_size
+
+# ====================================================
+# ⏱️ EverMod Tracing
+# Lightweight spans, counters and byte totals that
+# any command can record. Disabled by default: every
+# call is a cheap no-op until enable() is called by
+# the global '--profile' flag. The result is written
+# as a Chrome trace (chrome://tracing, Perfetto) plus
+# a short text summary.
+# ====================================================
+
+_lock = threading.Lock()
+_enabled = False
+_origin_ns = 0
+_events: list[dict] = []
+_counters: dict[str, float] = {}
+_bytes: dict[str, int] = {}
+_threads: dict[int, str] = {}
+
+def _now_us() -> float:
+    return (time.perf_counter_ns() - _origin_ns) / 1000
+
+def enable():
+    """Start recording; timestamps are relative to this call."""
+    global _enabled, _origin_ns
+    with _lock:
+        _enabled = True
+        _origin_ns = time.perf_counter_ns()
+        _events.clear()
+        _counters.clear()
+        _bytes.clear()
+        _threads.clear()
+
+def is_enabled() -> bool:
+    return _enabled
+
+class _NullSpan:
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def set(self, **args):
+        pass
+
+_NULL_SPAN = _NullSpan()
+
+class _Span:
+    def __init__(self, name: str, cat: str, args: dict):
+        self.name, self.cat, self.args = name, cat, args
+
+    def set(self, **args):
+        """Attach extra arguments (sizes, counts...) once they are known."""
+        self.args.update(args)
+
+    def __enter__(self):
+        self.start = _now_us()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        end = _now_us()
+        thread = threading.current_thread()
+        if exc_type is not None:
+            self.args["error"] = exc_type.__name__
+        event = {"name": self.name, "cat": self.cat, "ph": "X", "ts": self.start, "dur": end - self.start,
+                 "pid": os.getpid(), "tid": thread.ident}
+        if self.args:
+            event["args"] = self.args
+        with _lock:
+            _events.append(event)
+            _threads.setdefault(thread.ident, thread.name)
+        return False
+
+def span(name: str, cat: str = "evermod", **args):
+    """Context manager timing a block: `with span("zip", "release", module=v): ...`."""
+    if not _enabled:
+        return _NULL_SPAN
+    return _Span(name, cat, args)
+
+def traced(name: str | None = None, cat: str = "evermod"):
+    """Decorator form of span(); defaults to the function's qualified name."""
+    def decorate(func):
+        label = name or func.__qualname__
+
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            if not _enabled:
+                return func(*args, **kwargs)
+            with _Span(label, cat, {}):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorate
+
+def count(name: str, value: float = 1):
+    """Add `value` to a named counter (files walked, cache hits, git calls...)."""
+    if not _enabled:
+        return
+    with _lock:
+        total = _counters[name] = _counters.get(name, 0) + value
+        _events.append({"name": name, "cat": "counter", "ph": "C", "ts": _now_us(),
+                        "pid": os.getpid(), "args": {"value": total}})
+
+def add_bytes(name: str, size: int):
+    """Add `size` bytes to a named byte total (downloaded, written, compressed...)."""
+    if not _enabled or not size:
+        return
+    with _lock:
+        total = _bytes[name] = _bytes.get(name, 0) + size
+        _events.append({"name": f"{name} (bytes)", "cat": "bytes", "ph": "C", "ts": _now_us(),
+                        "pid": os.getpid(), "args": {"bytes": total}})
+
+# ─────────────────────────────────────────────
+# 📄 Output
+# ─────────────────────────────────────────────
+
+def write_trace(path: Path) -> Path:
+    """Write the recorded events as Chrome trace JSON (Trace Event Format)."""
+    with _lock:
+        events = list(_events)
+        threads = dict(_threads)
+    pid = os.getpid()
+    meta = [{"name": "process_name", "ph": "M", "pid": pid, "args": {"name": "evermod"}}]
+    meta += [{"name": "thread_name", "ph": "M", "pid": pid, "tid": tid, "args": {"name": name}}
+             for tid, name in threads.items()]
+    path.write_text(json.dumps({
+        "traceEvents": meta + events,
+        "displayTimeUnit": "ms",
+        "otherData": {"counters": _counters, "bytes": _bytes},
+    }), encoding="utf-8")
+    return path
+
+def summarize(top: int = 12) -> list[str]:
+    """Text summary: wall time, slowest spans by total time, counters and byte totals."""
+    with _lock:
+        spans = [e for e in _events if e["ph"] == "X"]
+        counters, totals = dict(_counters), dict(_bytes)
+
+    by_name: dict[str, list[float]] = {}
+    for event in spans:
+        stats = by_name.setdefault(event["name"], [0, 0.0, 0.0])
+        stats[0] += 1
+        stats[1] += event["dur"]
+        stats[2] = max(stats[2], event["dur"])
+
+    wall = max((e["ts"] + e["dur"] for e in spans), default=0.0)
+    lines = [f"⏱️  Profile: {wall / 1000:.1f} ms wall, {len(spans)} spans on {len(_threads)} thread(s)"]
+    if by_name:
+        width = min(40, max(len(name) for name in by_name))
+        lines.append(f"   {'span':<{width}} {'calls':>6} {'total ms':>10} {'max ms':>9}")
+        for name, (calls, total, longest) in sorted(by_name.items(), key=lambda item: -item[1][1])[:top]:
+            lines.append(f"   {name[:width]:<{width}} {calls:>6} {total / 1000:>10.1f} {longest / 1000:>9.1f}")
+    if counters:
+        lines.append("   counters: " + ", ".join(f"{k}={v:g}" for k, v in sorted(counters.items())))
+    if totals:
+        lines.append("   bytes:    " + ", ".join(f"{k}={format_size(v)}" for k, v in sorted(totals.items())))
+    return lines
@@ -0,0 +1,164 @@
+import ctypes, ctypes.util, os, platform, select, struct, time
+from pathlib import Path
+
+# ====================================================
+# 👀 EverMod File Watcher
+# Reports changed paths under a folder:
+#   InotifyWatcher → Linux inotify through ctypes
+#                    (one watch per directory)
+#   PollingWatcher → periodic stat snapshot, anywhere
+# wait() returns the changed paths, an empty set on
+# timeout, or None when the watcher lost track (queue
+# overflow) and the caller must rescan everything.
+# ====================================================
+
+IN_MODIFY = 0x00000002
+IN_ATTRIB = 0x00000004
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_DELETE_SELF = 0x00000400
+IN_Q_OVERFLOW = 0x00004000
+IN_IGNORED = 0x00008000
+IN_ONLYDIR = 0x01000000
+IN_ISDIR = 0x40000000
+IN_NONBLOCK = 0o4000
+IN_CLOEXEC = 0o2000000
+
+WATCH_MASK = IN_MODIFY | IN_ATTRIB | IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO | IN_CREATE | IN_DELETE | IN_DELETE_SELF
+EVENT_HEADER = struct.Struct("iIII")  # wd, mask, cookie, len
+POLL_INTERVAL = 0.5  # seconds
+
+class InotifyWatcher:
+    """
+    Recursive inotify watcher. `skip_dir(path)` prunes folders that should not
+    be watched (excluded from the pack); new folders are watched as they appear.
+    """
+
+    def __init__(self, root: Path, skip_dir=lambda path: False):
+        self.root = root
+        self.skip_dir = skip_dir
+        self._libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+        self._fd = self._libc.inotify_init1(IN_NONBLOCK | IN_CLOEXEC)
+        if self._fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        self._dirs: dict[int, Path] = {}
+        self._watch_tree(root)
+
+    def _watch(self, directory: Path) -> bool:
+        wd = self._libc.inotify_add_watch(self._fd, os.fsencode(directory), WATCH_MASK | IN_ONLYDIR)
+        if wd < 0:
+            return False  # vanished meanwhile, or out of watches (fs.inotify.max_user_watches)
+        self._dirs[wd] = directory
+        return True
+
+    def _watch_tree(self, top: Path) -> set[Path]:
+        """Watch `top` and its folders; returns the files already inside (they are new to the caller)."""
+        found = set()
+        for current, dirs, files in os.walk(top):
+            current_path = Path(current)
+            dirs[:] = [d for d in dirs if not self.skip_dir(current_path / d)]
+            if not self._watch(current_path) and current_path == self.root:
+                raise OSError(ctypes.get_errno(), f"cannot watch {current_path}")
+            found.update(current_path / name for name in files)
+        return found
+
+    def wait(self, timeout: float | None) -> set[Path] | None:
+        ready, _, _ = select.select([self._fd], [], [], timeout)
+        if not ready:
+            return set()
+        changed = set()
+        try:
+            data = os.read(self._fd, 64 * 1024)
+        except BlockingIOError:
+            return changed
+        offset = 0
+        while offset < len(data):
+            wd, mask, _, length = EVENT_HEADER.unpack_from(data, offset)
+            name = data[offset + EVENT_HEADER.size: offset + EVENT_HEADER.size + length].rstrip(b"\0")
+            offset += EVENT_HEADER.size + length
+            if mask & IN_Q_OVERFLOW:
+                return None
+            directory = self._dirs.get(wd)
+            if directory is None:
+                continue
+            if mask & IN_IGNORED:
+                self._dirs.pop(wd, None)
+                continue
+            if not name:
+                continue  # event on the watched folder itself
+            path = directory / os.fsdecode(name)
+            if mask & IN_ISDIR:
+                if mask & (IN_CREATE | IN_MOVED_TO) and not self.skip_dir(path):
+                    changed |= self._watch_tree(path)
+                elif mask & (IN_DELETE | IN_MOVED_FROM):
+                    changed.add(path)  # the caller drops everything below it
+                continue
+            changed.add(path)
+        return changed
+
+    def close(self):
+        os.close(self._fd)
+
+class PollingWatcher:
+    """Portable fallback: compares (mtime, size) snapshots of `list_files()` every POLL_INTERVAL."""
+
+    def __init__(self, root: Path, list_files, interval: float = POLL_INTERVAL):
+        self.root = root
+        self.list_files = list_files
+        self.interval = interval
+        self._snapshot = self._take()
+
+    def _take(self) -> dict[Path, tuple[int, int]]:
+        snapshot = {}
+        for path in self.list_files():
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            snapshot[path] = (stat.st_mtime_ns, stat.st_size)
+        return snapshot
+
+    def wait(self, timeout: float | None) -> set[Path] | None:
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            delay = self.interval if deadline is None else min(self.interval, max(0.0, deadline - time.monotonic()))
+            time.sleep(delay)
+            current = self._take()
+            changed = {p for p in current.keys() | self._snapshot.keys() if current.get(p) != self._snapshot.get(p)}
+            self._snapshot = current
+            if changed or (deadline is not None and time.monotonic() >= deadline):
+                return changed
+
+    def close(self):
+        pass
+
+def create_watcher(root: Path, skip_dir, list_files, poll: bool = False):
+    """inotify on Linux, polling elsewhere (or when `poll` is set or inotify is unavailable)."""
+    if not poll and platform.system() == "Linux":
+        try:
+            return InotifyWatcher(root, skip_dir)
+        except (OSError, AttributeError):
+            pass
+    return PollingWatcher(root, list_files)
+
+def collect_changes(watcher, debounce: float, max_delay: float) -> set[Path] | None:
+    """
+    Block until something changes, then keep collecting until no event arrives
+    for `debounce` seconds (or `max_delay` passed), so a burst of writes (a build,
+    a git checkout) is handled once. Returns None when a full rescan is needed.
+    """
+    changed = watcher.wait(None)
+    while changed is not None and not changed:
+        changed = watcher.wait(None)
+    start = time.monotonic()
+    while changed is not None and time.monotonic() - start < max_delay:
+        more = watcher.wait(debounce)
+        if more is None:
+            return None
+        if not more:
+            break
+        changed |= more
+    return changed
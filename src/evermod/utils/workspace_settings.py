@@ -0,0 +1,105 @@
+import os, re
+from pathlib import Path
+
+# ====================================================
+# 🧩 EverMod Workspace Settings
+# Parsed view of a workspace settings.gradle: every
+# include form (include("a:b"), include ':a:b',
+# multi-argument includes) is indexed by project path
+# so lookups are O(1) and batches of changes are
+# written back with a single atomic rewrite.
+# ====================================================
+
+_INCLUDE_RE = re.compile(r"^\s*include\b\s*\(?(?P<args>.*?)\)?\s*(?://.*)?$")
+_STRING_RE = re.compile(r"""["']([^"']+)["']""")
+
+def normalize_project(project: str) -> str:
+    """'mods:Alpha', ':mods:Alpha' and 'mods/Alpha' all refer to the same project."""
+    return project.replace("\\", ":").replace("/", ":").strip(":")
+
+def project_path_for(mod_dir: Path, root: Path) -> str:
+    """Gradle project path of a mod folder relative to the workspace root."""
+    return normalize_project(str(mod_dir.resolve().relative_to(root.resolve())))
+
+class WorkspaceSettings:
+    """Indexed include() registry of a settings.gradle file."""
+
+    def __init__(self, path: Path):
+        self.path = path
+        text = ""
+        if path.exists():
+            with open(path, encoding="utf-8", newline="") as f:  # keep \r\n to detect the style
+                text = f.read()
+        self.newline = "\r\n" if "\r\n" in text else "\n"  # written back as found (Windows checkouts)
+        self.lines = text.splitlines()
+        self._index: dict[str, int] = {}  # project → first line including it
+        self._reindex()
+        self._dirty = False
+
+    def _reindex(self):
+        self._index = {}
+        for number, line in enumerate(self.lines):
+            for project in self._parse_include(line):
+                self._index.setdefault(project, number)
+
+    @staticmethod
+    def _parse_include(line: str) -> list[str]:
+        match = _INCLUDE_RE.match(line)
+        if not match:
+            return []
+        return [normalize_project(p) for p in _STRING_RE.findall(match.group("args"))]
+
+    @property
+    def includes(self) -> list[str]:
+        """Registered projects in file order."""
+        return sorted(self._index, key=self._index.get)
+
+    def __contains__(self, project: str) -> bool:
+        return normalize_project(project) in self._index
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def add(self, projects: list[str]) -> list[str]:
+        """Register projects that are not included yet. Returns the ones added."""
+        added = []
+        for project in map(normalize_project, projects):
+            if project in self._index:
+                continue
+            if not added and self.lines and self.lines[-1].strip():
+                self.lines.append("")
+            self.lines.append(f'include("{project}")')
+            self._index[project] = len(self.lines) - 1
+            added.append(project)
+        self._dirty |= bool(added)
+        return added
+
+    def remove(self, projects: list[str]) -> list[str]:
+        """Unregister projects, rewriting multi-argument includes. Returns the ones removed."""
+        targets = {normalize_project(p) for p in projects} & self._index.keys()
+        if not targets:
+            return []
+
+        kept_lines = []
+        for line in self.lines:
+            projects = self._parse_include(line)
+            if targets.intersection(projects):
+                remaining = [p for p in projects if p not in targets]
+                if not remaining:
+                    continue
+                line = "include(" + ", ".join(f'"{p}"' for p in remaining) + ")"
+            kept_lines.append(line)
+
+        self.lines = kept_lines
+        self._reindex()
+        self._dirty = True
+        return sorted(targets)
+
+    def save(self):
+        """Write pending changes atomically (temp file + rename)."""
+        if not self._dirty:
+            return
+        tmp = self.path.with_name(self.path.name + ".tmp")
+        tmp.write_text(self.newline.join(self.lines) + self.newline, encoding="utf-8", newline="")
+        os.replace(tmp, self.path)
+        self._dirty = False
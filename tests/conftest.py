@@ -0,0 +1,35 @@
+import pytest
+
+from evermod.utils.state import get_state
+
+@pytest.fixture(autouse=True)
+def evermod_home(tmp_path, monkeypatch):
+    """Point ~/.evermod (state store, caches, keys) at a fresh folder for every test."""
+    home = tmp_path / "home"
+    home.mkdir()
+    monkeypatch.setenv("HOME", str(home))
+    monkeypatch.setenv("USERPROFILE", str(home))
+    get_state.cache_clear()
+    yield home
+    get_state.cache_clear()
+
+@pytest.fixture
+def serve(monkeypatch):
+    """Start an HTTP server on localhost for a handler class; returns its base URL."""
+    import threading
+    from http.server import ThreadingHTTPServer
+
+    for var in ("http_proxy", "HTTP_PROXY", "https_proxy", "HTTPS_PROXY", "all_proxy", "ALL_PROXY"):
+        monkeypatch.delenv(var, raising=False)
+    servers = []
+
+    def start(handler) -> str:
+        server = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        servers.append(server)
+        return f"http://127.0.0.1:{server.server_port}/"
+
+    yield start
+    for server in servers:
+        server.shutdown()
+        server.server_close()
@@ -0,0 +1,57 @@
+import subprocess
+from pathlib import Path
+
+import pytest
+
+from evermod.commands import add
+
+def git(cwd: Path, *args: str) -> str:
+    return subprocess.run(["git", *args], cwd=cwd, check=True, text=True, capture_output=True).stdout
+
+@pytest.fixture
+def workspace(tmp_path, monkeypatch):
+    """A git workspace with a settings.gradle, and bare repos for dev/alpha and dev/beta."""
+    for var, value in {"GIT_AUTHOR_NAME": "dev", "GIT_AUTHOR_EMAIL": "dev@example.com",
+                       "GIT_COMMITTER_NAME": "dev", "GIT_COMMITTER_EMAIL": "dev@example.com"}.items():
+        monkeypatch.setenv(var, value)
+
+    remotes = tmp_path / "remotes"
+    for name in ("alpha", "beta"):
+        work = tmp_path / "src" / name
+        work.mkdir(parents=True)
+        git(work, "init", "--quiet")
+        (work / "build.gradle").write_text(f"// {name}\n")
+        git(work, "add", "build.gradle")
+        git(work, "commit", "--quiet", "-m", "init")
+        git(tmp_path, "clone", "--quiet", "--bare", str(work), str(remotes / "dev" / f"{name}.git"))
+
+    ws = tmp_path / "ws"
+    ws.mkdir()
+    git(ws, "init", "--quiet")
+    (ws / "settings.gradle").write_text("rootProject.name = 'ws'\n")
+    git(ws, "add", "settings.gradle")
+    git(ws, "commit", "--quiet", "-m", "workspace")
+    monkeypatch.chdir(ws)
+    return ws, remotes
+
+def test_batch_add_registers_clones_and_rolls_back_failures(workspace):
+    ws, remotes = workspace
+    add.run(["dev/alpha", "dev/beta", "dev/missing"], target_path="mods", jobs=2, base_url=remotes.as_posix())
+
+    modules = git(ws, "config", "-f", ".gitmodules", "--get-regexp", r"submodule\..*\.(path|url)").splitlines()
+    assert sorted(modules) == [
+        "submodule.mods/alpha.path mods/alpha",
+        f"submodule.mods/alpha.url {remotes.as_posix()}/dev/alpha.git",
+        "submodule.mods/beta.path mods/beta",
+        f"submodule.mods/beta.url {remotes.as_posix()}/dev/beta.git",
+    ]
+
+    settings = (ws / "settings.gradle").read_text()
+    assert settings == "rootProject.name = 'ws'\n\ninclude(\"mods:alpha\")\ninclude(\"mods:beta\")\n"
+
+    # The failed clone leaves no folder, .gitmodules section or index entry
+    assert not (ws / "mods" / "missing").exists()
+    index = git(ws, "ls-files", "--stage").splitlines()
+    assert sorted(line.split("\t")[1] for line in index) == [".gitmodules", "mods/alpha", "mods/beta", "settings.gradle"]
+    assert all(line.startswith("160000") for line in index if line.endswith(("mods/alpha", "mods/beta")))
+    assert (ws / "mods" / "alpha" / "build.gradle").read_text() == "// alpha\n"
@@ -0,0 +1,41 @@
+import pytest
+
+from evermod.commands import cache
+from evermod.utils.file_manifest import merkle_root
+
+FILES = {"com/wipodev/evermod/EverMod.java": {"size": 10, "sha256": "a" * 64}}
+
+@pytest.fixture
+def release(monkeypatch, tmp_path):
+    """A release with one module; returns the list of files.json fetches."""
+    module_zip = tmp_path / "module.zip"
+    module_zip.write_bytes(b"zip")
+    root = merkle_root(FILES)
+    calls = []
+    monkeypatch.setattr(cache, "get_template_versions", lambda: {"1.20.1": {}})
+    monkeypatch.setattr(cache, "fetch_release_manifest", lambda force=False: {
+        "version": "1.4.0", "modules": {"1.20.1": {"sha256": "0" * 64, "files_root": root}}})
+    monkeypatch.setattr(cache, "fetch_module_zip", lambda *a, **k: (module_zip, True))
+
+    def fetch_file_manifest(tag="latest", force=False):
+        calls.append(force)
+        return {"modules": {"1.20.1": {"root": root, "files": FILES}}}
+
+    monkeypatch.setattr(cache, "fetch_file_manifest", fetch_file_manifest)
+    return calls
+
+def test_warm_fetches_the_signed_file_manifest(release, capsys):
+    cache.warm(jobs=1)
+    out = capsys.readouterr().out
+    assert release == [True]
+    assert "files.json" in out and "will not need the network" in out
+
+def test_warm_does_not_claim_offline_without_files_json(release, monkeypatch, capsys):
+    def offline(tag="latest", force=False):
+        raise OSError("network unreachable")
+
+    monkeypatch.setattr(cache, "fetch_file_manifest", offline)
+    cache.warm(jobs=1)
+    out = capsys.readouterr().out
+    assert "will not need the network" not in out
+    assert "files.json is not" in out
@@ -0,0 +1,141 @@
+import hashlib, os, zipfile
+from http.server import BaseHTTPRequestHandler
+from pathlib import Path
+
+import pytest
+
+from evermod.commands.create_helper import evermod_downloader
+from evermod.commands.create_helper.evermod_downloader import ChecksumMismatch, download_file
+from evermod.utils.file_manifest import build_entry
+from evermod.utils.materialize import Materializer
+
+VERSION = "1.20.1"
+MODULE_FILES = {
+    "com/wipodev/evermod/EverMod.java": "package com.wipodev.evermod;\nclass EverMod {}\n",
+    "com/wipodev/evermod/util/Log.java": "package com.wipodev.evermod.util;\nclass Log {}\n",
+}
+
+def write_tree(root: Path, files: dict[str, str]):
+    for rel, text in files.items():
+        (root / rel).parent.mkdir(parents=True, exist_ok=True)
+        (root / rel).write_text(text)
+
+@pytest.fixture
+def release(tmp_path, monkeypatch):
+    """A signed module release whose zip can be swapped; returns the zip path."""
+    clean = tmp_path / "clean"
+    write_tree(clean, MODULE_FILES)
+    entry = build_entry(clean, jobs=1)
+    module_zip = tmp_path / "module.zip"
+    module_info = {"sha256": "0" * 64, "files_root": entry["root"]}
+
+    monkeypatch.setattr(evermod_downloader, "resolve_module", lambda *a, **k: (module_info, module_zip, False))
+    monkeypatch.setattr(evermod_downloader, "fetch_file_manifest",
+                        lambda *a, **k: {"modules": {VERSION: entry}})
+    return module_zip
+
+def make_zip(path: Path, files: dict[str, str]):
+    with zipfile.ZipFile(path, "w") as z:
+        for rel, text in files.items():
+            z.writestr(rel, text)
+
+def files_under(root: Path) -> list[str]:
+    return sorted(p.relative_to(root).as_posix() for p in root.rglob("*") if p.is_file())
+
+def test_extracts_a_module_that_matches_files_json(release, tmp_path):
+    make_zip(release, MODULE_FILES)
+    java = tmp_path / "mod" / "src" / "main" / "java"
+    evermod_downloader.download_evermod_module(VERSION, java, quiet=True)
+    assert files_under(java) == sorted(MODULE_FILES)
+    assert files_under(java.parent) == [f"java/{p}" for p in sorted(MODULE_FILES)]  # no staging left behind
+
+@pytest.mark.parametrize("tamper", ["changed", "unlisted"])
+def test_tampered_module_never_reaches_the_mod(release, tmp_path, tamper):
+    files = dict(MODULE_FILES)
+    if tamper == "changed":
+        files["com/wipodev/evermod/EverMod.java"] += "// injected\n"
+    else:
+        files["com/wipodev/evermod/Backdoor.java"] = "class Backdoor {}\n"
+    make_zip(release, files)
+    java = tmp_path / "mod" / "src" / "main" / "java"
+    (java / "com" / "example").mkdir(parents=True)
+    (java / "com" / "example" / "MainMod.java").write_text("class MainMod {}\n")
+
+    evermod_downloader.download_evermod_module(VERSION, java, quiet=True)
+    assert files_under(java.parent) == ["java/com/example/MainMod.java"]
+
+def test_linked_module_tree_is_verified(release, tmp_path, monkeypatch):
+    tree = tmp_path / "tree"
+    write_tree(tree, {**MODULE_FILES, "com/wipodev/evermod/EverMod.java": "class Tampered {}\n"})
+    monkeypatch.setattr(evermod_downloader, "get_module_tree", lambda *a: tree)
+    java = tmp_path / "mod" / "src" / "main" / "java"
+
+    evermod_downloader.download_evermod_module(VERSION, java, quiet=True, materializer=Materializer("auto"))
+    assert not java.exists() or files_under(java) == []
+    assert not tree.exists()  # re-extracted from the verified zip next time
+
+    write_tree(tree, MODULE_FILES)
+    evermod_downloader.download_evermod_module(VERSION, java, quiet=True, materializer=Materializer("auto"))
+    assert files_under(java) == sorted(MODULE_FILES)
+
+DATA = os.urandom(300_000)
+CUT = 120_000
+
+class FlakyHandler(BaseHTTPRequestHandler):
+    """Drops the first transfer after CUT bytes; answers Range requests with 206 afterwards."""
+    requests = []
+    honor_range = True
+
+    def do_GET(self):
+        self.requests.append(dict(self.headers))
+        requested = self.headers.get("Range")
+        if requested and self.honor_range:
+            offset = int(requested.removeprefix("bytes=").rstrip("-"))
+            self.send_response(206)
+            self.send_header("Content-Range", f"bytes {offset}-{len(DATA) - 1}/{len(DATA)}")
+            self.send_header("Content-Length", str(len(DATA) - offset))
+            self.end_headers()
+            self.wfile.write(DATA[offset:])
+            return
+        self.send_response(200)
+        self.send_header("Content-Length", str(len(DATA)))
+        self.end_headers()
+        if len(self.requests) == 1:
+            self.wfile.write(DATA[:CUT])
+            self.wfile.flush()
+            self.close_connection = True
+            return
+        self.wfile.write(DATA)
+
+    def log_message(self, *args):
+        pass
+
+@pytest.fixture
+def flaky_url(serve):
+    FlakyHandler.requests = []
+    FlakyHandler.honor_range = True
+    return serve(FlakyHandler) + "module.zip"
+
+def test_interrupted_download_resumes_with_a_range_request(flaky_url, tmp_path):
+    dest = tmp_path / "module.zip"
+    download_file(flaky_url, dest, hashlib.sha256(DATA).hexdigest(), quiet=True)
+
+    assert len(FlakyHandler.requests) == 2
+    assert "Range" not in FlakyHandler.requests[0]
+    assert FlakyHandler.requests[1]["Range"] == f"bytes={CUT}-"
+    assert dest.read_bytes() == DATA
+    assert not dest.with_name("module.zip.part").exists()
+
+def test_server_ignoring_range_restarts_from_zero(flaky_url, tmp_path):
+    FlakyHandler.honor_range = False
+    dest = tmp_path / "module.zip"
+    download_file(flaky_url, dest, hashlib.sha256(DATA).hexdigest(), quiet=True)
+    assert dest.read_bytes() == DATA
+
+def test_wrong_checksum_raises_and_removes_the_part_file(flaky_url, tmp_path):
+    dest = tmp_path / "module.zip"
+    with pytest.raises(ChecksumMismatch):
+        download_file(flaky_url, dest, "0" * 64, quiet=True)
+
+    assert not dest.exists()
+    assert not dest.with_name("module.zip.part").exists()
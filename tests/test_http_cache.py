@@ -0,0 +1,49 @@
+from http.server import BaseHTTPRequestHandler
+
+import pytest
+
+from evermod.utils.http_cache import fetch_cached
+
+BODY = b'{"version": "1.4.0"}'
+ETAG = '"v1"'
+
+class ManifestHandler(BaseHTTPRequestHandler):
+    requests = []
+
+    def do_GET(self):
+        self.requests.append(dict(self.headers))
+        if self.headers.get("If-None-Match") == ETAG:
+            self.send_response(304)
+            self.end_headers()
+            return
+        self.send_response(200)
+        self.send_header("ETag", ETAG)
+        self.send_header("Content-Length", str(len(BODY)))
+        self.end_headers()
+        self.wfile.write(BODY)
+
+    def log_message(self, *args):
+        pass
+
+@pytest.fixture
+def manifest_url(serve):
+    ManifestHandler.requests = []
+    return serve(ManifestHandler) + "versions.json"
+
+def test_ttl_hit_makes_no_request(manifest_url):
+    assert fetch_cached(manifest_url, "versions.json", ttl=3600) == BODY
+    assert len(ManifestHandler.requests) == 1
+
+    assert fetch_cached(manifest_url, "versions.json", ttl=3600) == BODY
+    assert len(ManifestHandler.requests) == 1
+
+def test_expired_entry_revalidates_and_reuses_the_body_on_304(manifest_url):
+    fetch_cached(manifest_url, "versions.json", ttl=3600)
+
+    assert fetch_cached(manifest_url, "versions.json", ttl=0) == BODY
+    assert len(ManifestHandler.requests) == 2
+    assert ManifestHandler.requests[1].get("If-None-Match") == ETAG
+
+    # The 304 refreshed the timestamp: within the TTL again
+    assert fetch_cached(manifest_url, "versions.json", ttl=3600) == BODY
+    assert len(ManifestHandler.requests) == 2
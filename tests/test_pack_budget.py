@@ -0,0 +1,47 @@
+from pathlib import Path
+
+import pytest
+
+from evermod.utils.pack_budget import select_within_budget
+
+JAVA = "src/main/java/com/example/mymod"
+MODELS = "src/main/resources/assets/mymod/models/item"
+
+def mod_items() -> list:
+    """A typical mod: entry point, build files, 20 sources and 300 tiny item models."""
+    items = [
+        (Path(f"{JAVA}/MainMod.java"), 1000.0, 600, 1.0),
+        (Path("build.gradle"), 1000.0, 2500, 1.0),
+        (Path("gradle.properties"), 1000.0, 80, 1.0),
+    ]
+    items += [(Path(f"{JAVA}/item/Item{i}.java"), 1000.0 + i, 250, 1.0) for i in range(20)]
+    items += [(Path(f"{MODELS}/item{i}.json"), 2000.0, 40, 1.0) for i in range(300)]
+    return items
+
+@pytest.mark.parametrize("budget", [4000, 8000])
+def test_entry_point_and_build_files_win_over_tiny_resources(budget):
+    keep, used = select_within_budget(mod_items(), budget)
+    kept = {p.as_posix() for p in keep}
+
+    assert f"{JAVA}/MainMod.java" in kept
+    assert "build.gradle" in kept
+    assert "gradle.properties" in kept
+    assert used <= budget
+    sources = [p for p in kept if p.startswith(f"{JAVA}/item/")]
+    models = [p for p in kept if p.startswith(MODELS)]
+    # entry + build files take 3180 tokens; sources (250 each) come next, models only fill the gap
+    expected = {4000: (3, 1), 8000: (19, 1)}[budget]
+    assert (len(sources), len(models)) == expected
+
+def test_sources_before_resources_with_budget_to_spare():
+    items = [(Path(f"{JAVA}/Main{i}.java"), 0.0, 300, 1.0) for i in range(3)]
+    items += [(Path(f"{MODELS}/m{i}.json"), 0.0, 40, 1.0) for i in range(10)]
+    keep, used = select_within_budget(items, 1000)
+    assert {p.name for p in keep} == {"Main0.java", "Main1.java", "Main2.java", "m0.json", "m1.json"}
+    assert used == 980
+
+def test_zero_weight_never_packs_and_equal_mtimes_tie_on_path():
+    items = [(Path(f"src/F{i:02}.java"), 5.0, 100, 1.0) for i in reversed(range(30))]
+    items.append((Path("docs/big.md"), 9.0, 10, 0.0))
+    keep, used = select_within_budget(items, 100)
+    assert keep == {Path("src/F00.java")} and used == 100
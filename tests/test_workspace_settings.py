@@ -0,0 +1,22 @@
+from evermod.utils.workspace_settings import WorkspaceSettings
+
+def test_save_keeps_crlf_line_endings(tmp_path):
+    path = tmp_path / "settings.gradle"
+    path.write_bytes(b"rootProject.name = 'ws'\r\ninclude(\"mods:alpha\")\r\n")
+
+    settings = WorkspaceSettings(path)
+    assert settings.includes == ["mods:alpha"]
+    settings.add(["mods/beta"])
+    settings.save()
+    assert path.read_bytes() == b"rootProject.name = 'ws'\r\ninclude(\"mods:alpha\")\r\n\r\ninclude(\"mods:beta\")\r\n"
+
+def test_save_keeps_lf_line_endings(tmp_path):
+    path = tmp_path / "settings.gradle"
+    path.write_bytes(b"rootProject.name = 'ws'\n")
+
+    settings = WorkspaceSettings(path)
+    settings.add(["mods:alpha"])
+    settings.remove(["mods:alpha"])
+    settings.add(["mods:beta"])
+    settings.save()
+    assert path.read_bytes() == b"rootProject.name = 'ws'\n\ninclude(\"mods:beta\")\n"